@@ -0,0 +1,45 @@
+"""Add composite (role, created_at) index on conversation_messages
+
+The admin metrics queries (request volume, chart buckets, popular queries)
+all filter on role = 'user' AND created_at >= :time; a composite index lets
+them range-scan only the matching rows.
+
+Revision ID: 20261018_0001
+Revises: 20260222_0001
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20261018_0001'
+down_revision: Union[str, None] = '20260222_0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create ix_conversation_messages_role_created_at without locking writes"""
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_conversation_messages_role_created_at',
+            'conversation_messages',
+            ['role', 'created_at'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Drop ix_conversation_messages_role_created_at"""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_conversation_messages_role_created_at',
+            table_name='conversation_messages',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,46 @@
+"""Create mv_popular_queries_24h materialized view for the admin dashboard
+
+Holds the 100 most frequent user messages of the last 24 hours (as of the
+last refresh). Refreshed by the scheduler every POPULAR_QUERIES_REFRESH_MINUTES.
+
+Revision ID: 20261018_0002
+Revises: 20261018_0001
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20261018_0002'
+down_revision: Union[str, None] = '20261018_0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create mv_popular_queries_24h and its unique index"""
+    op.execute("""
+        CREATE MATERIALIZED VIEW IF NOT EXISTS mv_popular_queries_24h AS
+        SELECT md5(content) AS content_hash, content, COUNT(*) AS count
+        FROM conversation_messages
+        WHERE role = 'user' AND created_at >= (NOW() AT TIME ZONE 'UTC') - INTERVAL '24 hours'
+        GROUP BY content
+        ORDER BY count DESC
+        LIMIT 100
+    """)
+    # REFRESH ... CONCURRENTLY requires a unique index on plain columns;
+    # content itself is unbounded text, so index its hash instead
+    op.create_index(
+        'ux_mv_popular_queries_24h_content_hash',
+        'mv_popular_queries_24h',
+        ['content_hash'],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    """Drop mv_popular_queries_24h"""
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS mv_popular_queries_24h")
@@ -0,0 +1,61 @@
+"""Replace the request_metrics created_at index with a covering index
+
+The QoS summary aggregates total_duration_ms and completeness over a
+created_at window; carrying those columns in the index (INCLUDE) lets
+Postgres answer the percentile and completeness parts from the index.
+provider_errors is deliberately left out: it is unbounded JSONB, and an
+index tuple over the btree row size limit would make the INSERT fail.
+
+Revision ID: 20261018_0003
+Revises: 20261018_0002
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20261018_0003'
+down_revision: Union[str, None] = '20261018_0002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create ix_request_metrics_created_at_covering and drop the plain created_at index"""
+    # CREATE/DROP INDEX CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_request_metrics_created_at_covering',
+            'request_metrics',
+            ['created_at'],
+            postgresql_include=['total_duration_ms', 'completeness'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            'ix_request_metrics_created_at',
+            table_name='request_metrics',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Restore the plain created_at index"""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_request_metrics_created_at',
+            'request_metrics',
+            ['created_at'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            'ix_request_metrics_created_at_covering',
+            table_name='request_metrics',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,49 @@
+"""Add (session_id, sequence_number) index on conversation_messages
+
+list_conversations ranks each session's messages by sequence_number, and
+history loads / turn saves read a session's messages in sequence order; a
+composite index serves both as ordered range scans instead of a sort. role is
+carried as an INCLUDE column for the first-message-is-from-the-user filter.
+content is deliberately not included: message text can exceed the btree
+tuple size limit.
+
+Revision ID: 20261018_0004
+Revises: 20261018_0003
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20261018_0004'
+down_revision: Union[str, None] = '20261018_0003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create ix_conversation_messages_session_sequence without locking writes"""
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_conversation_messages_session_sequence',
+            'conversation_messages',
+            ['session_id', 'sequence_number'],
+            postgresql_include=['role'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Drop ix_conversation_messages_session_sequence"""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_conversation_messages_session_sequence',
+            table_name='conversation_messages',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
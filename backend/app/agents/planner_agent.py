@@ -10,17 +10,9 @@ Responsibilities:
 
 from app.core.centralized_logger import get_logger
 import json
-import sys
-import os
 from typing import Dict, Any, List, Optional
 
-# Add MCP server to path for tool contract imports
-backend_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-mcp_server_path = os.path.join(backend_dir, 'mcp_server')
-if mcp_server_path not in sys.path:
-    sys.path.insert(0, mcp_server_path)
-
-from tool_contracts import (  # noqa: E402
+from mcp_server.tool_contracts import (
     get_tool_catalog,
     get_tool_contracts_dict,
     get_required_tools_from_dependencies,
@@ -36,6 +28,22 @@ from app.services.model_service import model_service
 
 logger = get_logger(__name__)
 
+# Shared empty default for contract lookups (never mutated)
+_EMPTY: Dict[str, Any] = {}
+
+# Product complexity classes that map to a static plan template
+PRODUCT_COMPLEXITY_CLASSES = ("factoid", "comparison", "recommendation", "deep_research")
+
+# Appended to the planner prompt when the heuristic classifier was unsure, so the
+# same LLM call can either pick a product template or select tools directly
+PRODUCT_TEMPLATE_PROMPT = """
+Alternatively, if the request clearly fits one of these product pipelines, return its class instead of tools:
+- factoid: a single fact about one named product
+- comparison: comparing two or more products
+- recommendation: "best X" style request with no specific product named
+- deep_research: reviews, owner experience, complaints or known issues
+Example: {"class": "comparison"}"""
+
 
 # Planner system prompt - returns simple tool list
 # The system handles dependency ordering automatically based on pre/post in tool contracts
@@ -74,6 +82,9 @@ class PlannerAgent(BaseAgent):
     that specify which MCP tools to call, in what order, with what arguments.
     """
 
+    # PlannerAgent keeps no per-instance state beyond what BaseAgent sets up
+    __slots__ = ()
+
     COMPLEXITY_CONFIDENCE_THRESHOLD = 0.7
 
     def __init__(self):
@@ -98,19 +109,23 @@ class PlannerAgent(BaseAgent):
         Returns:
             Updated state with plan field
         """
-        
+        # Unpack the state fields used below once, up front
+        user_message = state.get("user_message", "")
+        intent = state.get("intent", "general")
+        slots = state.get("slots") or {}
+        conversation_history = (state.get("conversation_history") or [])[-3:]  # Last 3 messages
+        session_id = state.get("session_id")
+
         try:
             # Log agent input (GREEN)
             self.log_input(
-                user_message=state.get("user_message"),
-                intent=state.get("intent"),
-                slots=state.get("slots")
+                user_message=user_message,
+                intent=intent,
+                slots=slots
             )
 
             self.colored_logger.info("🧠 Planner Agent starting...")
 
-            intent = state.get("intent", "general")
-
             # Handle simple intents with manual plans (no LLM needed)
             if intent == "unclear":
                 plan = self._create_manual_plan_for_unclear()
@@ -122,8 +137,6 @@ class PlannerAgent(BaseAgent):
                 plan = self._create_fast_path_travel_plan()
                 self.colored_logger.info("🚀 FAST PATH: travel intent → hardcoded template")
             elif intent == "product":
-                user_message = state.get("user_message", "")
-                slots = state.get("slots", {})
                 complexity, confidence = classify_query_complexity(user_message, slots, intent)
                 logger.info(f"[planner] Query complexity: {complexity} (confidence={confidence:.2f})")
 
@@ -134,8 +147,11 @@ class PlannerAgent(BaseAgent):
                         f"{self.COMPLEXITY_CONFIDENCE_THRESHOLD}, using LLM planner"
                     )
                     available_tools = list(get_tool_contracts_dict().values())
-                    context = await self._build_planning_context(state, available_tools)
-                    plan = await self._generate_plan(context, state)
+                    context = await self._build_planning_context(
+                        user_message, intent, slots, conversation_history, available_tools
+                    )
+                    # Let the same LLM call either pick a template class or select tools
+                    plan = await self._generate_plan(context, session_id, allow_template=True)
                     self._validate_plan(plan, available_tools)
                 else:
                     plan = self._get_product_plan_for_complexity(complexity)
@@ -153,10 +169,12 @@ class PlannerAgent(BaseAgent):
                 self.colored_logger.info(f"📋 {len(available_tools)} tools available")
 
                 # Build context for planner
-                context = await self._build_planning_context(state, available_tools)
+                context = await self._build_planning_context(
+                    user_message, intent, slots, conversation_history, available_tools
+                )
 
                 # Generate plan using LLM
-                plan = await self._generate_plan(context, state)
+                plan = await self._generate_plan(context, session_id)
 
                 # Validate plan
                 self._validate_plan(plan, available_tools)
@@ -194,24 +212,30 @@ class PlannerAgent(BaseAgent):
 
     async def _build_planning_context(
         self,
-        state: Dict[str, Any],
+        user_message: str,
+        intent: str,
+        slots: Dict[str, Any],
+        conversation_history: List[Dict[str, Any]],
         available_tools: List[Dict[str, Any]]
     ) -> Dict[str, Any]:
         """
         Build context dict for the planner LLM.
 
         Args:
-            state: Graph state
+            user_message: Current user message
+            intent: Classified intent
+            slots: Extracted slots
+            conversation_history: Recent conversation messages (already trimmed)
             available_tools: List of available MCP tools
 
         Returns:
             Planning context dict
         """
         context = {
-            "user_message": state.get("user_message", ""),
-            "intent": state.get("intent", "general"),
-            "slots": state.get("slots", {}),
-            "conversation_history": state.get("conversation_history", [])[-3:],  # Last 3 messages
+            "user_message": user_message,
+            "intent": intent,
+            "slots": slots,
+            "conversation_history": conversation_history,
             "available_tools": available_tools
         }
 
@@ -220,14 +244,18 @@ class PlannerAgent(BaseAgent):
     async def _generate_plan(
         self,
         context: Dict[str, Any],
-        state: Dict[str, Any]
+        session_id: Optional[str] = None,
+        allow_template: bool = False
     ) -> Dict[str, Any]:
         """
         Generate execution plan using LLM.
 
         Args:
             context: Planning context
-            state: Graph state (for tracing)
+            session_id: Session ID (for tracing)
+            allow_template: If True, the LLM may answer with a product complexity
+                class ({"class": ...}) instead of a tool list, and the matching
+                static template is used
 
         Returns:
             Execution plan dict
@@ -268,6 +296,8 @@ Slots: {json.dumps(context['slots'], indent=2)}
 
 Return ONLY the tool names as a JSON array. Downstream tools will be auto-added based on dependencies.
 Example: {{"tools": ["product_search"]}} - this will auto-add normalize, affiliate, compose"""
+        if allow_template:
+            user_prompt += "\n" + PRODUCT_TEMPLATE_PROMPT
 
         # Call LLM to generate tool list
         try:
@@ -280,7 +310,7 @@ Example: {{"tools": ["product_search"]}} - this will auto-add normalize, affilia
                 temperature=0.3,  # Low temperature for consistent planning
                 max_tokens=self.settings.PLANNER_MAX_TOKENS,
                 response_format={"type": "json_object"},
-                session_id=state.get("session_id"),
+                session_id=session_id,
                 max_retries=2
             )
 
@@ -293,6 +323,11 @@ Example: {{"tools": ["product_search"]}} - this will auto-add normalize, affilia
             # Parse tool list
             result = json.loads(response)
 
+            complexity_class = result.get("class") if allow_template else None
+            if complexity_class in PRODUCT_COMPLEXITY_CLASSES:
+                logger.info(f"LLM selected product template: {complexity_class}")
+                return self._get_product_plan_for_complexity(complexity_class)
+
             if "tools" not in result:
                 raise AgentError(self.agent_name, "Response missing 'tools' field")
 
@@ -339,26 +374,28 @@ Example: {{"tools": ["product_search"]}} - this will auto-add normalize, affilia
             if c["name"] in tool_names
         }
 
+        # Resolve each tool's contract exactly once:
+        # per_tool[tool] = (pre_tools, post_tools, has_tool_order, tool_order)
+        per_tool = {}
+        for tool_name in tool_names:
+            contract = tool_contracts.get(tool_name, _EMPTY)
+            tools_field = contract.get("tools", _EMPTY)
+            per_tool[tool_name] = (
+                tools_field.get("pre", []),
+                tools_field.get("post", []),
+                "tool_order" in contract,
+                contract.get("tool_order", 0),
+            )
+
         # Build dependency graph using "pre" field
         # graph[tool] = list of tools that must come before it (from "pre" field)
+        # Tools without a contract have no pre/post and get no dependencies
         graph = {}
         in_degree = {}
 
-        # Build dependency graph from "tools.pre" field
         for tool_name in tool_names:
-            contract = tool_contracts.get(tool_name)
-            if not contract:
-                # Tool not found - add it anyway with no dependencies
-                graph[tool_name] = []
-                in_degree[tool_name] = 0
-                continue
-
-            # Get "tools.pre" dependencies - tools that must run before this one
-            tools_field = contract.get("tools", {})
-            pre_tools = tools_field.get("pre", [])
-
             # Filter to only include tools that are in our current plan
-            dependencies = [t for t in pre_tools if t in tool_names]
+            dependencies = [t for t in per_tool[tool_name][0] if t in tool_names]
 
             graph[tool_name] = dependencies
             in_degree[tool_name] = len(dependencies)
@@ -366,13 +403,7 @@ Example: {{"tools": ["product_search"]}} - this will auto-add normalize, affilia
         # Add reverse dependencies from "tools.post" field
         # If tool A has post=[B], then B must run after A, meaning A is a dependency of B
         for tool_name in tool_names:
-            contract = tool_contracts.get(tool_name)
-            if not contract:
-                continue
-
-            tools_field = contract.get("tools", {})
-            post_tools = tools_field.get("post", [])
-            for post_tool in post_tools:
+            for post_tool in per_tool[tool_name][1]:
                 if post_tool in tool_names:
                     # post_tool must run after tool_name
                     # So tool_name is a dependency of post_tool
@@ -384,14 +415,10 @@ Example: {{"tools": ["product_search"]}} - this will auto-add normalize, affilia
         sorted_tools = []
         queue = [tool for tool, degree in in_degree.items() if degree == 0]
 
-        # Helper to get sort key - only use tool_order if defined
+        # Sort key - tools with tool_order come after tools without (sorted by order)
+        # Tools without tool_order maintain their original position
         def get_sort_key(tool_name: str) -> tuple:
-            contract = tool_contracts.get(tool_name, {})
-            has_order = "tool_order" in contract
-            order = contract.get("tool_order", 0)
-            # Tools with tool_order come after tools without (sorted by order)
-            # Tools without tool_order maintain their original position
-            return (has_order, order)
+            return per_tool[tool_name][2:]
 
         while queue:
             # Sort queue: tools without tool_order first, then by tool_order
@@ -421,14 +448,13 @@ Example: {{"tools": ["product_search"]}} - this will auto-add normalize, affilia
         tools_with_order = []
 
         for tool in sorted_tools:
-            contract = tool_contracts.get(tool, {})
-            if "tool_order" in contract:
+            if per_tool[tool][2]:
                 tools_with_order.append(tool)
             else:
                 tools_without_order.append(tool)
 
         # Sort tools with order by their tool_order value
-        tools_with_order.sort(key=lambda t: tool_contracts.get(t, {}).get("tool_order", 0))
+        tools_with_order.sort(key=lambda t: per_tool[t][3])
 
         return tools_without_order + tools_with_order
 
@@ -507,48 +533,6 @@ Example: {{"tools": ["product_search"]}} - this will auto-add normalize, affilia
 
         logger.info(f"Plan validation passed: {len(plan['steps'])} steps, {len(step_ids)} unique IDs")
 
-    def _ensure_next_step_suggestion(self, plan: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        Ensure next_step_suggestion is always the final step in the plan.
-        This guarantees follow-up questions are generated for every response.
-
-        Args:
-            plan: Generated plan from LLM
-
-        Returns:
-            Plan with next_step_suggestion as the final step
-        """
-        steps = plan.get("steps", [])
-
-        # Check if next_step_suggestion is already in the plan
-        has_next_step = any(
-            "next_step_suggestion" in step.get("tools", [])
-            for step in steps
-        )
-
-        if has_next_step:
-            # Ensure it's the last step
-            for i, step in enumerate(steps):
-                if "next_step_suggestion" in step.get("tools", []):
-                    if i != len(steps) - 1:
-                        # Move it to the end
-                        next_step = steps.pop(i)
-                        steps.append(next_step)
-                        logger.info("Moved next_step_suggestion to final step")
-                    break
-        else:
-            # Add next_step_suggestion as the final step
-            final_step_id = f"step_{len(steps) + 1}"
-            steps.append({
-                "id": final_step_id,
-                "tools": ["next_step_suggestion"],
-                "parallel": False
-            })
-            logger.info(f"Added next_step_suggestion as final step: {final_step_id}")
-
-        plan["steps"] = steps
-        return plan
-
     def _create_manual_plan_for_unclear(self) -> Dict[str, Any]:
         """
         Create a manual plan for unclear/gibberish input.
@@ -568,17 +552,19 @@ Example: {{"tools": ["product_search"]}} - this will auto-add normalize, affilia
         }
 
     def _get_product_plan_for_complexity(self, complexity: str) -> Dict[str, Any]:
-        """Return execution plan template based on query complexity class."""
+        """
+        Return execution plan template based on query complexity class.
+        Every template already ends with next_step_suggestion, so no post-processing is needed.
+        """
         # product_extractor is only needed for comparisons (to parse "X vs Y") and factoids.
         # For recommendations/deep_research, product_search already resolves products.
         needs_extractor = complexity in ("factoid", "comparison")
         if complexity == "factoid":
-            plan = self._create_minimal_product_plan()
+            return self._create_minimal_product_plan()
         elif complexity in ("comparison", "recommendation"):
-            plan = self._create_standard_product_plan(include_extractor=needs_extractor)
+            return self._create_standard_product_plan(include_extractor=needs_extractor)
         else:  # deep_research
-            plan = self._create_fast_path_product_plan(include_extractor=False)
-        return self._ensure_next_step_suggestion(plan)
+            return self._create_fast_path_product_plan(include_extractor=False)
 
     def _create_minimal_product_plan(self) -> Dict[str, Any]:
         """
@@ -591,6 +577,7 @@ Example: {{"tools": ["product_search"]}} - this will auto-add normalize, affilia
                 {"id": "step_1", "tools": ["product_extractor"], "parallel": False},
                 {"id": "step_2", "tools": ["product_general_information"], "parallel": False},
                 {"id": "step_3", "tools": ["product_compose"], "parallel": False},
+                {"id": "step_4", "tools": ["next_step_suggestion"], "parallel": False},
             ]
         }
 
@@ -610,6 +597,7 @@ Example: {{"tools": ["product_search"]}} - this will auto-add normalize, affilia
             {"id": f"step_{step_num + 1}", "tools": ["product_normalize"], "parallel": False},
             {"id": f"step_{step_num + 2}", "tools": ["product_affiliate"], "parallel": False},
             {"id": f"step_{step_num + 3}", "tools": ["product_compose"], "parallel": False},
+            {"id": f"step_{step_num + 4}", "tools": ["next_step_suggestion"], "parallel": False},
         ])
         return {"steps": steps}
 
@@ -626,7 +614,7 @@ Example: {{"tools": ["product_search"]}} - this will auto-add normalize, affilia
           Step N+3: product_affiliate (needs normalized products)
           Step N+4: product_ranking (needs affiliate data)
           Step N+5: product_compose (final assembly, tool_order 800)
-          next_step_suggestion appended by _get_product_plan_for_complexity
+          Step N+6: next_step_suggestion
 
         Returns:
             Execution plan dict with parallel step 2
@@ -645,6 +633,7 @@ Example: {{"tools": ["product_search"]}} - this will auto-add normalize, affilia
             {"id": f"step_{step_num + 3}", "tools": ["product_affiliate"], "parallel": False},
             {"id": f"step_{step_num + 4}", "tools": ["product_ranking"], "parallel": False},
             {"id": f"step_{step_num + 5}", "tools": ["product_compose"], "parallel": False},
+            {"id": f"step_{step_num + 6}", "tools": ["next_step_suggestion"], "parallel": False},
         ])
         return {"steps": steps}
 
@@ -8,7 +8,9 @@ the appropriate execution plan template, bypassing the LLM planner.
 Must complete in < 5 ms (no LLM call).
 """
 
-from typing import Literal
+from functools import lru_cache
+from itertools import islice
+from typing import Literal, Optional
 import re
 
 # ── Keyword lists ─────────────────────────────────────────────────────────────
@@ -33,29 +35,54 @@ KNOWN_BRANDS = [
     "lenovo", "asus", "bose", "jabra", "anker", "canon", "nikon"
 ]
 
+# ── Precomputed lookups ───────────────────────────────────────────────────────
+# Single-word keywords are checked by set membership against the message's
+# words; multi-word phrases are matched by one compiled alternation per list.
+
+_WORD_RE = re.compile(r"\w+")
+_TOKEN_RE = re.compile(r"\S+")
+
+# Rules only distinguish token counts up to "> 20", so counting stops there
+_LONG_QUERY_TOKENS = 20
+
+
+def _compile_phrases(keywords: list[str]) -> Optional[re.Pattern]:
+    """Compile the multi-word phrases of a keyword list into one substring alternation."""
+    phrases = [re.escape(kw) for kw in keywords if " " in kw]
+    return re.compile("|".join(phrases)) if phrases else None
+
+
+_COMPARISON_SINGLES = frozenset(kw for kw in COMPARISON_KEYWORDS if " " not in kw)
+_COMPARISON_PHRASES = _compile_phrases(COMPARISON_KEYWORDS)
+_RECOMMENDATION_SINGLES = frozenset(kw for kw in RECOMMENDATION_KEYWORDS if " " not in kw)
+_RECOMMENDATION_PHRASES = _compile_phrases(RECOMMENDATION_KEYWORDS)
+_REVIEW_SINGLES = frozenset(kw for kw in REVIEW_KEYWORDS if " " not in kw)
+_REVIEW_PHRASES = _compile_phrases(REVIEW_KEYWORDS)
+_BRAND_SET = frozenset(KNOWN_BRANDS)
+
 # ── Helpers ───────────────────────────────────────────────────────────────────
 
 
-def _contains_any(text_lower: str, keywords: list[str]) -> bool:
-    """Return True if any keyword appears as a word/phrase in text_lower."""
-    for kw in keywords:
-        # Use word-boundary match for single tokens; phrase match otherwise
-        if " " in kw:
-            if kw in text_lower:
-                return True
-        else:
-            if re.search(r"\b" + re.escape(kw) + r"\b", text_lower):
-                return True
-    return False
+def _word_set(text_lower: str) -> set[str]:
+    """Split text into the set of its \\w+ runs (the units \\b...\\b would match)."""
+    return set(_WORD_RE.findall(text_lower))
+
+
+def _bounded_token_count(text: str, limit: int = _LONG_QUERY_TOKENS + 1) -> int:
+    """Count whitespace-separated tokens like len(text.split()), stopping at limit."""
+    return sum(1 for _ in islice(_TOKEN_RE.finditer(text), limit))
 
 
-def _count_brand_mentions(text_lower: str) -> int:
-    """Count how many distinct known brand names appear in the text."""
-    count = 0
-    for brand in KNOWN_BRANDS:
-        if re.search(r"\b" + re.escape(brand) + r"\b", text_lower):
-            count += 1
-    return count
+def _has_keyword(words: set[str], text_lower: str, singles: frozenset, phrases: Optional[re.Pattern]) -> bool:
+    """Return True if any single keyword is a word of the text or any phrase occurs in it."""
+    if not singles.isdisjoint(words):
+        return True
+    return phrases is not None and phrases.search(text_lower) is not None
+
+
+def _count_brand_mentions(words: set[str]) -> int:
+    """Count how many distinct known brand names appear among the words."""
+    return len(_BRAND_SET & words)
 
 
 # ── Public API ────────────────────────────────────────────────────────────────
@@ -80,44 +107,57 @@ def classify_query_complexity(
     if not isinstance(user_message, str):
         return ("deep_research", 0.6)
 
-    text_lower = user_message.lower()
-    tokens = user_message.split()
-    token_count = len(tokens)
+    # Slot-based product count - the only slot signal the rules use, so it is
+    # all the cache needs to key on
+    slot_products = slots.get("product_names") if slots else None
+    return _classify(user_message, len(slot_products) if slot_products else 0)
 
-    # Slot-based product count
-    slot_products: list = slots.get("product_names", []) if slots else []
-    slot_product_count = len(slot_products)
 
-    # Text-based brand/product count (used when slots are sparse)
-    brand_mentions = _count_brand_mentions(text_lower)
-
-    # Total named-product signal: use slot count if populated, else brand mentions
-    named_product_count = slot_product_count if slot_product_count > 0 else brand_mentions
-
-    has_comparison  = _contains_any(text_lower, COMPARISON_KEYWORDS)
-    has_review      = _contains_any(text_lower, REVIEW_KEYWORDS)
-    has_recommend   = _contains_any(text_lower, RECOMMENDATION_KEYWORDS)
+@lru_cache(maxsize=4096)
+def _classify(
+    user_message: str,
+    slot_product_count: int,
+) -> tuple[Literal["factoid", "comparison", "recommendation", "deep_research"], float]:
+    """
+    Pure classification body behind classify_query_complexity, memoized so
+    repeated messages (retries, refreshes, replays) skip the text scans.
+    """
+    # Signals are computed lazily, in rule order, so a rule that already
+    # decides the class skips the remaining text scans.
 
     # ── Rule 1: Comparison ────────────────────────────────────────────────────
     # comparison: 2+ named products OR any comparison keyword present
-    if named_product_count >= 2 or has_comparison:
+    if slot_product_count >= 2:
+        return ("comparison", 0.85)
+
+    text_lower = user_message.lower()
+    words = _word_set(text_lower)
+
+    # Total named-product signal: use slot count if populated, else
+    # text-based brand mentions (used when slots are sparse)
+    named_product_count = slot_product_count if slot_product_count > 0 else _count_brand_mentions(words)
+
+    if named_product_count >= 2 or _has_keyword(words, text_lower, _COMPARISON_SINGLES, _COMPARISON_PHRASES):
         return ("comparison", 0.85)
 
     # ── Rule 2: Deep research — review keywords ───────────────────────────────
-    if has_review:
+    if _has_keyword(words, text_lower, _REVIEW_SINGLES, _REVIEW_PHRASES):
         return ("deep_research", 0.9)
 
     # ── Rule 3: Deep research — long query ───────────────────────────────────
-    if token_count > 20:
+    token_count = _bounded_token_count(user_message)
+    if token_count > _LONG_QUERY_TOKENS:
         return ("deep_research", 0.75)
 
     # ── Rule 4: Recommendation ────────────────────────────────────────────────
+    has_recommend = _has_keyword(words, text_lower, _RECOMMENDATION_SINGLES, _RECOMMENDATION_PHRASES)
     if has_recommend and named_product_count == 0:
         return ("recommendation", 0.8)
 
     # ── Rule 5: Factoid ───────────────────────────────────────────────────────
     # factoid: short query + exactly one entity + no comparison/review/recommendation
-    if token_count < 10 and named_product_count == 1 and not has_comparison and not has_review and not has_recommend:
+    # (comparison and review keywords were ruled out by rules 1 and 2)
+    if token_count < 10 and named_product_count == 1 and not has_recommend:
         return ("factoid", 0.85)
 
     # ── Rule 6: Default fallback ──────────────────────────────────────────────
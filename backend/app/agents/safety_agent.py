@@ -5,17 +5,38 @@ Responsibilities:
 - PII detection and redaction
 - Text sanitization
 - Policy compliance checks
-- Save user message to database after safety checks pass
+
+The graph runs this agent from workflow.safety_node; the user message is
+persisted with the rest of the turn by chat_history_manager.save_turn.
 """
+import asyncio
 import re
 from app.core.centralized_logger import get_logger
-from typing import Dict, Any, Literal
+from typing import Dict, Any, Literal, Optional
 from openai import AsyncOpenAI
 from ..schemas.graph_state import GraphState
-from app.services.chat_history_manager import chat_history_manager
 
 logger = get_logger(__name__)
 
+# PII and jailbreak scans run on raw user text, so prefer RE2's linear-time
+# matching (no catastrophic backtracking on adversarial input) when installed.
+try:
+    import re2 as _scan_re
+except ImportError:
+    _scan_re = re
+
+
+# AsyncOpenAI clients keyed by API key, so every SafetyAgent reuses one connection pool
+_OPENAI_CLIENT_CACHE: Dict[str, AsyncOpenAI] = {}
+
+
+def _get_openai_client(api_key: str) -> AsyncOpenAI:
+    """Return the shared AsyncOpenAI client for api_key, creating it once."""
+    client = _OPENAI_CLIENT_CACHE.get(api_key)
+    if client is None:
+        client = _OPENAI_CLIENT_CACHE.setdefault(api_key, AsyncOpenAI(api_key=api_key))
+    return client
+
 
 class SafetyAgent:
     """Safety and Policy enforcement agent"""
@@ -28,11 +49,48 @@ class SafetyAgent:
         "credit_card": r'\b(?:\d{4}[-\s]?){3}\d{4}\b',
         "ip_address": r'\b(?:\d{1,3}\.){3}\d{1,3}\b',
     }
+    # All PII patterns as one alternation; match.lastgroup names the PII type
+    PII_UNION_RE = _scan_re.compile("|".join(f"(?P<{pii_type}>{pattern})" for pii_type, pattern in PII_PATTERNS.items()))
+    # Anchor subsets: email needs "@", every other pattern needs a digit, so
+    # text missing an anchor only runs the patterns it can possibly match
+    PII_EMAIL_RE = _scan_re.compile(f"(?P<email>{PII_PATTERNS['email']})")
+    PII_DIGIT_RE = _scan_re.compile(
+        "|".join(f"(?P<{pii_type}>{pattern})" for pii_type, pattern in PII_PATTERNS.items() if pii_type != "email")
+    )
+    DIGIT_RE = re.compile(r"\d")
+
+    # Shortest text any PII pattern can match ("a@b.co"); shorter input is skipped
+    PII_MIN_LENGTH = 6
+
+    # Jailbreak phrases - substring matched against lowercased text
+    JAILBREAK_KEYWORDS = [
+        "ignore previous",
+        "ignore all previous",
+        "disregard",
+        "forget your",
+        "system prompt",
+        "as an ai language model",
+        "you are now",
+        "pretend you are",
+        "roleplaying"
+    ]
+    JAILBREAK_RE = _scan_re.compile("|".join(re.escape(keyword) for keyword in JAILBREAK_KEYWORDS))
+
+    # Overly vague queries ("help", "?", "what") - matched against lowercased text
+    VAGUE_RE = re.compile(r"^\s*(?:help|\?|what)\s*$")
 
     def __init__(self, openai_api_key: str):
-        self.client = AsyncOpenAI(api_key=openai_api_key)
+        self._openai_api_key = openai_api_key
+        self._client: Optional[AsyncOpenAI] = None
         self.on_chain_start_message = "Checking your message for safety..."
 
+    @property
+    def client(self) -> AsyncOpenAI:
+        """OpenAI client, created on first moderation call and shared per API key"""
+        if self._client is None:
+            self._client = _get_openai_client(self._openai_api_key)
+        return self._client
+
     async def execute(self, state: GraphState) -> Dict[str, Any]:
         """
         Execute safety checks on user input
@@ -57,8 +115,28 @@ class SafetyAgent:
 
     async def _execute_safety_checks(self, user_text: str) -> Dict[str, Any]:
         """Internal safety check execution"""
-        # Step 1: Content Moderation using OpenAI
-        moderation_result = await self._moderate_content(user_text)
+        # Step 1: Content Moderation using OpenAI - started first so the local
+        # checks below run while the moderation request is in flight
+        moderation_task = asyncio.create_task(self._moderate_content(user_text))
+        await asyncio.sleep(0)  # let the task send its request before the CPU-bound checks
+
+        try:
+            # Step 2: PII Detection and Redaction
+            sanitized_text, redaction_map = self._detect_and_redact_pii(user_text)
+
+            # Lowercase once; shared by the jailbreak and clarification checks
+            sanitized_lower = sanitized_text.lower()
+
+            # Step 3: Check for jailbreak patterns
+            is_jailbreak = self._detect_jailbreak_patterns(sanitized_text, sanitized_lower)
+
+            # Step 4: Check if clarification needed (too vague or sensitive)
+            needs_clarification = self._check_needs_clarification(sanitized_text, sanitized_lower)
+        except Exception:
+            moderation_task.cancel()
+            raise
+
+        moderation_result = await moderation_task
 
         # Only block truly harmful content, not mild profanity
         harmful_categories = ["violence", "self-harm", "sexual/minors", "hate/threatening"]
@@ -77,11 +155,7 @@ class SafetyAgent:
         if moderation_result["flagged"]:
             logger.info(f"Content flagged but allowing: {moderation_result['categories']}")
 
-        # Step 2: PII Detection and Redaction
-        sanitized_text, redaction_map = self._detect_and_redact_pii(user_text)
-
-        # Step 3: Check for jailbreak patterns
-        if self._detect_jailbreak_patterns(sanitized_text):
+        if is_jailbreak:
             return {
                 "policy_status": "block",
                 "sanitized_text": sanitized_text,
@@ -89,9 +163,6 @@ class SafetyAgent:
                 "errors": ["Potential jailbreak attempt detected"]
             }
 
-        # Step 4: Check if clarification needed (too vague or sensitive)
-        needs_clarification = self._check_needs_clarification(sanitized_text)
-
         policy_status = "needs_clarification" if needs_clarification else "allow"
 
         return {
@@ -125,46 +196,53 @@ class SafetyAgent:
             return {"flagged": False, "categories": []}
 
     def _detect_and_redact_pii(self, text: str) -> tuple[str, Dict[str, str]]:
-        """Detect and redact PII from text"""
-        sanitized_text = text
-        redaction_map = {}
-
-        for pii_type, pattern in self.PII_PATTERNS.items():
-            matches = re.finditer(pattern, text)
-            for i, match in enumerate(matches):
-                original = match.group()
-                redacted = f"[REDACTED_{pii_type.upper()}_{i}]"
-                sanitized_text = sanitized_text.replace(original, redacted)
-                redaction_map[redacted] = original
-                logger.warning(f"PII detected and redacted: {pii_type}")
+        """Detect and redact PII from text in a single pass over the input"""
+        if len(text) < self.PII_MIN_LENGTH:
+            return text, {}
+
+        # Cheap anchor prescreen: most chat turns contain neither "@" nor a digit
+        has_at = "@" in text
+        has_digit = self.DIGIT_RE.search(text) is not None
+        if has_at and has_digit:
+            pattern = self.PII_UNION_RE
+        elif has_at:
+            pattern = self.PII_EMAIL_RE
+        elif has_digit:
+            pattern = self.PII_DIGIT_RE
+        else:
+            return text, {}
 
+        redaction_map = {}
+        counters: Dict[str, int] = {}
+
+        def _redact(match) -> str:
+            pii_type = match.lastgroup
+            i = counters.get(pii_type, 0)
+            counters[pii_type] = i + 1
+            redacted = f"[REDACTED_{pii_type.upper()}_{i}]"
+            redaction_map[redacted] = match.group()
+            logger.warning(f"PII detected and redacted: {pii_type}")
+            return redacted
+
+        sanitized_text = pattern.sub(_redact, text)
         return sanitized_text, redaction_map
 
-    def _detect_jailbreak_patterns(self, text: str) -> bool:
-        """Detect potential jailbreak attempts"""
-        jailbreak_keywords = [
-            "ignore previous",
-            "ignore all previous",
-            "disregard",
-            "forget your",
-            "system prompt",
-            "as an ai language model",
-            "you are now",
-            "pretend you are",
-            "roleplaying"
-        ]
-
-        text_lower = text.lower()
-        for keyword in jailbreak_keywords:
-            if keyword in text_lower:
-                logger.warning(f"Potential jailbreak pattern detected: {keyword}")
-                return True
+    def _detect_jailbreak_patterns(self, text: str, text_lower: Optional[str] = None) -> bool:
+        """Detect potential jailbreak attempts (text_lower: precomputed text.lower())"""
+        if text_lower is None:
+            text_lower = text.lower()
+        match = self.JAILBREAK_RE.search(text_lower)
+        if match:
+            logger.warning(f"Potential jailbreak pattern detected: {match.group()}")
+            return True
 
         return False
 
-    def _check_needs_clarification(self, text: str) -> bool:
-        """Check if text is too vague and needs clarification"""
-        text_lower = text.strip().lower()
+    def _check_needs_clarification(self, text: str, text_lower: Optional[str] = None) -> bool:
+        """Check if text is too vague and needs clarification (text_lower: precomputed text.lower())"""
+        if text_lower is None:
+            text_lower = text.lower()
+        text_lower = text_lower.strip()
 
         # Allow common greetings - they should be handled by Intent Agent
         common_greetings = ["hi", "hello", "hey", "greetings", "yo"]
@@ -172,68 +250,8 @@ class SafetyAgent:
             return False
 
         # Very short queries (< 3 chars) might need clarification, except greetings
-        if len(text.strip()) < 3:
+        if len(text_lower) < 3:
             return True
 
         # Check for overly vague queries
-        vague_patterns = [
-            r"^\s*help\s*$",
-            r"^\s*\?\s*$",
-            r"^\s*what\s*$",
-        ]
-
-        for pattern in vague_patterns:
-            if re.match(pattern, text_lower):
-                return True
-
-        return False
-
-
-# Agent node function for LangGraph
-async def safety_agent_node(state: GraphState, agent: SafetyAgent) -> GraphState:
-    """
-    LangGraph node wrapper for Safety Agent
-    """
-    result = await agent.execute(state)
-
-    # Update state with safety check results
-    state.policy_status = result["policy_status"]
-    state.sanitized_text = result["sanitized_text"]
-    state.redaction_map = result["redaction_map"]
-
-    if result["errors"]:
-        state.errors.extend(result["errors"])
-        state.status = "error"
-
-    state.current_agent = "safety"
-
-    # Save user message to database after safety checks
-    # This ensures the message is saved before other agents process it
-    session_id = state.get("session_id")
-    user_message = state.get("user_message")
-    if session_id and user_message:
-        try:
-            from app.repositories.conversation_repository import ConversationRepository
-            from app.core.database import get_db
-            from app.core.redis_client import get_redis
-
-            db_gen = get_db()
-            db = await anext(db_gen)
-            redis = await get_redis()
-
-            try:
-                conversation_repo = ConversationRepository(db=db, redis=redis)
-                await conversation_repo.save_message(session_id, "user", user_message)
-                logger.info(f"[SafetyAgent] Saved user message to database for session {session_id}")
-
-                # Invalidate cache and reload conversation history so downstream agents have updated history
-                await chat_history_manager.invalidate_cache(session_id)
-                updated_history = await chat_history_manager.get_history(session_id)
-                state["conversation_history"] = updated_history
-                logger.info(f"[SafetyAgent] Reloaded conversation history: {len(updated_history)} messages")
-            finally:
-                await db_gen.aclose()
-        except Exception as save_error:
-            logger.error(f"[SafetyAgent] Failed to save user message: {save_error}")
-
-    return state
+        return self.VAGUE_RE.match(text_lower) is not None
@@ -10,40 +10,140 @@ from fastapi import APIRouter, HTTPException, Depends, Query
 from sqlalchemy.orm import Session
 from sqlalchemy import text
 from typing import Dict, Any, List, Optional
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from pydantic import BaseModel
+import asyncio
+import json
 import os
-import pytz
-from collections import defaultdict
+from zoneinfo import ZoneInfo
+from collections import Counter
+from dataclasses import dataclass
+from functools import lru_cache
 from langfuse import Langfuse
+from langfuse.api import ObservationLevel
+from langfuse.api.core import ApiError
+import httpx
 
+from app.core import database
 from app.core.database import get_db
+from app.core.redis_client import get_redis
 from app.core.centralized_logger import get_logger
 from app.core.config import settings
 from app.core.dependencies import check_rate_limit
 from app.services.config_service import ConfigService
+from app.services.popular_queries import POPULAR_QUERIES_VIEW
 from app.api.v1.admin_auth import get_current_admin_user
 
 logger = get_logger(__name__)
 router = APIRouter(tags=["admin"])
 
-# Get timezone from config
-APP_TIMEZONE = pytz.timezone(settings.TIMEZONE)
 
-# Initialize Langfuse client for fetching traces
-langfuse_client = Langfuse(
-    public_key=settings.LANGFUSE_PUBLIC_KEY,
-    secret_key=settings.LANGFUSE_SECRET_KEY,
-    host=settings.LANGFUSE_HOST
-)
+@lru_cache(maxsize=4)
+def _timezone(name: str):
+    """zoneinfo timezone by name (cached)"""
+    return ZoneInfo(name)
+
+
+def _get_app_timezone():
+    """Configured display timezone; keyed on the current setting so overrides apply"""
+    return _timezone(settings.TIMEZONE)
+
+
+@lru_cache(maxsize=1)
+def _langfuse_client(public_key: str, secret_key: str, host: str) -> Langfuse:
+    """Langfuse client for fetching traces, built on first use rather than at import"""
+    return Langfuse(public_key=public_key, secret_key=secret_key, host=host)
+
+
+def _get_langfuse() -> Langfuse:
+    """Langfuse client for the current credentials (rebuilt if they are rotated)"""
+    return _langfuse_client(settings.LANGFUSE_PUBLIC_KEY, settings.LANGFUSE_SECRET_KEY, settings.LANGFUSE_HOST)
+
+
+
+@dataclass(frozen=True, slots=True)
+class _LangfuseErrorSnapshot:
+    """Error observations as of fetched_at; replaced as a whole, never mutated"""
+    data: List[Dict]
+    fetched_at: datetime
+
 
 # Cache for Langfuse error data to avoid hitting rate limits
 # Cache expires after 2 minutes (120 seconds)
-_langfuse_error_cache = {
-    "data": None,
-    "timestamp": None,
-    "ttl": 120  # seconds
-}
+LANGFUSE_ERROR_CACHE_TTL = 120  # seconds
+_langfuse_error_snapshot: Optional[_LangfuseErrorSnapshot] = None
+
+# In-flight refresh of _langfuse_error_snapshot. Shared by every caller so
+# concurrent requests never trigger more than one Langfuse fetch (single flight)
+_langfuse_refresh_task: Optional[asyncio.Task] = None
+
+# Upper bound on pages of ERROR observations pulled per refresh (100 per page)
+LANGFUSE_ERROR_MAX_PAGES = 5
+
+# Max concurrent trace detail requests when falling back to per-trace scanning
+LANGFUSE_TRACE_FETCH_CONCURRENCY = 10
+
+# Redis key prefix for cached dashboard responses (see ADMIN_METRICS_CACHE_TTL)
+METRICS_CACHE_KEY = "admin:metrics"
+
+# Request volume for the last hour and the last day in a single pass over
+# the 24h window (conditional aggregation instead of two COUNT round trips)
+REQUEST_VOLUME_SQL = text("""
+    SELECT
+        COUNT(*) FILTER (WHERE created_at >= :one_hour_ago) AS requests_1h,
+        COUNT(*) AS requests_24h
+    FROM conversation_messages
+    WHERE role = 'user' AND created_at >= :one_day_ago
+""")
+
+# Top queries come from the scheduler-refreshed materialized view; the live
+# aggregation is the fallback when the view is missing (migration not applied)
+POPULAR_QUERIES_VIEW_SQL = text(f"""
+    SELECT content, count
+    FROM {POPULAR_QUERIES_VIEW}
+    ORDER BY count DESC
+    LIMIT 10
+""")
+
+POPULAR_QUERIES_SQL = text("""
+    SELECT content, COUNT(*) as count
+    FROM conversation_messages
+    WHERE role = 'user' AND created_at >= :time
+    GROUP BY content
+    ORDER BY count DESC
+    LIMIT 10
+""")
+
+
+def _request_chart_sql(interval: str):
+    """
+    Requests per interval bucket. Buckets come from generate_series so
+    intervals with no traffic are returned as 0 instead of being missing.
+    """
+    return text(f"""
+        WITH buckets AS (
+            SELECT generate_series(
+                DATE_TRUNC('{interval}', CAST(:start_time AS timestamp)),
+                DATE_TRUNC('{interval}', CAST(:now AS timestamp)),
+                INTERVAL '1 {interval}'
+            ) AS time_bucket
+        )
+        SELECT
+            b.time_bucket,
+            COUNT(m.id) as count
+        FROM buckets b
+        LEFT JOIN conversation_messages m
+            ON m.role = 'user'
+            AND m.created_at >= :start_time
+            AND m.created_at >= b.time_bucket
+            AND m.created_at < b.time_bucket + INTERVAL '1 {interval}'
+        GROUP BY b.time_bucket
+        ORDER BY b.time_bucket
+    """)
+
+
+# Chart statements, built once per bucket size
+REQUEST_CHART_SQL = {interval: _request_chart_sql(interval) for interval in ("minute", "hour")}
 
 
 # ===== Pydantic Models =====
@@ -68,11 +168,18 @@ class MetricsResponse(BaseModel):
     top_queries: Dict[str, Any]
 
 
+# ===== Dependencies =====
+
+def get_config_service(db: Session = Depends(get_db)) -> ConfigService:
+    """Request-scoped ConfigService bound to the request's DB session"""
+    return ConfigService(db)
+
+
 # ===== Config Endpoints =====
 
 @router.get("/config", response_model=List[ConfigItem])
 async def list_configs(
-    db: Session = Depends(get_db),
+    service: ConfigService = Depends(get_config_service),
     _admin: dict = Depends(get_current_admin_user),
 ):
     """
@@ -82,7 +189,6 @@ async def list_configs(
     Sensitive values (API keys, secrets, passwords) are masked with *********
     """
     try:
-        service = ConfigService(db)
         return await service.list_all_configs()
     except Exception as e:
         logger.error(f"[admin] Error listing configs: {str(e)}")
@@ -92,12 +198,11 @@ async def list_configs(
 @router.get("/config/{config_id}", response_model=ConfigItem)
 async def get_config(
     config_id: int,
-    db: Session = Depends(get_db),
+    service: ConfigService = Depends(get_config_service),
     _admin: dict = Depends(get_current_admin_user),
 ):
     """Get a single config item by ID (sensitive values masked with *********)"""
     try:
-        service = ConfigService(db)
         config = await service.get_config_by_id(config_id)
 
         if not config:
@@ -116,12 +221,11 @@ async def get_config(
 async def update_config(
     config_id: int,
     update: ConfigUpdate,
-    db: Session = Depends(get_db),
+    service: ConfigService = Depends(get_config_service),
     _admin: dict = Depends(get_current_admin_user),
 ):
     """Update a config value (updates DB, Redis cache, and in-memory settings)"""
     try:
-        service = ConfigService(db)
         return await service.update_config(config_id, update.value)
 
     except HTTPException:
@@ -131,7 +235,7 @@ async def update_config(
     except RuntimeError as e:
         raise HTTPException(status_code=500, detail=str(e))
     except Exception as e:
-        await db.rollback()
+        await service.db.rollback()
         logger.error(f"[admin] Error updating config {config_id}: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Failed to update config: {str(e)}")
 
@@ -139,12 +243,11 @@ async def update_config(
 @router.delete("/config/{config_id}")
 async def delete_config(
     config_id: int,
-    db: Session = Depends(get_db),
+    service: ConfigService = Depends(get_config_service),
     _admin: dict = Depends(get_current_admin_user),
 ):
     """Delete a config (deletes from DB and Redis, reverts to .env default)"""
     try:
-        service = ConfigService(db)
         await service.delete_config(config_id)
         return {"message": "Config deleted, reverted to .env default"}
 
@@ -155,7 +258,7 @@ async def delete_config(
     except RuntimeError as e:
         raise HTTPException(status_code=500, detail=str(e))
     except Exception as e:
-        await db.rollback()
+        await service.db.rollback()
         logger.error(f"[admin] Error deleting config {config_id}: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Failed to delete config: {str(e)}")
 
@@ -163,12 +266,11 @@ async def delete_config(
 @router.post("/config", response_model=ConfigItem)
 async def create_config(
     config: ConfigItem,
-    db: Session = Depends(get_db),
+    service: ConfigService = Depends(get_config_service),
     _admin: dict = Depends(get_current_admin_user),
 ):
     """Create a new config override (saves to DB, Redis cache, and in-memory settings)"""
     try:
-        service = ConfigService(db)
         return await service.create_config(config.key, config.value)
 
     except HTTPException:
@@ -178,19 +280,18 @@ async def create_config(
     except RuntimeError as e:
         raise HTTPException(status_code=500, detail=str(e))
     except Exception as e:
-        await db.rollback()
+        await service.db.rollback()
         logger.error(f"[admin] Error creating config: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Failed to create config: {str(e)}")
 
 
 @router.post("/config/clear-cache")
 async def clear_config_cache(
-    db: Session = Depends(get_db),
+    service: ConfigService = Depends(get_config_service),
     _admin: dict = Depends(get_current_admin_user),
 ):
     """Invalidate config cache snapshot and rebuild (cache warming)"""
     try:
-        service = ConfigService(db)
         success = await service.clear_cache()
 
         if success:
@@ -213,14 +314,163 @@ async def clear_config_cache(
 
 # ===== Helper Functions =====
 
-def fetch_langfuse_errors(hours: int = 24) -> List[Dict]:
+def _is_transient_langfuse_error(error: Exception) -> bool:
+    """Rate limiting, server errors and transport failures are worth retrying"""
+    if isinstance(error, ApiError):
+        return error.status_code == 429 or (error.status_code or 0) >= 500
+    return isinstance(error, httpx.TransportError)
+
+
+async def _call_langfuse_with_retry(method, *args, **kwargs):
+    """
+    Await a Langfuse async API call, retrying transient failures with
+    exponential backoff (LANGFUSE_RETRY_BACKOFF_BASE, x1.5 per attempt).
+    """
+    max_retries = settings.LANGFUSE_RETRY_MAX_ATTEMPTS
+
+    for attempt in range(max_retries):
+        try:
+            return await method(*args, **kwargs)
+        except Exception as e:
+            if attempt == max_retries - 1 or not _is_transient_langfuse_error(e):
+                raise
+            delay = settings.LANGFUSE_RETRY_BACKOFF_BASE * (1.5 ** attempt)
+            logger.warning(f"[admin] Langfuse call attempt {attempt + 1} failed ({str(e)}), retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
+
+
+async def _fetch_error_observations(from_timestamp: datetime) -> List[Dict]:
+    """Page through ERROR-level observations since from_timestamp (one request per 100)"""
+    observations_api = _get_langfuse().async_api.observations
+    error_observations = []
+
+    # Note: Langfuse API has a maximum limit of 100 items per request
+    for page in range(1, LANGFUSE_ERROR_MAX_PAGES + 1):
+        observations_response = await _call_langfuse_with_retry(
+            observations_api.get_many,
+            level=ObservationLevel.ERROR,
+            from_start_time=from_timestamp,
+            page=page,
+            limit=100,
+        )
+
+        for obs in observations_response.data:
+            error_observations.append({
+                'timestamp': obs.start_time,
+                'status_message': obs.status_message or 'Unknown error',
+                'trace_id': obs.trace_id,
+                'observation_id': obs.id
+            })
+
+        if page >= observations_response.meta.total_pages:
+            break
+
+    return error_observations
+
+
+async def _fetch_error_observations_from_traces(from_timestamp: datetime) -> List[Dict]:
+    """
+    Fallback for when the observations endpoint is unavailable: list recent
+    traces and inspect each one's observations for ERROR level.
+
+    Trace detail requests are issued concurrently, bounded by
+    LANGFUSE_TRACE_FETCH_CONCURRENCY to stay within Langfuse rate limits.
+    """
+    trace_api = _get_langfuse().async_api.trace
+    traces_response = await _call_langfuse_with_retry(trace_api.list, limit=100)
+
+    # Skip traces older than our time range
+    trace_ids = [
+        trace.id for trace in traces_response.data
+        if trace.id and not (trace.timestamp and trace.timestamp < from_timestamp)
+    ]
+    logger.info(f"[admin] Found {len(trace_ids)} traces to analyze")
+
+    semaphore = asyncio.Semaphore(LANGFUSE_TRACE_FETCH_CONCURRENCY)
+
+    async def fetch_trace(trace_id: str):
+        async with semaphore:
+            return await _call_langfuse_with_retry(trace_api.get, trace_id)
+
+    results = await asyncio.gather(
+        *(fetch_trace(trace_id) for trace_id in trace_ids),
+        return_exceptions=True,
+    )
+
+    error_observations = []
+    for trace_id, trace_details in zip(trace_ids, results):
+        if isinstance(trace_details, Exception):
+            logger.warning(f"[admin] Error fetching trace details for {trace_id}: {str(trace_details)}")
+            continue
+
+        for obs in trace_details.observations or []:
+            if obs.level == ObservationLevel.ERROR:
+                error_observations.append({
+                    'timestamp': obs.start_time or trace_details.timestamp,
+                    'status_message': obs.status_message or 'Unknown error',
+                    'trace_id': trace_id,
+                    'observation_id': obs.id
+                })
+
+    return error_observations
+
+
+async def _refresh_langfuse_errors(hours: int) -> List[Dict]:
+    """Fetch error observations from Langfuse and swap them into the cache"""
+    global _langfuse_error_snapshot
+
+    now = datetime.utcnow()
+    logger.info(f"[admin] Fetching fresh Langfuse error observations from last {hours} hours")
+
+    # Make from_timestamp timezone-aware (UTC) to match Langfuse timestamps
+    from_timestamp = now.replace(tzinfo=timezone.utc) - timedelta(hours=hours)
+
+    try:
+        error_observations = await _fetch_error_observations(from_timestamp)
+    except Exception as obs_error:
+        # Still rate limited / down after retries: scanning traces would only
+        # add load, so let the caller fall back to the stale cache
+        if _is_transient_langfuse_error(obs_error):
+            raise
+        logger.warning(f"[admin] Observations query failed, scanning traces instead: {str(obs_error)}")
+        error_observations = await _fetch_error_observations_from_traces(from_timestamp)
+
+    logger.info(f"[admin] Found {len(error_observations)} error observations")
+
+    # Single reference assignment - readers see either the old or the new snapshot
+    _langfuse_error_snapshot = _LangfuseErrorSnapshot(error_observations, now)
+
+    return error_observations
+
+
+def _log_refresh_failure(task: asyncio.Task) -> None:
+    """Done callback: surface refresh errors nobody awaited (stale-cache path)"""
+    if not task.cancelled() and task.exception() is not None:
+        logger.error(f"[admin] Langfuse refresh failed, keeping stale data: {str(task.exception())}")
+
+
+def _start_langfuse_refresh(hours: int) -> asyncio.Task:
+    """Return the in-flight refresh task, starting one if none is running"""
+    global _langfuse_refresh_task
+
+    if _langfuse_refresh_task is None or _langfuse_refresh_task.done():
+        _langfuse_refresh_task = asyncio.create_task(_refresh_langfuse_errors(hours))
+        _langfuse_refresh_task.add_done_callback(_log_refresh_failure)
+    return _langfuse_refresh_task
+
+
+async def fetch_langfuse_errors(hours: int = 24) -> List[Dict]:
     """
     Fetch error observations from Langfuse for the specified time range.
 
     Note: Langfuse tracks errors at the observation level (spans, generations, events),
-    not at the trace level. We fetch traces and then check their observations for ERROR level.
+    not at the trace level. We query observations filtered to ERROR level directly,
+    falling back to scanning recent traces if that endpoint fails.
 
-    Uses a 2-minute cache to avoid hitting Langfuse rate limits.
+    Uses a 2-minute cache to avoid hitting Langfuse rate limits. Once the cache
+    expires, the stale data is returned immediately while a single background
+    task refreshes it (stale-while-revalidate). A cold cache waits for the
+    refresh, and concurrent cold callers share the same in-flight fetch.
 
     Args:
         hours: Number of hours to look back (default: 24)
@@ -228,87 +478,80 @@ def fetch_langfuse_errors(hours: int = 24) -> List[Dict]:
     Returns:
         List of error observations with timestamp and error details
     """
-    try:
-        # Check cache first to avoid hitting rate limits
-        now = datetime.utcnow()
-        if (_langfuse_error_cache["data"] is not None and
-            _langfuse_error_cache["timestamp"] is not None):
+    snapshot = _langfuse_error_snapshot
+    if snapshot is not None:
+        cache_age = (datetime.utcnow() - snapshot.fetched_at).total_seconds()
+        if cache_age < LANGFUSE_ERROR_CACHE_TTL:
+            logger.info(f"[admin] Using cached Langfuse error data (age: {cache_age:.1f}s)")
+            return snapshot.data
 
-            cache_age = (now - _langfuse_error_cache["timestamp"]).total_seconds()
-            if cache_age < _langfuse_error_cache["ttl"]:
-                logger.info(f"[admin] Using cached Langfuse error data (age: {cache_age:.1f}s)")
-                return _langfuse_error_cache["data"]
+        logger.info(f"[admin] Langfuse error cache stale (age: {cache_age:.1f}s), refreshing in background")
+        _start_langfuse_refresh(hours)
+        return snapshot.data
 
-        logger.info(f"[admin] Fetching fresh Langfuse traces from last {hours} hours")
+    try:
+        # shield: a cancelled request must not cancel the fetch other callers await
+        return await asyncio.shield(_start_langfuse_refresh(hours))
+    except Exception as e:
+        logger.error(f"[admin] Error fetching Langfuse observations: {str(e)}", exc_info=True)
+        return []
 
-        # Fetch traces from Langfuse using the correct API
-        # Use langfuse_client.api.trace.list() to get traces
-        # Note: Langfuse API has a maximum limit of 100 traces per request
-        traces_response = langfuse_client.api.trace.list(limit=100)
 
-        error_observations = []
+async def _get_cached_metrics(cache_key: str) -> Optional[Dict[str, Any]]:
+    """Return a cached metrics response from Redis, or None on miss/Redis unavailable"""
+    try:
+        redis = await get_redis()
+        cached = await redis.get(cache_key)
+    except Exception as e:
+        logger.warning(f"[admin] Metrics cache read failed for {cache_key}: {e}")
+        return None
 
-        # Check if traces_response has data
-        if not hasattr(traces_response, 'data'):
-            logger.warning(f"[admin] Langfuse response has no 'data' attribute: {type(traces_response)}")
-            return []
+    if cached:
+        logger.debug(f"[admin] Metrics cache HIT: {cache_key}")
+        return json.loads(cached)
 
-        logger.info(f"[admin] Found {len(traces_response.data)} traces to analyze")
+    logger.debug(f"[admin] Metrics cache MISS: {cache_key}")
+    return None
 
-        # Calculate time range for filtering
-        # Make from_timestamp timezone-aware (UTC) to match Langfuse timestamps
-        from_timestamp = datetime.utcnow().replace(tzinfo=pytz.UTC) - timedelta(hours=hours)
 
-        # Iterate through traces and check their observations for ERROR level
-        for trace in traces_response.data:
-            trace_id = trace.id if hasattr(trace, 'id') else None
-            trace_timestamp = trace.timestamp if hasattr(trace, 'timestamp') else None
+async def _set_cached_metrics(cache_key: str, payload: Dict[str, Any]) -> None:
+    """Store a metrics response in Redis for ADMIN_METRICS_CACHE_TTL seconds (best effort)"""
+    try:
+        redis = await get_redis()
+        await redis.setex(cache_key, settings.ADMIN_METRICS_CACHE_TTL, json.dumps(payload, default=str))
+    except Exception as e:
+        logger.warning(f"[admin] Metrics cache write failed for {cache_key}: {e}")
 
-            if not trace_id:
-                continue
 
-            # Skip traces older than our time range
-            if trace_timestamp and trace_timestamp < from_timestamp:
-                continue
+async def _fetch_popular_queries(since: datetime) -> List[Dict[str, Any]]:
+    """
+    Most popular user queries since the given time.
 
-            # Fetch full trace details to get observations
+    Reads the precomputed mv_popular_queries_24h view, falling back to the
+    live aggregation if the view is unavailable. Runs on its own session so it
+    can execute concurrently with the request volume query (an AsyncSession
+    does not allow concurrent statements).
+    """
+    try:
+        async with database.AsyncSessionLocal() as session:
             try:
-                trace_details = langfuse_client.api.trace.get(trace_id)
-
-                # Check if trace has observations
-                if hasattr(trace_details, 'observations') and trace_details.observations:
-                    for obs in trace_details.observations:
-                        # Check if observation has ERROR level
-                        # The level is an enum: ObservationLevel.ERROR
-                        if hasattr(obs, 'level') and str(obs.level) == 'ObservationLevel.ERROR':
-                            obs_timestamp = obs.start_time if hasattr(obs, 'start_time') else trace_timestamp
-                            error_observations.append({
-                                'timestamp': obs_timestamp,
-                                'status_message': getattr(obs, 'status_message', 'Unknown error'),
-                                'trace_id': trace_id,
-                                'observation_id': obs.id if hasattr(obs, 'id') else None
-                            })
-            except Exception as trace_error:
-                logger.warning(f"[admin] Error fetching trace details for {trace_id}: {str(trace_error)}")
-                continue
-
-        logger.info(f"[admin] Found {len(error_observations)} error observations")
-
-        # Update cache with fresh data
-        _langfuse_error_cache["data"] = error_observations
-        _langfuse_error_cache["timestamp"] = now
-
-        return error_observations
-
-    except Exception as e:
-        logger.error(f"[admin] Error fetching Langfuse traces: {str(e)}", exc_info=True)
-        # Return cached data if available, even if expired, when API fails
-        if _langfuse_error_cache["data"] is not None:
-            logger.warning("[admin] Returning stale cached data due to API error")
-            return _langfuse_error_cache["data"]
+                result = await session.execute(POPULAR_QUERIES_VIEW_SQL)
+            except Exception as e:
+                logger.warning(f"[admin] {POPULAR_QUERIES_VIEW} unavailable, aggregating live: {str(e)}")
+                await session.rollback()
+                result = await session.execute(POPULAR_QUERIES_SQL, {"time": since})
+            return [{"query": row[0], "count": row[1]} for row in result]
+    except Exception:
         return []
 
 
+def _as_datetime(value) -> datetime:
+    """Langfuse timestamps arrive as datetimes or ISO-8601 strings"""
+    if isinstance(value, str):
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+    return value
+
+
 # ===== Metrics Endpoints =====
 
 @router.get("/metrics", response_model=MetricsResponse)
@@ -319,42 +562,42 @@ async def get_metrics(db: Session = Depends(get_db)):
     - Error rate (24h count, percentage, top errors)
     - Business metrics (CTR, impressions, cost per query)
     - Top queries (most popular, most expensive)
+
+    Responses are cached in Redis for ADMIN_METRICS_CACHE_TTL seconds so
+    concurrent dashboard polling does not re-run the aggregations.
     """
+    cached = await _get_cached_metrics(METRICS_CACHE_KEY)
+    if cached is not None:
+        return cached
+
     try:
         now = datetime.utcnow()
         one_hour_ago = now - timedelta(hours=1)
         one_day_ago = now - timedelta(days=1)
 
-        # Request Volume (only count user messages)
-        result_1h = await db.execute(
-            text("SELECT COUNT(*) FROM conversation_messages WHERE created_at >= :time AND role = 'user'"),
-            {"time": one_hour_ago}
+        # Request Volume (only count user messages) - both windows in one scan,
+        # run alongside the popular-queries aggregation
+        volume_result, popular_queries = await asyncio.gather(
+            db.execute(REQUEST_VOLUME_SQL, {"one_hour_ago": one_hour_ago, "one_day_ago": one_day_ago}),
+            _fetch_popular_queries(one_day_ago),
         )
-        requests_1h = result_1h.fetchone()[0] or 0
-
-        result_24h = await db.execute(
-            text("SELECT COUNT(*) FROM conversation_messages WHERE created_at >= :time AND role = 'user'"),
-            {"time": one_day_ago}
-        )
-        requests_24h = result_24h.fetchone()[0] or 0
+        # COUNT(*) never returns NULL, so the row needs no "or 0" guards
+        requests_1h, requests_24h = volume_result.one()
 
         # Requests per minute (last hour)
         rpm = round(requests_1h / 60, 2) if requests_1h > 0 else 0
 
         # Error Count - Fetch from Langfuse (last 24 hours)
-        error_traces = fetch_langfuse_errors(hours=24)
+        error_traces = await fetch_langfuse_errors(hours=24)
         errors_24h = len(error_traces)
 
         # Get top error messages (group by status_message)
-        error_counts = defaultdict(int)
-        for error in error_traces:
-            msg = error.get('status_message', 'Unknown error')
-            error_counts[msg] += 1
+        error_counts = Counter(error.get('status_message', 'Unknown error') for error in error_traces)
 
-        # Sort and get top 5 errors
+        # Top 5 errors (heap-based top-k, no full sort)
         top_errors = [
             {"message": msg, "count": count}
-            for msg, count in sorted(error_counts.items(), key=lambda x: x[1], reverse=True)[:5]
+            for msg, count in error_counts.most_common(5)
         ]
 
         # Business Metrics
@@ -365,28 +608,10 @@ async def get_metrics(db: Session = Depends(get_db)):
         travel_impressions = 0
         cost_per_query = 0.0
 
-        # Top Queries
-        # Get most popular queries
-        try:
-            result_popular = await db.execute(
-                text("""
-                SELECT content, COUNT(*) as count
-                FROM conversation_messages
-                WHERE role = 'user' AND created_at >= :time
-                GROUP BY content
-                ORDER BY count DESC
-                LIMIT 10
-                """),
-                {"time": one_day_ago}
-            )
-            popular_queries = [{"query": row[0], "count": row[1]} for row in result_popular.fetchall()]
-        except:
-            popular_queries = []
-
         # Most expensive queries (mock - would need cost tracking)
         expensive_queries = []
 
-        return {
+        metrics = {
             "request_volume": {
                 "requests_1h": requests_1h,
                 "requests_24h": requests_24h,
@@ -408,6 +633,8 @@ async def get_metrics(db: Session = Depends(get_db)):
                 "expensive": expensive_queries
             }
         }
+        await _set_cached_metrics(METRICS_CACHE_KEY, metrics)
+        return metrics
 
     except Exception as e:
         logger.error(f"[admin] Error fetching metrics: {str(e)}")
@@ -423,6 +650,11 @@ async def get_chart_data(
     Get time-series data for charts
     Returns requests per minute over the specified timeframe
     """
+    cache_key = f"{METRICS_CACHE_KEY}:chart:{timeframe}"
+    cached = await _get_cached_metrics(cache_key)
+    if cached is not None:
+        return cached
+
     try:
         now = datetime.utcnow()
 
@@ -433,30 +665,25 @@ async def get_chart_data(
             start_time = now - timedelta(days=1)
             interval = "hour"
 
-        # Get request counts grouped by time interval (only user messages)
+        # Get request counts per time interval (only user messages)
         result = await db.execute(
-            text(f"""
-            SELECT
-                DATE_TRUNC('{interval}', created_at) as time_bucket,
-                COUNT(*) as count
-            FROM conversation_messages
-            WHERE created_at >= :start_time AND role = 'user'
-            GROUP BY time_bucket
-            ORDER BY time_bucket
-            """),
-            {"start_time": start_time}
+            REQUEST_CHART_SQL[interval],
+            {"start_time": start_time, "now": now}
         )
 
         # Convert UTC times to configured timezone (UTC+7)
+        app_tz = _get_app_timezone()
         data_points = [
             {
-                "time": pytz.utc.localize(row[0]).astimezone(APP_TIMEZONE).isoformat(),
+                "time": row[0].replace(tzinfo=timezone.utc).astimezone(app_tz).isoformat(),
                 "count": row[1]
             }
-            for row in result.fetchall()
+            for row in result
         ]
 
-        return {"data": data_points, "timeframe": timeframe}
+        chart = {"data": data_points, "timeframe": timeframe}
+        await _set_cached_metrics(cache_key, chart)
+        return chart
 
     except Exception as e:
         logger.error(f"[admin] Error fetching chart data: {str(e)}")
@@ -472,9 +699,12 @@ async def get_error_chart_data(
     Get time-series data for error rate chart
     Returns error counts over the specified timeframe from Langfuse
     """
-    try:
-        now = datetime.utcnow()
+    cache_key = f"{METRICS_CACHE_KEY}:errors_chart:{timeframe}"
+    cached = await _get_cached_metrics(cache_key)
+    if cached is not None:
+        return cached
 
+    try:
         if timeframe == "1h":
             hours = 1
             interval = "minute"
@@ -483,43 +713,33 @@ async def get_error_chart_data(
             interval = "hour"
 
         # Fetch error traces from Langfuse
-        error_traces = fetch_langfuse_errors(hours=hours)
-
-        # Group errors by time bucket
-        time_buckets = defaultdict(int)
-
-        for error in error_traces:
-            # Get timestamp from error trace
-            error_time = error.get('timestamp')
-            if error_time:
-                # Convert to datetime if it's a string
-                if isinstance(error_time, str):
-                    error_time = datetime.fromisoformat(error_time.replace('Z', '+00:00'))
-
-                # Truncate to hour or minute based on interval
-                if interval == "hour":
-                    bucket = error_time.replace(minute=0, second=0, microsecond=0)
-                else:  # minute
-                    bucket = error_time.replace(second=0, microsecond=0)
-
-                # Convert to UTC if it has timezone info
-                if error_time.tzinfo:
-                    bucket = bucket.replace(tzinfo=pytz.utc)
-                else:
-                    bucket = pytz.utc.localize(bucket)
-
-                time_buckets[bucket] += 1
+        error_traces = await fetch_langfuse_errors(hours=hours)
+
+        # Group errors by time bucket: truncate to the hour/minute and label as
+        # UTC (Langfuse timestamps are UTC) in a single replace() per error
+        truncate = {"second": 0, "microsecond": 0, "tzinfo": timezone.utc}
+        if interval == "hour":
+            truncate["minute"] = 0
+
+        time_buckets = Counter(
+            _as_datetime(error_time).replace(**truncate)
+            for error_time in (error.get('timestamp') for error in error_traces)
+            if error_time
+        )
 
         # Convert to sorted list of data points with timezone conversion
+        app_tz = _get_app_timezone()
         data_points = [
             {
-                "time": bucket.astimezone(APP_TIMEZONE).isoformat(),
+                "time": bucket.astimezone(app_tz).isoformat(),
                 "count": count
             }
             for bucket, count in sorted(time_buckets.items())
         ]
 
-        return {"data": data_points, "timeframe": timeframe}
+        chart = {"data": data_points, "timeframe": timeframe}
+        await _set_cached_metrics(cache_key, chart)
+        return chart
 
     except Exception as e:
         logger.error(f"[admin] Error fetching error chart data: {str(e)}")
@@ -10,19 +10,32 @@ Provides endpoints for admin user authentication:
 from fastapi import APIRouter, HTTPException, Depends, status
 from sqlalchemy.orm import Session
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import Dict, Optional, Tuple
 from datetime import datetime
+import asyncio
+import time
 
 from app.core.database import get_db
 from app.core.centralized_logger import get_logger
 from app.repositories.admin_user_repository import AdminUserRepository
-from app.utils.auth import hash_password, verify_password, create_access_token, verify_token
+from app.utils.auth import hash_password, verify_password_async, create_access_token, verify_token
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 
 logger = get_logger(__name__)
 router = APIRouter()
 security = HTTPBearer()
 
+# Short-lived per-process cache of admin user rows for get_current_admin_user,
+# so authenticated requests skip the lookup by primary key. Entries are evicted
+# on login/logout and on admin user updates/deletes in this process; other
+# workers pick up changes once ADMIN_USER_CACHE_TTL expires.
+ADMIN_USER_CACHE_TTL = 10  # seconds
+ADMIN_USER_CACHE_MAX_SIZE = 1024
+_admin_user_cache: Dict[int, Tuple[dict, float]] = {}
+
+# Strong references to fire-and-forget tasks so they are not garbage collected
+_background_tasks: set = set()
+
 
 # ===== Pydantic Models =====
 
@@ -57,6 +70,33 @@ class MessageResponse(BaseModel):
 
 # ===== Helper Functions =====
 
+def _get_cached_admin_user(user_id: int) -> Optional[dict]:
+    """Return a copy of the cached admin user row, or None if missing/expired"""
+    entry = _admin_user_cache.get(user_id)
+    if entry is None:
+        return None
+
+    user, expires_at = entry
+    if time.monotonic() >= expires_at:
+        _admin_user_cache.pop(user_id, None)
+        return None
+
+    return dict(user)
+
+
+def _cache_admin_user(user: dict) -> None:
+    """Cache an admin user row for ADMIN_USER_CACHE_TTL seconds"""
+    if len(_admin_user_cache) >= ADMIN_USER_CACHE_MAX_SIZE:
+        # Drop the oldest entry (dicts preserve insertion order)
+        _admin_user_cache.pop(next(iter(_admin_user_cache)), None)
+    _admin_user_cache[user["id"]] = (dict(user), time.monotonic() + ADMIN_USER_CACHE_TTL)
+
+
+def invalidate_admin_user_cache(user_id: int) -> None:
+    """Evict an admin user from the auth cache after it changes"""
+    _admin_user_cache.pop(user_id, None)
+
+
 async def get_current_admin_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: Session = Depends(get_db)
@@ -88,9 +128,14 @@ async def get_current_admin_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    # Get user from database
-    repo = AdminUserRepository(db)
-    user = await repo.get_by_id(int(user_id))
+    # Get user from cache, falling back to the database
+    user_id = int(user_id)
+    user = _get_cached_admin_user(user_id)
+    if user is None:
+        repo = AdminUserRepository(db)
+        user = await repo.get_by_id(user_id)
+        if user:
+            _cache_admin_user(user)
 
     if not user:
         raise HTTPException(
@@ -109,6 +154,28 @@ async def get_current_admin_user(
     return user
 
 
+async def _update_last_login(user_id: int) -> None:
+    """
+    Record the login timestamp off the request path.
+
+    Runs with its own DB session (the request session is closed once the
+    response is sent); failures are logged and swallowed.
+    """
+    try:
+        from app.core.database import AsyncSessionLocal
+
+        if not AsyncSessionLocal:
+            logger.warning("DB not initialized, skipping last_login update")
+            return
+
+        async with AsyncSessionLocal() as session:
+            await AdminUserRepository(session).update_last_login(user_id)
+        invalidate_admin_user_cache(user_id)
+
+    except Exception as e:
+        logger.warning(f"Failed to update last_login for admin user {user_id}: {str(e)}")
+
+
 # ===== Authentication Endpoints =====
 
 @router.post("/login", response_model=LoginResponse)
@@ -140,16 +207,18 @@ async def login(login_data: LoginRequest, db: Session = Depends(get_db)):
                 detail="User account is inactive"
             )
 
-        # Verify password
-        if not verify_password(login_data.password, user["password_hash"]):
+        # Verify password (bcrypt is deliberately slow - keep it off the event loop)
+        if not await verify_password_async(login_data.password, user["password_hash"]):
             logger.warning(f"Failed login attempt for user: {login_data.username}")
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid username or password"
             )
 
-        # Update last login timestamp
-        await repo.update_last_login(user["id"])
+        # Update last login timestamp (fire-and-forget, not on the login latency path)
+        _last_login_task = asyncio.create_task(_update_last_login(user["id"]))
+        _background_tasks.add(_last_login_task)
+        _last_login_task.add_done_callback(_background_tasks.discard)
 
         # Create access token
         token_data = {
@@ -214,5 +283,6 @@ async def logout(current_user: dict = Depends(get_current_admin_user)):
     Requires valid Bearer token. Currently just returns success.
     Token invalidation is handled client-side by removing the token.
     """
+    invalidate_admin_user_cache(current_user["id"])
     logger.info(f"Admin user logged out: {current_user['username']}")
     return {"message": "Logout successful"}
@@ -11,25 +11,44 @@ All endpoints require admin authentication.
 """
 
 from fastapi import APIRouter, HTTPException, Depends, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
-from pydantic import BaseModel, Field, EmailStr
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from typing import Optional, List
 from datetime import datetime
+import re
 
 from app.core.database import get_db
 from app.core.centralized_logger import get_logger
 from app.repositories.admin_user_repository import AdminUserRepository
-from app.utils.auth import hash_password
-from app.api.v1.admin_auth import get_current_admin_user
+from app.utils.auth import hash_password_async
+from app.api.v1.admin_auth import get_current_admin_user, invalidate_admin_user_cache
 
 logger = get_logger(__name__)
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# Admin-only endpoints: a structural check is enough, full RFC validation
+# (EmailStr / email-validator) is reserved for public-facing input
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+
+def _check_email(v: Optional[str]) -> Optional[str]:
+    if v is not None and not _EMAIL_RE.match(v):
+        raise ValueError("value is not a valid email address")
+    return v
 
 
 # ===== Pydantic Models =====
 
 class AdminUserResponse(BaseModel):
-    """Admin user response model"""
+    """
+    Admin user response model
+
+    Documents the response schema only (via `responses=`): endpoints project
+    repository rows onto these fields and return an ORJSONResponse directly.
+    The rows come straight from AdminUserRepository with DB-typed columns, so
+    neither validation nor FastAPI's jsonable_encoder pass is needed.
+    """
     id: int
     username: str
     email: str
@@ -39,21 +58,37 @@ class AdminUserResponse(BaseModel):
     last_login: Optional[datetime]
 
 
+_ADMIN_USER_FIELDS = tuple(AdminUserResponse.model_fields)
+
+
+def _admin_user_payload(user: dict) -> dict:
+    """Project a repository row onto the AdminUserResponse fields (drops password_hash)"""
+    return {field: user[field] for field in _ADMIN_USER_FIELDS}
+
+
 class CreateAdminUserRequest(BaseModel):
     """Request model for creating admin user"""
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     username: str = Field(..., min_length=3, max_length=100, description="Username")
-    email: EmailStr = Field(..., description="Email address")
+    email: str = Field(..., max_length=255, description="Email address")
     password: str = Field(..., min_length=8, description="Password")
     is_active: bool = Field(default=True, description="Active status")
 
+    _validate_email = field_validator("email")(_check_email)
+
 
 class UpdateAdminUserRequest(BaseModel):
     """Request model for updating admin user"""
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     username: Optional[str] = Field(None, min_length=3, max_length=100, description="Username")
-    email: Optional[EmailStr] = Field(None, description="Email address")
+    email: Optional[str] = Field(None, max_length=255, description="Email address")
     password: Optional[str] = Field(None, min_length=8, description="New password")
     is_active: Optional[bool] = Field(None, description="Active status")
 
+    _validate_email = field_validator("email")(_check_email)
+
 
 class MessageResponse(BaseModel):
     """Simple message response"""
@@ -62,7 +97,7 @@ class MessageResponse(BaseModel):
 
 # ===== Admin User Management Endpoints =====
 
-@router.get("", response_model=List[AdminUserResponse])
+@router.get("", response_model=None, responses={200: {"model": List[AdminUserResponse]}})
 async def list_admin_users(
     current_user: dict = Depends(get_current_admin_user),
     db: Session = Depends(get_db)
@@ -76,20 +111,9 @@ async def list_admin_users(
         repo = AdminUserRepository(db)
         users = await repo.get_all()
 
-        logger.info(f"Admin user {current_user['username']} listed all admin users")
-
-        return [
-            {
-                "id": user["id"],
-                "username": user["username"],
-                "email": user["email"],
-                "is_active": user["is_active"],
-                "created_at": user["created_at"],
-                "updated_at": user["updated_at"],
-                "last_login": user["last_login"]
-            }
-            for user in users
-        ]
+        logger.info("Admin user %s listed all admin users", current_user["username"])
+
+        return ORJSONResponse([_admin_user_payload(user) for user in users])
 
     except Exception as e:
         logger.error(f"Error listing admin users: {str(e)}")
@@ -99,7 +123,12 @@ async def list_admin_users(
         )
 
 
-@router.post("", response_model=AdminUserResponse, status_code=status.HTTP_201_CREATED)
+@router.post(
+    "",
+    response_model=None,
+    responses={201: {"model": AdminUserResponse}},
+    status_code=status.HTTP_201_CREATED,
+)
 async def create_admin_user(
     user_data: CreateAdminUserRequest,
     current_user: dict = Depends(get_current_admin_user),
@@ -113,42 +142,32 @@ async def create_admin_user(
     try:
         repo = AdminUserRepository(db)
 
-        # Check if username already exists
-        if await repo.exists_username(user_data.username):
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Username already exists"
-            )
-
-        # Check if email already exists
-        if await repo.exists_email(user_data.email):
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Email already exists"
-            )
-
-        # Hash password
-        password_hash = hash_password(user_data.password)
+        # Hash password (bcrypt runs on the password executor to keep the event loop free)
+        password_hash = await hash_password_async(user_data.password)
 
-        # Create user
-        new_user = await repo.create(
+        # Create user; the unique constraints on username/email replace the
+        # exists_* pre-checks, so the happy path is a single round trip
+        new_user = await repo.create_if_not_exists(
             username=user_data.username,
             email=user_data.email,
             password_hash=password_hash,
             is_active=user_data.is_active
         )
 
-        logger.info(f"Admin user {current_user['username']} created new admin user: {user_data.username}")
+        if new_user is None:
+            conflict = await repo.get_conflicting_field(user_data.username, user_data.email)
+            detail = {
+                "username": "Username already exists",
+                "email": "Email already exists",
+            }.get(conflict, "Username or email already exists")
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=detail
+            )
+
+        logger.info("Admin user %s created new admin user: %s", current_user["username"], user_data.username)
 
-        return {
-            "id": new_user["id"],
-            "username": new_user["username"],
-            "email": new_user["email"],
-            "is_active": new_user["is_active"],
-            "created_at": new_user["created_at"],
-            "updated_at": new_user["updated_at"],
-            "last_login": new_user["last_login"]
-        }
+        return ORJSONResponse(_admin_user_payload(new_user), status_code=status.HTTP_201_CREATED)
 
     except HTTPException:
         raise
@@ -161,7 +180,7 @@ async def create_admin_user(
         )
 
 
-@router.put("/{user_id}", response_model=AdminUserResponse)
+@router.put("/{user_id}", response_model=None, responses={200: {"model": AdminUserResponse}})
 async def update_admin_user(
     user_id: int,
     user_data: UpdateAdminUserRequest,
@@ -209,30 +228,24 @@ async def update_admin_user(
             update_data["email"] = user_data.email
 
         if user_data.password is not None:
-            # Hash new password
-            update_data["password_hash"] = hash_password(user_data.password)
+            # Hash new password (bcrypt runs on the password executor to keep the event loop free)
+            update_data["password_hash"] = await hash_password_async(user_data.password)
 
         if user_data.is_active is not None:
             update_data["is_active"] = user_data.is_active
 
-        # Update user
+        # Update user; RETURNING hands back the new row, so no re-fetch is needed
+        updated_user = None
         if update_data:
-            await repo.update(user_id, **update_data)
-
-        # Fetch updated user
-        updated_user = await repo.get_by_id(user_id)
+            updated_user = await repo.update(user_id, **update_data)
+            invalidate_admin_user_cache(user_id)
+        updated_user = updated_user or user
 
-        logger.info(f"Admin user {current_user['username']} updated admin user: {updated_user['username']}")
+        logger.info("Admin user %s updated admin user: %s", current_user["username"], updated_user["username"])
 
-        return {
-            "id": updated_user["id"],
-            "username": updated_user["username"],
-            "email": updated_user["email"],
-            "is_active": updated_user["is_active"],
-            "created_at": updated_user["created_at"],
-            "updated_at": updated_user["updated_at"],
-            "last_login": updated_user["last_login"]
-        }
+        # The payload keeps only AdminUserResponse fields, so the
+        # password_hash returned by get_by_id never reaches the response
+        return ORJSONResponse(_admin_user_payload(updated_user))
 
     except HTTPException:
         raise
@@ -260,27 +273,26 @@ async def delete_admin_user(
     try:
         repo = AdminUserRepository(db)
 
-        # Check if user exists
-        user = await repo.get_by_id(user_id)
-        if not user:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Admin user not found"
-            )
-
-        # Prevent self-deletion
+        # Prevent self-deletion (the current user always exists, so this
+        # needs no lookup and can run before the DELETE)
         if user_id == current_user["id"]:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Cannot delete your own account"
             )
 
-        # Delete user
-        await repo.delete(user_id)
+        # Delete user; RETURNING doubles as the existence check
+        username = await repo.delete(user_id)
+        if username is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Admin user not found"
+            )
+        invalidate_admin_user_cache(user_id)
 
-        logger.info(f"Admin user {current_user['username']} deleted admin user: {user['username']}")
+        logger.info("Admin user %s deleted admin user: %s", current_user["username"], username)
 
-        return {"message": f"Admin user {user['username']} deleted successfully"}
+        return {"message": f"Admin user {username} deleted successfully"}
 
     except HTTPException:
         raise
@@ -3,22 +3,29 @@ Affiliate Click Tracking API
 
 Provides endpoint to track affiliate link clicks for analytics.
 """
-from fastapi import APIRouter, Depends
-from pydantic import BaseModel, Field
-from typing import List, Optional
+import orjson
+from fastapi import APIRouter, Depends, Request
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Any, Dict, List, Optional
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.centralized_logger import get_logger
 from app.core.database import get_db
 from app.core.dependencies import check_rate_limit
 from app.models.affiliate_click import AffiliateClick
+from app.services.affiliate_click_buffer import enqueue_click
 
 logger = get_logger(__name__)
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 
 class ClickRequest(BaseModel):
-    """Affiliate click tracking request"""
+    """Affiliate click tracking request (schema only - /click validates with _parse_click)"""
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     provider: str = Field(..., max_length=100, description="Affiliate provider name")
     product_name: Optional[str] = Field(None, max_length=500, description="Product name")
     category: Optional[str] = Field(None, max_length=100, description="Product category")
@@ -26,8 +33,59 @@ class ClickRequest(BaseModel):
     session_id: Optional[str] = Field(None, max_length=255, description="User session ID")
 
 
+# (field, max_length, required) for the /click hot path, read once from
+# ClickRequest so the hand-rolled check and the documented schema agree
+_CLICK_FIELD_RULES = tuple(
+    (
+        name,
+        next(m.max_length for m in field.metadata if hasattr(m, "max_length")),
+        field.is_required(),
+    )
+    for name, field in ClickRequest.model_fields.items()
+)
+
+
+def _parse_click(body: bytes) -> Dict[str, Any]:
+    """
+    Decode and validate a /click body without building a Pydantic model
+
+    Enforces the ClickRequest rules (string types, max lengths, required
+    fields) and raises RequestValidationError so clients still get the
+    standard 422 response.
+    """
+    try:
+        data = orjson.loads(body)
+    except orjson.JSONDecodeError:
+        raise RequestValidationError([{"type": "json_invalid", "loc": ("body",), "msg": "JSON decode error", "input": {}}])
+    if not isinstance(data, dict):
+        raise RequestValidationError([{"type": "model_attributes_type", "loc": ("body",), "msg": "Input should be a valid dictionary", "input": data}])
+
+    click = {}
+    errors = []
+    for name, max_length, required in _CLICK_FIELD_RULES:
+        value = data.get(name)
+        if value is None:
+            if required:
+                errors.append({"type": "missing", "loc": ("body", name), "msg": "Field required", "input": data})
+        elif not isinstance(value, str):
+            errors.append({"type": "string_type", "loc": ("body", name), "msg": "Input should be a valid string", "input": value})
+        elif len(value) > max_length:
+            errors.append({
+                "type": "string_too_long",
+                "loc": ("body", name),
+                "msg": f"String should have at most {max_length} characters",
+                "input": value,
+                "ctx": {"max_length": max_length},
+            })
+        click[name] = value
+
+    if errors:
+        raise RequestValidationError(errors)
+    return click
+
+
 class ClickResponse(BaseModel):
-    """Affiliate click tracking response"""
+    """Affiliate click tracking response (schema only)"""
     tracked: bool
 
 
@@ -43,29 +101,43 @@ async def track_event(
     db: AsyncSession = Depends(get_db),
 ):
     """Track a named UI event (e.g., suggestion_click). Logs for now; no DB write required."""
-    logger.info(f"[affiliate] event={request.event} payload={request.payload}")
+    logger.info("[affiliate] event=%s payload=%s", request.event, request.payload)
     return {"status": "ok"}
 
 
-@router.post("/click", response_model=ClickResponse, dependencies=[Depends(check_rate_limit)])
-async def track_click(request: ClickRequest, db: AsyncSession = Depends(get_db)):
+@router.post(
+    "/click",
+    response_model=None,
+    responses={200: {"model": ClickResponse}},
+    dependencies=[Depends(check_rate_limit)],
+    # Neither the body (parsed by _parse_click) nor the response goes through
+    # Pydantic; ClickRequest/ClickResponse only document the schema
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": ClickRequest.model_json_schema()}},
+        }
+    },
+)
+async def track_click(request: Request, db: AsyncSession = Depends(get_db)):
     """Track an affiliate link click"""
+    click = _parse_click(await request.body())
+
+    # Normal path: buffered and written in batches by the click flusher
+    if enqueue_click(click):
+        return ORJSONResponse({"tracked": True})
+
+    # Flusher not running (e.g. scripts, tests) - write the click directly.
+    # Core insert: a write-only row needs no ORM unit-of-work/identity-map work.
     try:
-        click = AffiliateClick(
-            session_id=request.session_id,
-            provider=request.provider,
-            product_name=request.product_name,
-            category=request.category,
-            url=request.url,
-        )
-        db.add(click)
+        await db.execute(insert(AffiliateClick), click)
         await db.commit()
-        logger.info(f"Tracked affiliate click: {request.provider} - {request.product_name}")
-        return ClickResponse(tracked=True)
+        logger.info("Tracked affiliate click: %s - %s", click["provider"], click["product_name"])
+        return ORJSONResponse({"tracked": True})
     except Exception as e:
         logger.error(f"Failed to track affiliate click: {e}")
         await db.rollback()
-        return ClickResponse(tracked=False)
+        return ORJSONResponse({"tracked": False})
 
 
 class CJSearchRequest(BaseModel):
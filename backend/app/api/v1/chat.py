@@ -5,13 +5,18 @@ SSE streaming chat endpoint with LangGraph integration
 from fastapi import APIRouter, HTTPException, Depends, Request
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
-from typing import AsyncGenerator, Optional
+from typing import AsyncGenerator, Optional, get_type_hints
 import json
+import logging
+import operator
+import orjson
 import time
 from app.core.centralized_logger import get_logger
 import uuid
 import asyncio
-from datetime import datetime, date
+from collections import deque
+from datetime import datetime, timezone
+from contextlib import aclosing
 
 from app.schemas.graph_state import GraphState
 from app.services.langgraph.workflow import graph, AGENT_NAME_TO_INSTANCE
@@ -25,6 +30,8 @@ from sqlalchemy import select, desc, func
 from app.core.colored_logging import get_colored_logger
 from app.services.halt_state_manager import HaltStateManager
 from app.services.chat_history_manager import chat_history_manager
+from app.services.plan_executor import clear_tool_citation_callbacks
+from app.services.stage_telemetry import MAX_TOTAL_REQUEST_S
 
 
 async def _load_session_context(session_id: str) -> tuple[dict | None, list]:
@@ -36,15 +43,7 @@ async def _load_session_context(session_id: str) -> tuple[dict | None, list]:
     return halt_state_data, conversation_history
 
 
-class DateTimeEncoder(json.JSONEncoder):
-    """Custom JSON encoder that handles datetime and date objects"""
-    def default(self, obj):
-        if isinstance(obj, (datetime, date)):
-            return obj.isoformat()
-        return super().default(obj)
-
-
-def _sse_event(event_type: str, data: dict, encoder_cls=DateTimeEncoder) -> str:
+def _sse_event(event_type: str, data: dict) -> str:
     """
     Format a Server-Sent Event with a named event type.
 
@@ -53,25 +52,60 @@ def _sse_event(event_type: str, data: dict, encoder_cls=DateTimeEncoder) -> str:
         data: <json>\\n
         \\n
 
+    The payload is encoded with orjson, which serializes datetime/date values
+    natively (ISO 8601) and is several times faster than json.dumps on the
+    per-chunk streaming path.
+
     Args:
         event_type: SSE event name (status, content, artifact, done, error)
         data: Dict to JSON-encode as the event data payload
-        encoder_cls: Optional custom JSON encoder class
 
     Returns:
         Fully-formed SSE string ready to yield to the client
     """
     # Sanitize to prevent header injection via newlines
     safe_type = event_type.replace('\r', '').replace('\n', '')
-    json_payload = json.dumps(data, cls=encoder_cls)
+    json_payload = orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode()
     return f"event: {safe_type}\ndata: {json_payload}\n\n"
 
 
+# Invariant frames sent on every request, encoded once at import
+PLACEHOLDER_STATUS_SSE = _sse_event("status", {
+    "text": "Thinking...",
+    "agent": "init",
+    "step": 0,
+    "placeholder": True,
+})
+CLEAR_ARTIFACT_SSE = _sse_event("artifact", {"clear": True})
+
+
 logger = get_logger(__name__)
 colored_logger = get_colored_logger(__name__)
 
 router = APIRouter()
 
+# node name -> (short name, on_chain_start_message), built once so the
+# on_chain_start branch of the event loop is a single dict lookup
+AGENT_STATUS_CACHE: dict[str, tuple[str, str]] = {
+    name: (name.split("_")[-1], instance.on_chain_start_message)
+    for name, instance in AGENT_NAME_TO_INSTANCE.items()
+    if getattr(instance, "on_chain_start_message", None)
+}
+
+# astream_events types the chat stream acts on; everything else is skipped
+# with one set lookup
+_HANDLED_GRAPH_EVENTS = frozenset({"on_chain_start", "on_chain_end"})
+
+# result_state fields copied into the saved assistant message metadata when set
+_RESULT_METADATA_KEYS = ("citations", "intent", "status")
+
+# GraphState fields declared Annotated[..., operator.add]: LangGraph concatenates
+# node updates for these instead of overwriting, so the fallback merge must too
+_APPEND_REDUCER_FIELDS = frozenset(
+    name for name, hint in get_type_hints(GraphState, include_extras=True).items()
+    if operator.add in getattr(hint, "__metadata__", ())
+)
+
 # Retains references to fire-and-forget background tasks so they are not
 # garbage-collected before they complete.
 _background_tasks: set = set()
@@ -117,28 +151,30 @@ class ChatRequest(BaseModel):
     action: Optional[str] = None  # Optional action for button clicks (e.g., "consent_confirm")
 
 
-def is_consent_confirmation(request) -> bool:
+_CONSENT_PATTERNS = frozenset({"yes", "search deeper", "continue", "ok", "proceed", "go ahead"})
+
+
+def is_consent_confirmation(message: Optional[str], action: Optional[str] = None) -> bool:
     """Detect consent confirmations vs new queries.
 
     Used for two-layer consent flow when user needs to approve
     extended search (Tier 3-4) that may incur additional API costs.
 
     Args:
-        request: ChatRequest with message and optional action
+        message: User message text
+        action: Optional structured action from a button click
 
     Returns:
         True if this is a consent confirmation
     """
     # Structured payload from button click
-    if getattr(request, "action", None) == "consent_confirm":
+    if action == "consent_confirm":
         return True
 
     # Text-based confirmation
-    message = getattr(request, "message", None)
     if message:
-        consent_patterns = {"yes", "search deeper", "continue", "ok", "proceed", "go ahead"}
         normalized = message.strip().lower()
-        return normalized in consent_patterns or normalized.startswith("yes")
+        return normalized in _CONSENT_PATTERNS or normalized.startswith("yes")
 
     return False
 
@@ -176,6 +212,39 @@ async def _write_request_metric(metric_data: dict) -> None:
         logger.warning(f"[qos] Failed to write request metric: {e}")
 
 
+async def _flush_langfuse() -> None:
+    """Fire-and-forget: flush Langfuse traces in a worker thread (flush() blocks on network I/O)."""
+    try:
+        await asyncio.to_thread(langfuse_client.flush)
+        logger.debug("Langfuse traces flushed")
+    except Exception as flush_error:
+        logger.debug(f"Langfuse flush warning: {flush_error}")
+
+
+def _merge_node_output(state: dict, update: dict) -> None:
+    """Apply a node's state update to ``state`` the way the graph's reducers would."""
+    for key, value in update.items():
+        if key in _APPEND_REDUCER_FIELDS and isinstance(value, list):
+            state[key] = (state.get(key) or []) + value
+        else:
+            state[key] = value
+
+
+async def _events_until(events, deadline: float):
+    """Yield from ``events`` until exhausted; raise TimeoutError once the loop-time ``deadline`` passes.
+
+    The timeout scope covers only the wait for the next event, never the
+    ``yield`` — cancelling across a yield would land in the consumer's code.
+    """
+    while True:
+        async with asyncio.timeout_at(deadline):
+            try:
+                event = await anext(events)
+            except StopAsyncIteration:
+                return
+        yield event
+
+
 async def generate_chat_stream(
     message: str,
     session_id: str,
@@ -221,12 +290,7 @@ async def generate_chat_stream(
         )
 
         # Send initial placeholder message IMMEDIATELY
-        yield _sse_event("status", {
-            "text": "Thinking...",
-            "agent": "init",
-            "step": 0,
-            "placeholder": True,
-        })
+        yield PLACEHOLDER_STATUS_SSE
 
         # Load halt state and conversation history concurrently (no data dependency).
         # get_halt_state returns None when no halt exists, so it replaces the older
@@ -240,13 +304,7 @@ async def generate_chat_stream(
             # Check for consent_required halt (Tier 3-4 extended search)
             halt_reason = halt_state_data.get("halt_reason") if halt_state_data else None
             if halt_reason == "consent_required":
-                # Create a mock request object for consent detection
-                class MockRequest:
-                    def __init__(self, msg):
-                        self.message = msg
-                        self.action = None
-
-                if is_consent_confirmation(MockRequest(message)):
+                if is_consent_confirmation(message):
                     # User confirmed extended search
                     logger.info(f"[ChatEndpoint] User confirmed extended search for session {session_id}")
                     extended_search_confirmed = True
@@ -272,8 +330,8 @@ async def generate_chat_stream(
         logger.info(f"[ChatEndpoint] Loading conversation history for session {session_id}...")
         if conversation_history:
             logger.info(f"[ChatEndpoint] ✅ Loaded {len(conversation_history)} messages from conversation history for session {session_id}")
-            # Log first and last message for debugging
-            if len(conversation_history) > 0:
+            # Log first and last message for debugging (skip the slicing/formatting below INFO)
+            if logger.isEnabledFor(logging.INFO):
                 first_msg = conversation_history[0]
                 last_msg = conversation_history[-1]
                 logger.info(f"[ChatEndpoint] First message: role={first_msg.get('role')}, content_preview={first_msg.get('content', '')[:50]}...")
@@ -282,10 +340,10 @@ async def generate_chat_stream(
             logger.info(f"[ChatEndpoint] ❌ No conversation history found for session {session_id} (new conversation or empty history)")
 
         # Initialize graph state (TypedDict)
-        from datetime import datetime, timezone
-
-        # Initialize slots with country_code from request (if provided)
-        initial_slots = halt_state_data.get("slots", {}) if halt_state_data else {}
+        # Initialize slots with country_code from request (if provided).
+        # Copied: halt_state_data is the HaltStateManager cache entry, which the
+        # safety node reads again, so it must not be mutated here.
+        initial_slots = dict(halt_state_data.get("slots") or {}) if halt_state_data else {}
         if not initial_slots.get("country_code"):
             # Set country_code from request or default to settings
             initial_slots["country_code"] = country_code or settings.AMAZON_DEFAULT_COUNTRY
@@ -307,15 +365,14 @@ async def generate_chat_stream(
             "halt": False,  # Required field - reset to False so workflow can continue
             "plan": None,
             "slots": initial_slots,  # Initialize with country_code
-            "followups": halt_state_data.get("followups", []) if halt_state_data else [],
+            "followups": [],
             "policy_status": "allow",
             "extended_search_confirmed": extended_search_confirmed,  # Flag for tiered executor
             "sanitized_text": None,
             "redaction_map": {},
-            "intent": halt_state_data.get("intent") if halt_state_data else None,
+            "intent": None,
             "intro_text": None,
-            # Restore partial_items if resuming from consent halt
-            "search_results": halt_state_data.get("partial_items", []) if extended_search_confirmed else [],
+            "search_results": [],
             "search_query": None,
             "product_names": [],
             "review_aspects": [],
@@ -329,12 +386,12 @@ async def generate_chat_stream(
             "affiliate_products": {},
             "link_health": {},
             "comparison_table": None,
-            "travel_info": halt_state_data.get("travel_info", {}) if halt_state_data else {},
-            "hotels": halt_state_data.get("hotels", []) if halt_state_data else [],
-            "flights": halt_state_data.get("flights", []) if halt_state_data else [],
-            "cars": halt_state_data.get("cars", []) if halt_state_data else [],
-            "itinerary": halt_state_data.get("itinerary", []) if halt_state_data else [],
-            "travel_results": halt_state_data.get("travel_results") if halt_state_data else None,
+            "travel_info": {},
+            "hotels": [],
+            "flights": [],
+            "cars": [],
+            "itinerary": [],
+            "travel_results": None,
             "stream_chunk_data": None,
             # tool_timing ported from v3 (0bd88eb) 2026-04-21 — must be present
             # or LangGraph TypedDict channels crash. See schemas/graph_state.py.
@@ -346,8 +403,8 @@ async def generate_chat_stream(
             "next_suggestions": [],  # Follow-up questions from next_step_suggestion tool
             "agent_statuses": [],
             "tool_citations": [],  # Initialize tool citations list
-            "last_search_context": halt_state_data.get("last_search_context", {}) if halt_state_data else {},
-            "search_history": halt_state_data.get("search_history", []) if halt_state_data else [],
+            "last_search_context": {},
+            "search_history": [],
             "errors": [],
             "stage_telemetry": [],  # RFC §1.1 — populated by each agent node
             "metadata": {
@@ -360,8 +417,24 @@ async def generate_chat_stream(
             "created_at": datetime.now(timezone.utc),
         }
 
-        # Log restored state (state was already restored during initialization above)
+        # Restore halted fields on top of the defaults (only when resuming)
         if halt_state_data:
+            initial_state.update({
+                "followups": halt_state_data.get("followups", []),
+                "intent": halt_state_data.get("intent"),
+                "travel_info": halt_state_data.get("travel_info", {}),
+                "hotels": halt_state_data.get("hotels", []),
+                "flights": halt_state_data.get("flights", []),
+                "cars": halt_state_data.get("cars", []),
+                "itinerary": halt_state_data.get("itinerary", []),
+                "travel_results": halt_state_data.get("travel_results"),
+                "last_search_context": halt_state_data.get("last_search_context", {}),
+                "search_history": halt_state_data.get("search_history", []),
+            })
+            # Restore partial_items if resuming from consent halt
+            if extended_search_confirmed:
+                initial_state["search_results"] = halt_state_data.get("partial_items", [])
+
             logger.info("🔄 Resumed from HALT state")
             # Log slots from halt_state_data (not from initial_state, as they're removed from GraphState)
             slots = halt_state_data.get("slots", {})
@@ -371,143 +444,108 @@ async def generate_chat_stream(
         # Execute the workflow and stream intermediate states
         # Cost tracking is handled by langfuse_handler passed to graph.astream_events()
         # Citation logging handled per-instance by PlanExecutor (no global callbacks needed)
-        citation_buffer = []
-        workflow_running = True
-
-        # Event queue for streaming
-        from app.services.plan_executor import clear_tool_citation_callbacks
+        citation_buffer = deque()
 
-        # Background task that polls event stream
-        event_queue = asyncio.Queue()
         # RFC §1.1 — track whether the 60-second hard limit fired
         sse_total_timeout_hit = False
 
-        async def consume_events():
-            """Consume LangGraph events and put them in queue"""
-            nonlocal workflow_running
-            try:
-                async for event in graph.astream_events(initial_state, version="v2", config={"callbacks": [langfuse_handler]}):
-                    await event_queue.put(event)
-            finally:
-                workflow_running = False
-                await event_queue.put(None)  # Sentinel value
-
-        # Start event consumer in background
-        event_task = asyncio.create_task(consume_events())
-
         # Use astream_events to get intermediate node executions WITH start/end events
         result_state = None
+        # Last-known state merged from node outputs, used if the terminal
+        # LangGraph on_chain_end event is never seen
+        node_state: dict = {}
         last_node_name = None
         data_already_streamed = False  # Track if we already streamed any data (from stream_chunk_data)
 
         # RFC §1.1 — enforce 60-second hard limit on the entire SSE connection.
-        # asyncio.wait_for cannot wrap an async generator, so the deadline is
-        # enforced inline inside _drain_event_loop on every iteration.
-        from app.services.stage_telemetry import MAX_TOTAL_REQUEST_S
+        # The deadline is a timer (asyncio.timeout_at), not a per-event check, so
+        # it fires even while a node is stuck in an LLM/tool call emitting nothing.
 
         async def _drain_event_loop():
-            """Drain the event queue until the workflow sentinel arrives or the 60-second hard cap fires."""
-            nonlocal result_state, last_node_name, data_already_streamed, sse_total_timeout_hit
-            # RFC §1.1 — enforce hard cap by checking elapsed time on every iteration.
-            # asyncio.wait_for cannot wrap an async generator directly, so the deadline
-            # is enforced inline: the check fires within one CHAT_EVENT_QUEUE_TIMEOUT
-            # tick of MAX_TOTAL_REQUEST_S.
-            deadline = stream_start_time + MAX_TOTAL_REQUEST_S
-            # Main loop: check both citation buffer and event queue
-            while True:
-                # RFC §1.1 — abort if the wall-clock deadline has passed
-                if time.time() >= deadline:
+            """Iterate graph events until the workflow finishes or the 60-second hard cap fires."""
+            nonlocal result_state, node_state, last_node_name, data_already_streamed, sse_total_timeout_hit
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + (stream_start_time + MAX_TOTAL_REQUEST_S - time.time())
+            events = graph.astream_events(initial_state, version="v2", config={"callbacks": [langfuse_handler]})
+            # aclosing: stopping on the hard cap must also shut the graph run down
+            async with aclosing(events):
+                try:
+                    async for event in _events_until(events, deadline):
+                        # Drain citation buffer (log only, don't stream to frontend)
+                        while citation_buffer:
+                            citation = citation_buffer.popleft()
+                            tool_name = citation.get("tool", "")
+                            message = citation.get("message", "")
+                            if message:
+                                logger.info("Tool citation (suppressed): %s - %s", tool_name, message)
+
+                        # Most events (on_llm_*, on_tool_*, on_chat_model_stream, ...) are ignored
+                        event_type = event.get("event")
+                        if event_type not in _HANDLED_GRAPH_EVENTS:
+                            continue
+                        event_name = event.get("name", "")
+
+                        # Detect when agents START (on_chain_start) - log only
+                        if event_type == "on_chain_start":
+                            agent_status = AGENT_STATUS_CACHE.get(event_name)
+                            if agent_status:
+                                agent_short_name, start_message = agent_status
+                                logger.info("Agent status (suppressed): %s - %s", event_name, start_message)
+                                last_node_name = agent_short_name
+
+                        # Detect when nodes complete
+                        elif event_type == "on_chain_end":
+                            if event_name == "LangGraph":
+                                result_state = event.get("data", {}).get("output", {})
+                            else:
+                                output_data = event.get("data", {}).get("output", {})
+
+                                # Only graph nodes (not nested chains inside them) emit state updates
+                                if isinstance(output_data, dict) and event.get("metadata", {}).get("langgraph_node") == event_name:
+                                    _merge_node_output(node_state, output_data)
+
+                                # STREAM DATA IMMEDIATELY if agent returned stream_chunk_data
+                                if isinstance(output_data, dict):
+                                    stream_data = output_data.get("stream_chunk_data")
+                                    if stream_data:
+                                        data_type = stream_data.get("type")
+                                        data_content = stream_data.get("data")
+
+                                        # Emit tool citations as status messages for progress indicator
+                                        if data_type == "tool_citation" and isinstance(data_content, dict):
+                                            citation_message = data_content.get("message", "")
+                                            if citation_message:
+                                                yield _sse_event("status", {"text": citation_message})
+                                                logger.info("Streamed status: %s", citation_message)
+                                        elif data_type and data_content:
+                                            artifact_payload = {
+                                                "type": data_type,
+                                                "blocks": data_content,
+                                                "clear": True,
+                                            }
+                                            if stream_data.get("create_new_message"):
+                                                artifact_payload["create_new_message"] = True
+                                            yield _sse_event("artifact", artifact_payload)
+
+                                            data_already_streamed = True
+                                            logger.info("Streamed %s from %s", data_type, event_name)
+
+                                if isinstance(output_data, dict) and output_data.get("next_agent") == "travel_planner":
+                                    logger.info("Travel planner status (suppressed): from %s", event_name)
+                                    last_node_name = "planner"
+                except TimeoutError:
                     sse_total_timeout_hit = True
                     logger.error(
                         f"[stage_telemetry] SSE total 60s hard limit exceeded for session {session_id}"
-                        " — cancelling background event consumer"
+                        " — stopping graph event stream"
                     )
-                    event_task.cancel()
-                    break
-
-                # Drain citation buffer (log only, don't stream to frontend)
-                while citation_buffer:
-                    citation = citation_buffer.pop(0)
-                    tool_name = citation.get("tool", "")
-                    message = citation.get("message", "")
-                    if message:
-                        logger.info(f"Tool citation (suppressed): {tool_name} - {message}")
-
-                # Then try to get event with short timeout
-                try:
-                    event = await asyncio.wait_for(event_queue.get(), timeout=settings.CHAT_EVENT_QUEUE_TIMEOUT)
-                    if event is None:  # Sentinel - workflow finished
-                        break
-                except asyncio.TimeoutError:
-                    # No event yet, loop back to check citations
-                    continue
-
-                event_type = event.get("event")
-                event_name = event.get("name", "")
-
-                # Detect when agents START (on_chain_start) - log only
-                if event_type == "on_chain_start":
-                    agent_instance = AGENT_NAME_TO_INSTANCE.get(event_name)
-                    if agent_instance and hasattr(agent_instance, 'on_chain_start_message') and agent_instance.on_chain_start_message:
-                        agent_short_name = event_name.split("_")[-1] if "_" in event_name else event_name
-                        logger.info(f"Agent status (suppressed): {event_name} - {agent_instance.on_chain_start_message}")
-                        last_node_name = agent_short_name
-
-                # Detect when nodes complete
-                elif event_type == "on_chain_end":
-                    if event_name == "LangGraph":
-                        result_state = event.get("data", {}).get("output", {})
-                    else:
-                        output_data = event.get("data", {}).get("output", {})
-
-                        # STREAM DATA IMMEDIATELY if agent returned stream_chunk_data
-                        if isinstance(output_data, dict):
-                            stream_data = output_data.get("stream_chunk_data")
-                            if stream_data:
-                                data_type = stream_data.get("type")
-                                data_content = stream_data.get("data")
-
-                                # Emit tool citations as status messages for progress indicator
-                                if data_type == "tool_citation" and isinstance(data_content, dict):
-                                    citation_message = data_content.get("message", "")
-                                    if citation_message:
-                                        yield _sse_event("status", {"text": citation_message})
-                                        logger.info(f"Streamed status: {citation_message}")
-                                elif data_type and data_content:
-                                    artifact_payload = {
-                                        "type": data_type,
-                                        "blocks": data_content,
-                                        "clear": True,
-                                    }
-                                    if stream_data.get("create_new_message"):
-                                        artifact_payload["create_new_message"] = True
-                                    yield _sse_event("artifact", artifact_payload)
-
-                                    data_already_streamed = True
-                                    logger.info(f"Streamed {data_type} from {event_name}")
-
-                        if isinstance(output_data, dict) and output_data.get("next_agent") == "travel_planner":
-                            logger.info(f"Travel planner status (suppressed): from {event_name}")
-                            last_node_name = "planner"
 
         try:
-            # RFC §1.1 — drain; the 60-second hard cap fires inside _drain_event_loop
-            # on every iteration, so this loop is always bounded by MAX_TOTAL_REQUEST_S
-            # plus at most one CHAT_EVENT_QUEUE_TIMEOUT tick.
+            # RFC §1.1 — _drain_event_loop stops itself when the 60-second hard cap fires
             async for sse_chunk in _drain_event_loop():
                 yield sse_chunk
-        except Exception:
-            pass  # handled below
-
-        # RFC §1.1 — await background task to surface any exception.
-        # If the hard cap fired, event_task was already cancelled inside _drain_event_loop;
-        # CancelledError is expected and swallowed here.
-        try:
-            await event_task
-        except asyncio.CancelledError:
-            pass  # expected when hard cap cancels event_task inside _drain_event_loop
         except Exception as exc:
-            logger.warning(f"[stage_telemetry] Background event consumer raised an unexpected error: {exc}")
+            logger.warning(f"[stage_telemetry] Graph event stream raised an unexpected error: {exc}")
 
         # RFC §1.1 — if the 60-second hard cap fired, terminate the stream immediately
         if sse_total_timeout_hit:
@@ -519,16 +557,30 @@ async def generate_chat_stream(
             })
             return
 
-        # Drain any remaining citations (log only)
-        while citation_buffer:
-            citation = citation_buffer.pop(0)
-            logger.info(f"Remaining citation (suppressed): {citation.get('tool')} - {citation.get('message')}")
+        # Drain any remaining citations (log only, one line for the whole batch)
+        if citation_buffer:
+            logger.info(
+                "Remaining citations (suppressed): %s",
+                [(c.get("tool"), c.get("message")) for c in citation_buffer],
+            )
+            citation_buffer.clear()
 
-        # Fallback: if we didn't get final state from events, use astream to get it
+        # Fallback: if we didn't get final state from events, rebuild it from the
+        # node outputs we saw. Never re-run the graph - that would repeat every
+        # LLM/tool call (and its cost) for the request.
         if not result_state:
-            logger.warning("⚠️ No final state from astream_events, falling back to astream")
-            async for state_update in graph.astream(initial_state, config={"callbacks": [langfuse_handler]}):
-                result_state = state_update
+            if not node_state:
+                logger.error(f"No final state from astream_events for session {session_id}")
+                clear_tool_citation_callbacks()
+                yield _sse_event("error", {
+                    "code": "internal_error",
+                    "message": "Something went wrong. If this issue persists please try again.",
+                    "recoverable": True,
+                })
+                return
+            logger.warning("⚠️ No final state from astream_events, using merged node outputs")
+            result_state = dict(initial_state)
+            _merge_node_output(result_state, node_state)
 
         # Clear callbacks after workflow completes
         clear_tool_citation_callbacks()
@@ -536,18 +588,12 @@ async def generate_chat_stream(
         # DEBUG: Log result_state keys
         logger.info(f"🔍 DEBUG: result_state keys: {list(result_state.keys())}")
 
-        # Prepare SINGLE consolidated log with ALL metrics
-        assistant_text = result_state.get('assistant_text') or ''
-        detected_intent = result_state.get("intent", "unknown")
-
-        # Get CallbackHandler trace data
-        langfuse_trace_url = None
+        # Get CallbackHandler trace (needed for request_id tagging even when the log below is off)
+        trace = None
         if langfuse_handler:
             try:
-                # Get the trace URL from CallbackHandler
                 trace = langfuse_handler.trace
                 if trace:
-                    langfuse_trace_url = f"https://cloud.langfuse.com/trace/{trace.id}"
                     # RFC §4.1 — tag the Langfuse trace with the correlation request_id
                     # so it can be looked up via GET /v1/admin/trace/:interaction_id
                     if langfuse_client:
@@ -559,26 +605,27 @@ async def generate_chat_stream(
                         except Exception as tag_err:
                             logger.debug(f"Could not tag Langfuse trace: {tag_err}")
             except Exception as e:
-                logger.debug(f"Could not get langfuse trace URL: {e}")
+                logger.debug(f"Could not get langfuse trace: {e}")
 
-        # SINGLE CONSOLIDATED LOG - All data in one place
+        # SINGLE CONSOLIDATED LOG - All data in one place (only built when INFO is enabled)
         # Cost/token metrics are tracked by Langfuse CallbackHandler and visible in trace URL
-        consolidated_log = {
-            "event": "query_completed",
-            "request_id": request_id,  # RFC §4.1 correlation ID
-            "session_id": session_id,
-            "conversation_id": conversation_id,
-            "query": message[:200],
-            "intent": detected_intent,
-            "status": result_state.get("status", "unknown"),
-            "final_agent": result_state.get("current_agent"),
-            "response_length": len(assistant_text),
-            # Langfuse tracking (token/cost data available in trace)
-            "langfuse_trace_url": langfuse_trace_url,
-        }
+        if colored_logger.isEnabledFor(logging.INFO):
+            consolidated_log = {
+                "event": "query_completed",
+                "request_id": request_id,  # RFC §4.1 correlation ID
+                "session_id": session_id,
+                "conversation_id": conversation_id,
+                "query": message[:200],
+                "intent": result_state.get("intent", "unknown"),
+                "status": result_state.get("status", "unknown"),
+                "final_agent": result_state.get("current_agent"),
+                "response_length": len(result_state.get("assistant_text") or ""),
+                # Langfuse tracking (token/cost data available in trace)
+                "langfuse_trace_url": f"https://cloud.langfuse.com/trace/{trace.id}" if trace else None,
+            }
 
-        # Log consolidated response metrics in YELLOW
-        colored_logger.api_output(consolidated_log, endpoint="/v1/chat/stream")
+            # Log consolidated response metrics in YELLOW
+            colored_logger.api_output(consolidated_log, endpoint="/v1/chat/stream")
 
         # Clear halt state if workflow completed successfully (not halted)
         # NOTE: We don't save halt state here because agents handle that themselves
@@ -609,7 +656,7 @@ async def generate_chat_stream(
         elif not data_already_streamed:
             # Clear placeholder ONLY if we haven't already streamed data
             # (If data was streamed, we want to keep it and append followups below it)
-            yield _sse_event("artifact", {"clear": True})
+            yield CLEAR_ARTIFACT_SSE
         else:
             logger.info("🔍 Skipping clear chunk - data already streamed, will append followups")
 
@@ -619,10 +666,12 @@ async def generate_chat_stream(
         if should_stream_text:
             logger.info(f"🔍 DEBUG: Streaming response text ({len(response_text)} chars)")
             # Chunked emission — preserves progressive UX feel without per-char tax
-            STREAM_CHUNK_SIZE = 24  # ~24 chars per chunk ≈ a few words at a time
-            for i in range(0, len(response_text), STREAM_CHUNK_SIZE):
-                yield _sse_event("content", {"token": response_text[i:i + STREAM_CHUNK_SIZE]})
-                await asyncio.sleep(0.02)  # 20ms typing effect between chunks
+            chunk_size = settings.CHAT_STREAM_CHUNK_SIZE  # ~24 chars per chunk ≈ a few words at a time
+            delay = settings.CHAT_STREAM_SLEEP_DELAY  # optional typing effect; 0 by default
+            for i in range(0, len(response_text), chunk_size):
+                yield _sse_event("content", {"token": response_text[i:i + chunk_size]})
+                if delay > 0:
+                    await asyncio.sleep(delay)
         else:
             logger.info(f"🔍 DEBUG: Skipping text streaming (halted={is_halted}, has_text={bool(response_text)}, data_streamed={data_already_streamed})")
 
@@ -771,12 +820,7 @@ async def generate_chat_stream(
             assistant_metadata["ui_blocks"] = ui_blocks
         if next_suggestions:
             assistant_metadata["next_suggestions"] = next_suggestions
-        if result_state.get("citations"):
-            assistant_metadata["citations"] = result_state.get("citations")
-        if result_state.get("intent"):
-            assistant_metadata["intent"] = result_state.get("intent")
-        if result_state.get("status"):
-            assistant_metadata["status"] = result_state.get("status")
+        assistant_metadata.update({k: v for k in _RESULT_METADATA_KEYS if (v := result_state.get(k))})
 
         _save_task = asyncio.create_task(
             chat_history_manager.save_turn(
@@ -791,13 +835,11 @@ async def generate_chat_stream(
         _save_task.add_done_callback(_background_tasks.discard)
         logger.info(f"[ChatEndpoint] Scheduled turn persistence for session {session_id}")
 
-        # Flush Langfuse traces immediately after request completes
+        # Flush Langfuse traces off the event loop so the stream closes without waiting on it
         if langfuse_handler:
-            try:
-                langfuse_client.flush()
-                logger.debug("Langfuse traces flushed")
-            except Exception as flush_error:
-                logger.debug(f"Langfuse flush warning: {flush_error}")
+            _flush_task = asyncio.create_task(_flush_langfuse())
+            _background_tasks.add(_flush_task)
+            _flush_task.add_done_callback(_background_tasks.discard)
 
     except Exception as e:
         # Log error with centralized logger including RFC §4.1 correlation ID
@@ -857,53 +899,46 @@ async def list_conversations(
                 "conversations": []
             }
 
-        # Build base query
-        first_msg_subq = (
-            select(
-                ConversationMessage.session_id,
-                func.min(ConversationMessage.sequence_number).label('first_seq')
-            )
-            .group_by(ConversationMessage.session_id)
-            .subquery()
-        )
-
-        # Get conversations with first message content
-        stmt = (
-            select(
-                ConversationMessage.session_id,
-                ConversationMessage.content,
-                ConversationMessage.created_at,
-                func.count(ConversationMessage.id).over(partition_by=ConversationMessage.session_id).label('message_count')
-            )
-            .join(
-                first_msg_subq,
-                (ConversationMessage.session_id == first_msg_subq.c.session_id) &
-                (ConversationMessage.sequence_number == first_msg_subq.c.first_seq)
-            )
-            .where(ConversationMessage.role == 'user')
+        # Rank each session's messages in one pass: rn = 1 is the first message,
+        # message_count is the session total. The session filter is applied
+        # inside the CTE so other sessions are never scanned.
+        ranked = select(
+            ConversationMessage.session_id,
+            ConversationMessage.role,
+            ConversationMessage.content,
+            ConversationMessage.created_at,
+            func.row_number().over(
+                partition_by=ConversationMessage.session_id,
+                order_by=ConversationMessage.sequence_number,
+            ).label('rn'),
+            func.count().over(partition_by=ConversationMessage.session_id).label('message_count'),
         )
 
         # SECURITY: Filter by allowed session_ids if not admin
         if not is_admin and allowed_sessions:
-            stmt = stmt.where(ConversationMessage.session_id.in_(allowed_sessions))
+            ranked = ranked.where(ConversationMessage.session_id.in_(allowed_sessions))
 
-        stmt = stmt.order_by(desc(ConversationMessage.created_at)).limit(50)
+        ranked = ranked.cte('ranked')
+
+        # Conversations start with a user message; list the newest first
+        stmt = (
+            select(ranked.c.session_id, ranked.c.content, ranked.c.created_at, ranked.c.message_count)
+            .where(ranked.c.rn == 1, ranked.c.role == 'user')
+            .order_by(desc(ranked.c.created_at))
+            .limit(50)
+        )
 
         result = await db.execute(stmt)
-        rows = result.all()
-
-        conversations = []
-        seen_sessions = set()
-
-        for row in rows:
-            if row.session_id not in seen_sessions:
-                seen_sessions.add(row.session_id)
-                conversations.append({
-                    "session_id": row.session_id,
-                    "preview": row.content[:100] + "..." if len(row.content) > 100 else row.content,
-                    "created_at": row.created_at.isoformat() if row.created_at else None,
-                    "message_count": row.message_count
-                })
+
+        conversations = [
+            {
+                "session_id": row.session_id,
+                "preview": row.content[:100] + "..." if len(row.content) > 100 else row.content,
+                "created_at": row.created_at.isoformat() if row.created_at else None,
+                "message_count": row.message_count
+            }
+            for row in result
+        ]
 
         logger.info(f"Listed {len(conversations)} conversations (admin={is_admin}, session_filter={session_id is not None})")
 
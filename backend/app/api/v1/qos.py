@@ -12,18 +12,62 @@ Alert thresholds (RFC §4.2: p95 > 30s for 5 min):
     The SLO targets embedded in this response can be used to configure alert rules
     against the structured [qos] log lines emitted to stdout.
 """
+import json
+from typing import Any, Dict, Optional
+
 from fastapi import APIRouter, Depends
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.centralized_logger import get_logger
+from app.core.config import settings
 from app.core.database import get_db
 from app.core.dependencies import require_admin
+from app.core.redis_client import get_redis
 
 
 logger = get_logger(__name__)
 router = APIRouter()
 
+# PERCENTILE_DISC: durations are whole milliseconds, so interpolating between
+# neighbouring rows (PERCENTILE_CONT) adds sort-side work for no useful precision
+QOS_SUMMARY_SQL = text("""
+    SELECT
+        COUNT(*) AS total_requests,
+        PERCENTILE_DISC(0.50) WITHIN GROUP (ORDER BY total_duration_ms) AS p50_ms,
+        PERCENTILE_DISC(0.95) WITHIN GROUP (ORDER BY total_duration_ms) AS p95_ms,
+        PERCENTILE_DISC(0.99) WITHIN GROUP (ORDER BY total_duration_ms) AS p99_ms,
+        AVG(CASE WHEN total_duration_ms IS NOT NULL THEN 1.0 ELSE 0.0 END) AS completion_rate,
+        AVG(CASE WHEN completeness != 'full' THEN 1.0 ELSE 0.0 END) AS degraded_rate,
+        COUNT(*) FILTER (
+            WHERE provider_errors IS NOT NULL AND jsonb_array_length(provider_errors) > 0
+        ) AS rows_with_provider_errors
+    FROM request_metrics
+    WHERE created_at > NOW() - (:hours * INTERVAL '1 hour')
+""")
+
+QOS_SUMMARY_CACHE_KEY = "qos:summary"
+
+
+async def _get_cached_summary(cache_key: str) -> Optional[Dict[str, Any]]:
+    """Return a cached QoS summary from Redis, or None on miss/Redis unavailable"""
+    try:
+        redis = await get_redis()
+        cached = await redis.get(cache_key)
+    except Exception as e:
+        logger.warning(f"[qos] Summary cache read failed for {cache_key}: {e}")
+        return None
+    return json.loads(cached) if cached else None
+
+
+async def _set_cached_summary(cache_key: str, payload: Dict[str, Any]) -> None:
+    """Store a QoS summary in Redis for ADMIN_METRICS_CACHE_TTL seconds (best effort)"""
+    try:
+        redis = await get_redis()
+        await redis.setex(cache_key, settings.ADMIN_METRICS_CACHE_TTL, json.dumps(payload, default=str))
+    except Exception as e:
+        logger.warning(f"[qos] Summary cache write failed for {cache_key}: {e}")
+
 
 @router.get("/admin/qos/summary")
 async def get_qos_summary(
@@ -54,51 +98,30 @@ async def get_qos_summary(
     # Clamp hours to a safe range to prevent runaway queries
     hours = max(1, min(hours, 8760))  # 1 hour to 1 year
 
-    result = await db.execute(
-        text("""
-            SELECT
-                COUNT(*) AS total_requests,
-                PERCENTILE_CONT(0.50) WITHIN GROUP (ORDER BY total_duration_ms) AS p50_ms,
-                PERCENTILE_CONT(0.95) WITHIN GROUP (ORDER BY total_duration_ms) AS p95_ms,
-                PERCENTILE_CONT(0.99) WITHIN GROUP (ORDER BY total_duration_ms) AS p99_ms,
-                AVG(CASE WHEN total_duration_ms IS NOT NULL THEN 1.0 ELSE 0.0 END) AS completion_rate,
-                AVG(CASE WHEN completeness != 'full' THEN 1.0 ELSE 0.0 END) AS degraded_rate
-            FROM request_metrics
-            WHERE created_at > NOW() - (:hours * INTERVAL '1 hour')
-        """),
-        {"hours": hours},
+    logger.info(
+        "[qos] summary requested",
+        extra={"admin": admin.get("username"), "window_hours": hours},
     )
 
+    # Dashboards poll this endpoint; the window barely moves between polls, so
+    # serve a recent result (ADMIN_METRICS_CACHE_TTL) instead of re-aggregating
+    cache_key = f"{QOS_SUMMARY_CACHE_KEY}:{hours}"
+    cached = await _get_cached_summary(cache_key)
+    if cached is not None:
+        return cached
+
+    # One scan of the window computes latency, reliability and the provider-error
+    # count. provider_errors uses jsonb_array_length to detect non-empty arrays;
+    # per-provider breakdown requires §1.1 stage telemetry (tool_name +
+    # timeout_hit fields), so this is an aggregate rate in the interim.
+    result = await db.execute(QOS_SUMMARY_SQL, {"hours": hours})
     row = result.fetchone()
 
-    # Second query: count rows that have any provider errors logged.
-    # Uses jsonb_array_length to detect non-empty provider_errors arrays.
-    # Per-provider breakdown requires §1.1 stage telemetry (tool_name +
-    # timeout_hit fields); this query provides an aggregate rate in the interim.
-    pe_result = await db.execute(
-        text("""
-            SELECT
-                COUNT(*) AS rows_with_provider_errors
-            FROM request_metrics
-            WHERE created_at > NOW() - (:hours * INTERVAL '1 hour')
-              AND provider_errors IS NOT NULL
-              AND jsonb_array_length(provider_errors) > 0
-        """),
-        {"hours": hours},
-    )
-
-    pe_row = pe_result.fetchone()
-
     total = int(row.total_requests or 0)
-    rows_with_errors = int(pe_row.rows_with_provider_errors or 0) if pe_row else 0
+    rows_with_errors = int(row.rows_with_provider_errors or 0)
     provider_error_rate = rows_with_errors / total if total > 0 else 0.0
 
-    logger.info(
-        "[qos] summary requested",
-        extra={"admin": admin.get("username"), "window_hours": hours},
-    )
-
-    return {
+    summary = {
         "window_hours": hours,
         "total_requests": total,
         "latency": {
@@ -130,3 +153,6 @@ async def get_qos_summary(
             "target": 0.01,  # < 1% per RFC §4.2
         },
     }
+
+    await _set_cached_summary(cache_key, summary)
+    return summary
@@ -4,7 +4,7 @@ Telemetry Endpoints — RFC §4.1 Unified Trace Model
 POST /v1/telemetry/render  — accept frontend render milestones for p95 TTFC calculation
 GET  /v1/admin/trace/:id   — admin stub to look up a correlated trace by interaction ID
 """
-import re
+import uuid
 
 from fastapi import APIRouter, Depends, Path
 from pydantic import BaseModel, field_validator
@@ -16,10 +16,8 @@ from app.core.dependencies import require_admin, check_rate_limit
 logger = get_logger(__name__)
 router = APIRouter()
 
-_UUID_RE = re.compile(
-    r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$',
-    re.IGNORECASE,
-)
+# Canonical lowercase UUID, shared by the trace Path parameter
+_UUID_PATTERN = r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$'
 
 
 # ---------------------------------------------------------------------------
@@ -38,9 +36,15 @@ class RenderMilestones(BaseModel):
     @field_validator("interaction_id")
     @classmethod
     def must_be_uuid(cls, v: str) -> str:
-        if not _UUID_RE.match(v):
+        # uuid.UUID also accepts braces, "urn:uuid:" and unhyphenated hex, so
+        # require the canonical hyphenated form (any case) on top of parsing
+        try:
+            normalized = str(uuid.UUID(v))
+        except ValueError:
             raise ValueError("interaction_id must be a UUID")
-        return v
+        if normalized != v.lower():
+            raise ValueError("interaction_id must be a UUID")
+        return normalized
 
 
 # ---------------------------------------------------------------------------
@@ -94,9 +98,7 @@ async def record_render_milestones(
 
 @router.get("/admin/trace/{interaction_id}")
 async def get_trace(
-    interaction_id: str = Path(
-        pattern=r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$',
-    ),
+    interaction_id: str = Path(pattern=_UUID_PATTERN),
     admin: dict = Depends(require_admin),
 ):
     """
@@ -12,49 +12,16 @@ Usage:
 """
 import logging
 from typing import Optional
-from app.core.logging_config import is_logging_enabled
 
 
 class CentralizedLogger(logging.Logger):
     """
-    Custom logger that respects the global LOG_ENABLED flag.
-    All log methods check if logging is enabled before proceeding.
-    """
+    Application logger class.
 
-    def _log_if_enabled(self, level, msg, args, **kwargs):
-        """Internal method that checks if logging is enabled before logging"""
-        if is_logging_enabled():
-            super()._log(level, msg, args, **kwargs)
-
-    def debug(self, msg, *args, **kwargs):
-        """Log debug message if logging is enabled"""
-        if is_logging_enabled():
-            super().debug(msg, *args, **kwargs)
-
-    def info(self, msg, *args, **kwargs):
-        """Log info message if logging is enabled"""
-        if is_logging_enabled():
-            super().info(msg, *args, **kwargs)
-
-    def warning(self, msg, *args, **kwargs):
-        """Log warning message if logging is enabled"""
-        if is_logging_enabled():
-            super().warning(msg, *args, **kwargs)
-
-    def error(self, msg, *args, **kwargs):
-        """Log error message if logging is enabled"""
-        if is_logging_enabled():
-            super().error(msg, *args, **kwargs)
-
-    def critical(self, msg, *args, **kwargs):
-        """Log critical message if logging is enabled"""
-        if is_logging_enabled():
-            super().critical(msg, *args, **kwargs)
-
-    def exception(self, msg, *args, **kwargs):
-        """Log exception if logging is enabled"""
-        if is_logging_enabled():
-            super().exception(msg, *args, **kwargs)
+    The global LOG_ENABLED flag is enforced with logging.disable() (see
+    set_logging_enabled), so the stdlib level check short-circuits disabled
+    calls without any per-call Python override here.
+    """
 
 
 # Set the custom logger class
@@ -67,6 +67,10 @@ class ColoredLogger:
     def __init__(self, logger: logging.Logger):
         self.logger = logger
 
+    def isEnabledFor(self, level: int) -> bool:
+        """Whether the wrapped logger emits records at this level."""
+        return self.logger.isEnabledFor(level)
+
     def _format_dict(self, data: Dict[str, Any], indent: int = None) -> str:
         """Format dictionary for pretty printing."""
         import json
@@ -130,6 +134,9 @@ class ColoredLogger:
 
     def api_output(self, data: Any, endpoint: Optional[str] = None, **kwargs):
         """Log API output in YELLOW."""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+
         message_parts = []
 
         if endpoint:
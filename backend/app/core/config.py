@@ -55,6 +55,8 @@ class Settings(BaseSettings):
     DB_POOL_SIZE: int = Field(default=10, description="Database connection pool size per worker (reduced from 50 — Postgres default max_connections=100 was exhausted at 2+ workers)")
     DB_MAX_OVERFLOW: int = Field(default=5, description="Database connection pool max overflow per worker (reduced from 50)")
     DB_POOL_RECYCLE: int = Field(default=3600, description="Database connection recycle time in seconds")
+    DB_POOL_TIMEOUT: int = Field(default=10, description="Seconds to wait for a pooled connection before failing the request (SQLAlchemy default is 30)")
+    DB_USE_NULL_POOL: bool = Field(default=False, description="Open a fresh connection per session instead of pooling; use when an external pooler such as PgBouncer (transaction mode) sits in front of Postgres")
     DB_CONNECT_TIMEOUT: int = Field(default=10, description="Database connection timeout in seconds")
 
     # Redis
@@ -301,6 +303,11 @@ class Settings(BaseSettings):
     # IP Geolocation
     IPINFO_TOKEN: str = Field(default="", description="IPInfo.io API token for IP geolocation")
 
+    # Affiliate Click Tracking
+    AFFILIATE_CLICK_BATCH_SIZE: int = Field(default=100, description="Maximum affiliate clicks written per batched INSERT")
+    AFFILIATE_CLICK_FLUSH_INTERVAL: float = Field(default=0.5, description="Seconds a partial batch of affiliate clicks may wait before it is flushed")
+    AFFILIATE_CLICK_QUEUE_SIZE: int = Field(default=10000, description="Maximum buffered affiliate clicks; clicks beyond this are dropped")
+
     # Affiliate Links Display Configuration
     SHOW_AFFILIATE_LINKS_PER_PRODUCT: bool = Field(
         default=False,
@@ -345,10 +352,18 @@ class Settings(BaseSettings):
         description="Maximum number of concurrent link health checks"
     )
 
+    # Admin Dashboard Aggregates
+    POPULAR_QUERIES_REFRESH_MINUTES: int = Field(
+        default=5,
+        description="Interval in minutes between refreshes of the mv_popular_queries_24h materialized view (0 disables)"
+    )
+
     # Logging Configuration
     LOG_ENABLED: bool = Field(default=True, description="Enable/disable all logging in the application")
     LOG_LEVEL: str = Field(default="INFO", description="Log level: DEBUG, INFO, WARNING, ERROR, CRITICAL")
     LOG_FORMAT: str = Field(default="colored", description="Log format: json or colored")
+    ENABLE_QUERY_COUNTER: bool = Field(default=False, description="Dev only: count SQL queries per request and warn above QUERY_COUNT_WARN_THRESHOLD (N+1 detection)")
+    QUERY_COUNT_WARN_THRESHOLD: int = Field(default=10, description="Queries per request above which the query counter logs a warning")
 
     # Config Encryption
     CONFIG_ENCRYPTION_KEY: str = Field(default="", description="Master encryption key for sensitive config values in database (Fernet key)")
@@ -359,6 +374,8 @@ class Settings(BaseSettings):
     LANGFUSE_SECRET_KEY: str = Field(default="", description="Langfuse secret key")
     LANGFUSE_HOST: str = Field(default="https://cloud.langfuse.com", description="Langfuse host URL")
     LANGFUSE_OTLP_ENDPOINT: str = Field(default="/api/public/otel", description="Langfuse OTLP endpoint path")
+    LANGFUSE_RETRY_MAX_ATTEMPTS: int = Field(default=3, description="Max attempts for Langfuse API reads on 429/5xx/transport errors")
+    LANGFUSE_RETRY_BACKOFF_BASE: float = Field(default=1.0, description="Langfuse retry initial backoff delay in seconds (x1.5 per attempt)")
     ENABLE_TRACING: bool = Field(default=True, description="Enable tracing")
     ENABLE_OPENTELEMETRY_EXPORT: bool = Field(default=True, description="Enable OpenTelemetry OTLP export to Langfuse")
 
@@ -405,12 +422,14 @@ class Settings(BaseSettings):
 
     # Provider Timeouts and Delays
     SKYSCANNER_POLLING_DELAY: int = Field(default=2, description="Skyscanner polling delay in seconds")
-    CHAT_EVENT_QUEUE_TIMEOUT: float = Field(default=0.1, description="Chat event queue timeout in seconds")
-    CHAT_STREAM_SLEEP_DELAY: float = Field(default=0.01, description="Chat stream sleep delay in seconds")
+    CHAT_EVENT_QUEUE_TIMEOUT: float = Field(default=0.1, description="Deprecated and not read: chat events are iterated directly and the 60s stream cap is a separate timer deadline; kept so existing .env files still load")
+    CHAT_STREAM_SLEEP_DELAY: float = Field(default=0.0, description="Optional typing-effect delay in seconds between text chunks (0 sends chunks back-to-back)")
+    CHAT_STREAM_CHUNK_SIZE: int = Field(default=24, description="Characters of response text per streamed SSE content event")
 
     # Cache TTLs
     HALT_STATE_TTL: int = Field(default=3600, description="Halt state cache TTL in seconds")
     CHAT_HISTORY_CACHE_TTL: int = Field(default=3600, description="Chat history cache TTL in seconds")
+    ADMIN_METRICS_CACHE_TTL: int = Field(default=30, description="Admin dashboard metrics cache TTL in seconds")
 
     class Config:
         env_file = ".env"
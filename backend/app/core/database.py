@@ -12,6 +12,7 @@ from sqlalchemy.ext.asyncio import (
     AsyncEngine
 )
 from sqlalchemy.orm import declarative_base
+from sqlalchemy.pool import NullPool
 
 from app.core.config import settings
 
@@ -40,14 +41,23 @@ async def init_db() -> None:
         elif "aiosqlite" in settings.DATABASE_URL:
             connect_args = {"timeout": settings.DB_CONNECT_TIMEOUT}
 
+        if settings.DB_USE_NULL_POOL:
+            # An external pooler (e.g. PgBouncer) owns connection reuse
+            pool_args = {"poolclass": NullPool}
+        else:
+            pool_args = {
+                "pool_size": settings.DB_POOL_SIZE,
+                "max_overflow": settings.DB_MAX_OVERFLOW,
+                "pool_timeout": settings.DB_POOL_TIMEOUT,  # Fail fast when the pool is exhausted
+                "pool_pre_ping": True,  # Verify connections before using
+                "pool_recycle": settings.DB_POOL_RECYCLE,  # Recycle connections after configured time
+            }
+
         engine = create_async_engine(
             settings.DATABASE_URL,
             echo=False,  # Disable SQL query logging
-            pool_size=settings.DB_POOL_SIZE,
-            max_overflow=settings.DB_MAX_OVERFLOW,
-            pool_pre_ping=True,  # Verify connections before using
-            pool_recycle=settings.DB_POOL_RECYCLE,  # Recycle connections after configured time
-            connect_args=connect_args
+            connect_args=connect_args,
+            **pool_args
         )
 
         # Create session maker
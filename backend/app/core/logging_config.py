@@ -25,6 +25,9 @@ def set_logging_enabled(enabled: bool):
     """
     global _LOGGING_ENABLED
     _LOGGING_ENABLED = enabled
+    # One global switch: Logger.isEnabledFor() checks logging.disable() first,
+    # so disabled log calls return before any record is built
+    logging.disable(logging.NOTSET if enabled else logging.CRITICAL)
 
 
 def is_logging_enabled() -> bool:
@@ -120,9 +123,8 @@ def setup_logging(
     # Set global logging flag
     set_logging_enabled(enabled)
 
-    # If logging is disabled, set everything to CRITICAL to suppress all logs
+    # If logging is disabled, set_logging_enabled has already suppressed all logs
     if not enabled:
-        logging.disable(logging.CRITICAL)
         return
 
     # Create root logger
@@ -13,10 +13,12 @@ from app.core.database import init_db, close_db
 from app.core.redis_client import init_redis, close_redis
 from app.core.logging_config import setup_logging
 from app.middleware.logging_middleware import LoggingMiddleware
+from app.middleware.query_counter_middleware import QueryCounterMiddleware
 from app.api.v1 import chat, health, admin, admin_auth, admin_users, affiliate, telemetry, qos
 from app.services.search.config import setup_search_provider
 from app.services.travel.config import setup_travel_providers
 from app.services.scheduler import start_scheduler, stop_scheduler
+from app.services.affiliate_click_buffer import start_click_flusher, stop_click_flusher
 from app.services.startup_manifest import (
     build_startup_manifest,
     log_startup_manifest,
@@ -88,6 +90,10 @@ async def lifespan(app: FastAPI):
         start_scheduler()
         logger.info("Background scheduler started")
 
+        # Start batched writer for affiliate click tracking
+        start_click_flusher()
+        logger.info("Affiliate click flusher started")
+
     except Exception as e:
         logger.error(f"Failed to initialize services: {e}")
         # Exit immediately if services fail to initialize
@@ -101,6 +107,10 @@ async def lifespan(app: FastAPI):
         stop_scheduler()
         logger.info("Background scheduler stopped")
 
+        # Flush buffered affiliate clicks while the database is still open
+        await stop_click_flusher()
+        logger.info("Affiliate click flusher stopped")
+
         await close_db()
         await close_redis()
         logger.info("Database and Redis connections closed")
@@ -123,6 +133,10 @@ app = FastAPI(
 # Add custom logging middleware FIRST (middlewares are executed in reverse order)
 app.add_middleware(LoggingMiddleware)
 
+# Dev-only N+1 detector: warns when a request exceeds QUERY_COUNT_WARN_THRESHOLD queries
+if settings.ENABLE_QUERY_COUNTER:
+    app.add_middleware(QueryCounterMiddleware, threshold=settings.QUERY_COUNT_WARN_THRESHOLD)
+
 # Add CORS middleware SECOND (will execute first due to reverse order)
 # SECURITY: Use explicit origins from settings, never wildcard in production
 cors_kwargs = {
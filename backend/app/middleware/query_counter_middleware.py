@@ -0,0 +1,76 @@
+"""
+Query Counter Middleware
+
+Development aid for catching N+1 query patterns: counts the SQL statements
+executed while handling each request and logs a warning when a request exceeds
+QUERY_COUNT_WARN_THRESHOLD. Only installed when ENABLE_QUERY_COUNTER is set,
+so production requests pay nothing.
+"""
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Iterator, List, Optional
+
+from fastapi import Request, Response
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp
+
+from app.core.centralized_logger import get_logger
+
+logger = get_logger(__name__)
+
+# Statements executed in the current request; None outside count_queries().
+# A mutable list so appends made in child tasks/greenlets are visible here.
+_current_queries: ContextVar[Optional[List[str]]] = ContextVar("_current_queries", default=None)
+
+_listener_installed = False
+
+
+def _record_query(conn, cursor, statement, parameters, context, executemany) -> None:
+    """before_cursor_execute hook: record the statement for the active request"""
+    queries = _current_queries.get()
+    if queries is not None:
+        queries.append(statement)
+
+
+def install_query_listener() -> None:
+    """Attach the counting hook to every SQLAlchemy engine (idempotent)"""
+    global _listener_installed
+    if not _listener_installed:
+        # Listening on the Engine class covers engines created later (init_db)
+        # and the sync engine underneath AsyncEngine
+        event.listen(Engine, "before_cursor_execute", _record_query)
+        _listener_installed = True
+
+
+@contextmanager
+def count_queries() -> Iterator[List[str]]:
+    """Collect the SQL statements executed inside the block"""
+    queries: List[str] = []
+    token = _current_queries.set(queries)
+    try:
+        yield queries
+    finally:
+        _current_queries.reset(token)
+
+
+class QueryCounterMiddleware(BaseHTTPMiddleware):
+    """Warn when a single request issues more than `threshold` SQL statements"""
+
+    def __init__(self, app: ASGIApp, threshold: int = 10):
+        super().__init__(app)
+        self.threshold = threshold
+        install_query_listener()
+
+    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        with count_queries() as queries:
+            response = await call_next(request)
+
+        if len(queries) > self.threshold:
+            logger.warning(
+                f"[query_counter] {request.method} {request.url.path} executed "
+                f"{len(queries)} SQL statements (threshold {self.threshold}) - possible N+1"
+            )
+
+        return response
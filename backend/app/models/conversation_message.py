@@ -10,6 +10,17 @@ from app.core.database import Base
 class ConversationMessage(Base):
     """Individual messages in conversations - persistent storage"""
     __tablename__ = "conversation_messages"
+    __table_args__ = (
+        # Admin metrics filter on role = 'user' AND created_at >= :time
+        sa.Index("ix_conversation_messages_role_created_at", "role", "created_at"),
+        # Per-session reads in sequence order (list_conversations ranking, history)
+        sa.Index(
+            "ix_conversation_messages_session_sequence",
+            "session_id",
+            "sequence_number",
+            postgresql_include=["role"],
+        ),
+    )
 
     id = Column(BigInteger, primary_key=True, autoincrement=True)  # Auto-increment ID
     session_id = Column(String(255), nullable=False, index=True)  # UUID string like "0ac2b93d-180b-4d38-ab3f-56b5ad733dc9"
@@ -1,5 +1,5 @@
 """Request metric model for RFC §4.2 QoS dashboards"""
-from sqlalchemy import Column, Integer, String, DateTime
+from sqlalchemy import Column, Integer, String, DateTime, Index
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.sql import func
 
@@ -9,6 +9,15 @@ from app.core.database import Base
 class RequestMetric(Base):
     """Stores per-request QoS data for dashboard metrics (RFC §4.2)"""
     __tablename__ = "request_metrics"
+    __table_args__ = (
+        # QoS summary aggregates these columns over a created_at window. provider_errors
+        # is unbounded JSONB and stays out: an oversized index tuple fails the INSERT
+        Index(
+            "ix_request_metrics_created_at_covering",
+            "created_at",
+            postgresql_include=["total_duration_ms", "completeness"],
+        ),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     request_id = Column(String(36), nullable=False, index=True)
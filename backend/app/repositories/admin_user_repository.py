@@ -6,13 +6,70 @@ Handles all database operations for admin_users table.
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import text
-from typing import Optional, List, Dict, Any
+from sqlalchemy.sql.elements import TextClause
+from functools import lru_cache
+from typing import Optional, List, Dict, Any, Tuple
 from datetime import datetime
 
 from app.core.centralized_logger import get_logger
 
 logger = get_logger(__name__)
 
+# Statements are built once at import and reused by every repository instance
+SELECT_ALL_SQL = text("""
+    SELECT id, username, email, is_active, created_at, updated_at, last_login
+    FROM admin_users
+    ORDER BY created_at DESC
+""")
+SELECT_BY_ID_SQL = text("""
+    SELECT id, username, email, password_hash, is_active, created_at, updated_at, last_login
+    FROM admin_users
+    WHERE id = :id
+""")
+SELECT_BY_USERNAME_SQL = text("""
+    SELECT id, username, email, password_hash, is_active, created_at, updated_at, last_login
+    FROM admin_users
+    WHERE username = :username
+""")
+SELECT_BY_EMAIL_SQL = text("""
+    SELECT id, username, email, password_hash, is_active, created_at, updated_at, last_login
+    FROM admin_users
+    WHERE email = :email
+""")
+INSERT_SQL = text("""
+    INSERT INTO admin_users (username, email, password_hash, is_active, created_at, updated_at)
+    VALUES (:username, :email, :password_hash, :is_active, :created_at, :updated_at)
+    RETURNING id
+""")
+INSERT_IF_NOT_EXISTS_SQL = text("""
+    INSERT INTO admin_users (username, email, password_hash, is_active, created_at, updated_at)
+    VALUES (:username, :email, :password_hash, :is_active, :created_at, :updated_at)
+    ON CONFLICT DO NOTHING
+    RETURNING id, username, email, is_active, created_at, updated_at, last_login
+""")
+CONFLICTING_FIELD_SQL = text("""
+    SELECT bool_or(username = :username)
+    FROM admin_users
+    WHERE username = :username OR email = :email
+""")
+DELETE_SQL = text("DELETE FROM admin_users WHERE id = :id RETURNING username")
+UPDATE_LAST_LOGIN_SQL = text("UPDATE admin_users SET last_login = :last_login WHERE id = :id")
+EXISTS_USERNAME_SQL = text("SELECT EXISTS (SELECT 1 FROM admin_users WHERE username = :username)")
+EXISTS_EMAIL_SQL = text("SELECT EXISTS (SELECT 1 FROM admin_users WHERE email = :email)")
+
+_RETURNING_COLUMNS = "id, username, email, is_active, created_at, updated_at, last_login"
+_UPDATABLE_FIELDS = ("username", "email", "password_hash", "is_active")
+
+
+@lru_cache(maxsize=None)
+def _update_sql(fields: Tuple[str, ...]) -> TextClause:
+    """Build (once per field combination) the UPDATE ... RETURNING statement for update()"""
+    assignments = ", ".join(f"{field} = :{field}" for field in fields)
+    return text(
+        f"UPDATE admin_users SET {assignments}, updated_at = :updated_at WHERE id = :id "
+        f"RETURNING {_RETURNING_COLUMNS}"
+    )
+
 
 class AdminUserRepository:
     """Repository for managing admin users"""
@@ -22,13 +79,7 @@ class AdminUserRepository:
 
     async def get_all(self) -> List[Dict[str, Any]]:
         """Get all admin users"""
-        result = await self.db.execute(
-            text("""
-                SELECT id, username, email, is_active, created_at, updated_at, last_login
-                FROM admin_users
-                ORDER BY created_at DESC
-            """)
-        )
+        result = await self.db.execute(SELECT_ALL_SQL)
         rows = result.fetchall()
         return [
             {
@@ -46,11 +97,7 @@ class AdminUserRepository:
     async def get_by_id(self, user_id: int) -> Optional[Dict[str, Any]]:
         """Get admin user by ID"""
         result = await self.db.execute(
-            text("""
-                SELECT id, username, email, password_hash, is_active, created_at, updated_at, last_login
-                FROM admin_users
-                WHERE id = :id
-            """),
+            SELECT_BY_ID_SQL,
             {"id": user_id}
         )
         row = result.fetchone()
@@ -71,11 +118,7 @@ class AdminUserRepository:
     async def get_by_username(self, username: str) -> Optional[Dict[str, Any]]:
         """Get admin user by username"""
         result = await self.db.execute(
-            text("""
-                SELECT id, username, email, password_hash, is_active, created_at, updated_at, last_login
-                FROM admin_users
-                WHERE username = :username
-            """),
+            SELECT_BY_USERNAME_SQL,
             {"username": username}
         )
         row = result.fetchone()
@@ -96,11 +139,7 @@ class AdminUserRepository:
     async def get_by_email(self, email: str) -> Optional[Dict[str, Any]]:
         """Get admin user by email"""
         result = await self.db.execute(
-            text("""
-                SELECT id, username, email, password_hash, is_active, created_at, updated_at, last_login
-                FROM admin_users
-                WHERE email = :email
-            """),
+            SELECT_BY_EMAIL_SQL,
             {"email": email}
         )
         row = result.fetchone()
@@ -122,11 +161,7 @@ class AdminUserRepository:
         """Create new admin user"""
         now = datetime.utcnow()
         result = await self.db.execute(
-            text("""
-                INSERT INTO admin_users (username, email, password_hash, is_active, created_at, updated_at)
-                VALUES (:username, :email, :password_hash, :is_active, :created_at, :updated_at)
-                RETURNING id
-            """),
+            INSERT_SQL,
             {
                 "username": username,
                 "email": email,
@@ -136,7 +171,7 @@ class AdminUserRepository:
                 "updated_at": now
             }
         )
-        new_id = result.fetchone()[0]
+        new_id = result.scalar_one()
         await self.db.commit()
 
         return {
@@ -149,45 +184,100 @@ class AdminUserRepository:
             "last_login": None
         }
 
-    async def update(self, user_id: int, **kwargs) -> bool:
+    async def create_if_not_exists(
+        self, username: str, email: str, password_hash: str, is_active: bool = True
+    ) -> Optional[Dict[str, Any]]:
         """
-        Update admin user fields
+        Create new admin user in a single round trip
 
-        Accepts any combination of: username, email, password_hash, is_active
+        Returns None instead of raising when the username or email is already
+        taken (both carry unique constraints); use get_conflicting_field to
+        find out which.
+        """
+        now = datetime.utcnow()
+        result = await self.db.execute(
+            INSERT_IF_NOT_EXISTS_SQL,
+            {
+                "username": username,
+                "email": email,
+                "password_hash": password_hash,
+                "is_active": is_active,
+                "created_at": now,
+                "updated_at": now
+            }
+        )
+        row = result.fetchone()
+        await self.db.commit()
+        if not row:
+            return None
+
+        return {
+            "id": row[0],
+            "username": row[1],
+            "email": row[2],
+            "is_active": row[3],
+            "created_at": row[4],
+            "updated_at": row[5],
+            "last_login": row[6]
+        }
+
+    async def get_conflicting_field(self, username: str, email: str) -> Optional[str]:
+        """Return "username" or "email" for whichever is already taken (username first)"""
+        result = await self.db.execute(
+            CONFLICTING_FIELD_SQL,
+            {"username": username, "email": email}
+        )
+        username_taken = result.scalar()
+        if username_taken is None:
+            return None
+        return "username" if username_taken else "email"
+
+    async def update(self, user_id: int, **kwargs) -> Optional[Dict[str, Any]]:
         """
-        # Build dynamic update query
-        allowed_fields = ["username", "email", "password_hash", "is_active"]
-        update_fields = []
-        params = {"id": user_id, "updated_at": datetime.utcnow()}
+        Update admin user fields
 
-        for field in allowed_fields:
-            if field in kwargs:
-                update_fields.append(f"{field} = :{field}")
-                params[field] = kwargs[field]
+        Accepts any combination of: username, email, password_hash, is_active
 
-        if not update_fields:
-            return False
+        Returns the updated user (without password_hash), or None when no
+        fields were given or the user does not exist.
+        """
+        fields = tuple(field for field in _UPDATABLE_FIELDS if field in kwargs)
+        if not fields:
+            return None
 
-        update_fields.append("updated_at = :updated_at")
-        query = f"UPDATE admin_users SET {', '.join(update_fields)} WHERE id = :id"
+        params = {field: kwargs[field] for field in fields}
+        params.update(id=user_id, updated_at=datetime.utcnow())
 
-        await self.db.execute(text(query), params)
+        result = await self.db.execute(_update_sql(fields), params)
+        row = result.fetchone()
         await self.db.commit()
-        return True
+        if not row:
+            return None
 
-    async def delete(self, user_id: int) -> bool:
-        """Delete admin user"""
-        await self.db.execute(
-            text("DELETE FROM admin_users WHERE id = :id"),
+        return {
+            "id": row[0],
+            "username": row[1],
+            "email": row[2],
+            "is_active": row[3],
+            "created_at": row[4],
+            "updated_at": row[5],
+            "last_login": row[6]
+        }
+
+    async def delete(self, user_id: int) -> Optional[str]:
+        """Delete admin user, returning its username (None if it did not exist)"""
+        result = await self.db.execute(
+            DELETE_SQL,
             {"id": user_id}
         )
+        username = result.scalar()
         await self.db.commit()
-        return True
+        return username
 
     async def update_last_login(self, user_id: int) -> bool:
         """Update last_login timestamp"""
         await self.db.execute(
-            text("UPDATE admin_users SET last_login = :last_login WHERE id = :id"),
+            UPDATE_LAST_LOGIN_SQL,
             {"last_login": datetime.utcnow(), "id": user_id}
         )
         await self.db.commit()
@@ -196,15 +286,15 @@ class AdminUserRepository:
     async def exists_username(self, username: str) -> bool:
         """Check if username exists"""
         result = await self.db.execute(
-            text("SELECT id FROM admin_users WHERE username = :username"),
+            EXISTS_USERNAME_SQL,
             {"username": username}
         )
-        return result.fetchone() is not None
+        return bool(result.scalar())
 
     async def exists_email(self, email: str) -> bool:
         """Check if email exists"""
         result = await self.db.execute(
-            text("SELECT id FROM admin_users WHERE email = :email"),
+            EXISTS_EMAIL_SQL,
             {"email": email}
         )
-        return result.fetchone() is not None
+        return bool(result.scalar())
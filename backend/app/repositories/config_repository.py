@@ -80,7 +80,7 @@ class ConfigRepository:
             text("INSERT INTO core_config (key, value, created_at, updated_at) VALUES (:key, :value, :created_at, :updated_at) RETURNING id"),
             {"key": key, "value": value, "created_at": now, "updated_at": now}
         )
-        new_id = result.fetchone()[0]
+        new_id = result.scalar_one()
         await self.db.commit()
 
         return {
@@ -0,0 +1,111 @@
+"""
+Affiliate Click Buffer
+Batches affiliate click inserts so high click volume costs one commit per batch
+instead of one per click. Clicks are analytics data, so delivery is
+at-most-once: a crash or a full queue drops buffered clicks.
+"""
+from app.core.centralized_logger import get_logger
+import asyncio
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import insert
+
+from app.core import database
+from app.core.config import settings
+from app.models.affiliate_click import AffiliateClick
+
+logger = get_logger(__name__)
+
+_click_queue: Optional[asyncio.Queue] = None
+_flusher_task: Optional[asyncio.Task] = None
+
+# Queued by stop_click_flusher; FIFO order means every earlier click is written first
+_STOP = object()
+
+
+def start_click_flusher() -> None:
+    """Create the click queue and start the background flusher"""
+    global _click_queue, _flusher_task
+    if _flusher_task is not None:
+        return
+
+    _click_queue = asyncio.Queue(maxsize=settings.AFFILIATE_CLICK_QUEUE_SIZE)
+    _flusher_task = asyncio.create_task(_flush_loop(_click_queue))
+
+
+async def stop_click_flusher() -> None:
+    """Stop the flusher after it has written every click queued so far"""
+    global _click_queue, _flusher_task
+    if _flusher_task is None:
+        return
+
+    task, queue = _flusher_task, _click_queue
+    _flusher_task = _click_queue = None
+
+    await queue.put(_STOP)
+    await task
+
+
+def enqueue_click(click: Dict[str, Any]) -> bool:
+    """
+    Buffer a click for the next batched insert
+
+    Args:
+        click: AffiliateClick column values (clicked_at is stamped here)
+
+    Returns:
+        False if the flusher is not running, so the caller can write directly;
+        True otherwise (including when the click was dropped on a full queue)
+    """
+    if _click_queue is None:
+        return False
+
+    try:
+        _click_queue.put_nowait({**click, "clicked_at": datetime.utcnow()})
+    except asyncio.QueueFull:
+        logger.warning("[affiliate_clicks] Click queue full, dropping click")
+    return True
+
+
+async def _flush_loop(queue: asyncio.Queue) -> None:
+    """Collect clicks into batches of up to AFFILIATE_CLICK_BATCH_SIZE or one flush interval"""
+    loop = asyncio.get_running_loop()
+    while True:
+        click = await queue.get()
+        if click is _STOP:
+            return
+        batch = [click]
+        deadline = loop.time() + settings.AFFILIATE_CLICK_FLUSH_INTERVAL
+
+        while len(batch) < settings.AFFILIATE_CLICK_BATCH_SIZE:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                click = await asyncio.wait_for(queue.get(), timeout=timeout)
+            except asyncio.TimeoutError:
+                break
+            if click is _STOP:
+                await _write_batch(batch)
+                return
+            batch.append(click)
+
+        await _write_batch(batch)
+
+
+async def _write_batch(batch: List[Dict[str, Any]]) -> None:
+    """Insert a batch of clicks with one executemany and one commit"""
+    if not batch or not database.AsyncSessionLocal:
+        return
+
+    try:
+        async with database.AsyncSessionLocal() as session:
+            await session.execute(insert(AffiliateClick), batch)
+            await session.commit()
+        logger.debug("[affiliate_clicks] Flushed %d clicks", len(batch))
+    except Exception as e:
+        logger.error(f"[affiliate_clicks] Failed to write {len(batch)} clicks: {e}")
+
+
+__all__ = ["start_click_flusher", "stop_click_flusher", "enqueue_click"]
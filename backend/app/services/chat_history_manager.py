@@ -48,11 +48,13 @@ class ChatHistoryManager:
         if limit is None:
             limit = settings.MAX_HISTORY_MESSAGES
 
-        # Try Redis cache first
+        # Try Redis cache first. The has_history marker is fetched in the same
+        # round-trip so brand-new sessions skip the DB without a second call.
         if redis_client is not None:
             try:
                 cache_key = ChatHistoryManager._get_cache_key(session_id)
-                cached_data = await redis_client.get(cache_key)
+                exists_key = f"session:{session_id}:has_history"
+                cached_data, has_history = await redis_client.mget(cache_key, exists_key)
 
                 if cached_data:
                     import json
@@ -64,18 +66,13 @@ class ChatHistoryManager:
                         history = history[-limit:]
 
                     return history
-            except Exception as e:
-                logger.warning(f"[ChatHistoryManager] Redis cache read failed: {e}")
 
-            # Fast path: check if session has any history at all (lightweight key existence check)
-            try:
-                exists_key = f"session:{session_id}:has_history"
-                has_history = await redis_client.exists(exists_key)
+                # Fast path: no marker means the session has never saved a turn
                 if not has_history:
                     logger.info(f"[ChatHistoryManager] New session {session_id} — skipping DB load")
                     return []
             except Exception as e:
-                logger.warning(f"[ChatHistoryManager] Redis exists check failed: {e}")
+                logger.warning(f"[ChatHistoryManager] Redis cache read failed: {e}")
                 # Fall through to DB load
 
         # Fall back to database
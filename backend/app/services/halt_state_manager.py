@@ -62,7 +62,8 @@ class HaltStateManager:
             force_reload: If True, bypass cache and reload from Redis
 
         Returns:
-            Halt state dict if found, None otherwise
+            Halt state dict if found, None otherwise. This is the cached object
+            itself (not a copy) - callers must copy any part they mutate.
         """
         # Check cache first (unless force_reload)
         if not force_reload and session_id in HaltStateManager._cache:
@@ -81,17 +82,11 @@ class HaltStateManager:
             redis = await get_redis()
             halt_key = HaltStateManager._get_halt_key(session_id)
 
-            # Check if halt state exists
-            exists = await redis.exists(halt_key)
-            if not exists:
-                logger.debug(f"No halt state found in Redis: session={session_id}")
-                # Cache the "None" result to avoid repeated Redis calls
-                HaltStateManager._cache[session_id] = None
-                return None
-
-            # Load from Redis
+            # Load from Redis (a missing key reads as None - no separate EXISTS round-trip)
             halt_state_json = await redis.get(halt_key)
             if not halt_state_json:
+                logger.debug(f"No halt state found in Redis: session={session_id}")
+                # Cache the "None" result to avoid repeated Redis calls
                 HaltStateManager._cache[session_id] = None
                 return None
 
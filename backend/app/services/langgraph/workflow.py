@@ -64,12 +64,11 @@ async def safety_node(state: GraphState) -> Dict[str, Any]:
             try:
                 from app.services.halt_state_manager import HaltStateManager
 
-                halted_state_exists = await HaltStateManager.check_halt_exists(session_id)
-                logger.info(f"  Halt state exists: {halted_state_exists}")
-
-                if halted_state_exists:
-                    halt_state_data = await HaltStateManager.load_halt_state(session_id)
+                # get_halt_state returns None when no halt exists - one lookup, not check + load
+                halt_state_data = await HaltStateManager.get_halt_state(session_id)
+                logger.info(f"  Halt state exists: {halt_state_data is not None}")
 
+                if halt_state_data is not None:
                     if halt_state_data:
                         logger.info(f"  Found halt state - intent: {halt_state_data.get('intent')}, slots: {halt_state_data.get('slots')}")
 
@@ -110,24 +109,20 @@ async def safety_node(state: GraphState) -> Dict[str, Any]:
 
         result = await safety_agent_instance.execute(state)
 
-        user_message = state.get("user_message")
-        conversation_history = state.get("conversation_history", []).copy()
-
-        if user_message:
-            conversation_history.append({
-                "role": "user",
-                "content": user_message
-            })
-            logger.info(f"[SafetyAgent] Added user message to conversation_history state ({len(conversation_history)} total messages)")
-
         update = {
             "policy_status": result["policy_status"],
             "sanitized_text": result["sanitized_text"],
             "redaction_map": result["redaction_map"],
             "current_agent": "safety",
-            "conversation_history": conversation_history,
         }
 
+        # conversation_history is an operator.add reducer field: return only the
+        # new message, the graph appends it to the history already in state
+        user_message = state.get("user_message")
+        if user_message:
+            update["conversation_history"] = [{"role": "user", "content": user_message}]
+            logger.info("[SafetyAgent] Added user message to conversation_history state")
+
         if result.get("errors"):
             update["errors"] = result["errors"]
             update["status"] = "error"
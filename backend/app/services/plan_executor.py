@@ -7,20 +7,12 @@ Handles dependency resolution, parallel execution, and STATE-BASED context manag
 
 import asyncio
 from app.core.centralized_logger import get_logger
-import sys
-import os
 from typing import Dict, Any, List, Tuple, Set
 from collections import defaultdict
 
 from app.services.tool_validator import ToolOutputValidator
 
-# Add MCP server to path for tool contract imports
-backend_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-mcp_server_path = os.path.join(backend_dir, 'mcp_server')
-if mcp_server_path not in sys.path:
-    sys.path.insert(0, mcp_server_path)
-
-from tool_contracts import get_tool_contracts_dict  # noqa: E402
+from mcp_server.tool_contracts import get_tool_contracts_dict
 
 logger = get_logger(__name__)
 
@@ -0,0 +1,42 @@
+"""
+Popular Queries Aggregate
+Refreshes the mv_popular_queries_24h materialized view read by the admin dashboard
+"""
+from app.core.centralized_logger import get_logger
+from datetime import datetime
+from sqlalchemy import text
+
+from app.core import database
+
+logger = get_logger(__name__)
+
+POPULAR_QUERIES_VIEW = "mv_popular_queries_24h"
+
+# CONCURRENTLY keeps the view readable during the refresh (needs the unique
+# index on content_hash created by the migration)
+REFRESH_POPULAR_QUERIES_SQL = text(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {POPULAR_QUERIES_VIEW}")
+
+
+async def refresh_popular_queries_view() -> dict:
+    """
+    Recompute the top user queries of the last 24 hours
+
+    Returns:
+        Stats dict with duration, or an "error" key on failure
+    """
+    if not database.AsyncSessionLocal:
+        return {"error": "Database not initialized"}
+
+    start = datetime.utcnow()
+    try:
+        async with database.AsyncSessionLocal() as session:
+            await session.execute(REFRESH_POPULAR_QUERIES_SQL)
+            await session.commit()
+    except Exception as e:
+        logger.error(f"[popular_queries] Failed to refresh {POPULAR_QUERIES_VIEW}: {e}")
+        return {"error": str(e)}
+
+    return {"duration_seconds": (datetime.utcnow() - start).total_seconds()}
+
+
+__all__ = ["POPULAR_QUERIES_VIEW", "refresh_popular_queries_view"]
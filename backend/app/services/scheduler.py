@@ -10,6 +10,7 @@ from apscheduler.triggers.cron import CronTrigger
 from apscheduler.triggers.interval import IntervalTrigger
 
 from app.services.link_health_checker import run_health_check
+from app.services.popular_queries import refresh_popular_queries_view
 from app.core.config import settings
 
 logger = get_logger(__name__)
@@ -21,6 +22,7 @@ class SchedulerService:
 
     Responsibilities:
     - Schedule periodic link health checks
+    - Refresh admin dashboard aggregates
     - Manage job lifecycle
     - Handle job errors and retries
     """
@@ -58,6 +60,21 @@ class SchedulerService:
             else:
                 logger.info("Link health checker disabled (ENABLE_LINK_HEALTH_CHECKER=false)")
 
+            # Keep the admin dashboard's popular-queries view current
+            refresh_minutes = settings.POPULAR_QUERIES_REFRESH_MINUTES
+            if refresh_minutes > 0:
+                self.scheduler.add_job(
+                    self._run_popular_queries_refresh,
+                    trigger=IntervalTrigger(minutes=refresh_minutes),
+                    id="popular_queries_refresh",
+                    name=f"Popular Queries Refresh (Every {refresh_minutes}m)",
+                    replace_existing=True,
+                    max_instances=1,  # Prevent overlapping runs
+                )
+                logger.info(f"Popular queries refresh enabled (interval: {refresh_minutes}m)")
+            else:
+                logger.info("Popular queries refresh disabled (POPULAR_QUERIES_REFRESH_MINUTES=0)")
+
             self.scheduler.start()
             self.is_running = True
 
@@ -116,6 +133,18 @@ class SchedulerService:
         duration = (job_end - job_start).total_seconds()
         logger.info(f"Link health check job finished in {duration:.2f}s")
 
+    async def _run_popular_queries_refresh(self):
+        """
+        Background job: Refresh mv_popular_queries_24h
+        Errors are logged by the service so the scheduler keeps running
+        """
+        stats = await refresh_popular_queries_view()
+
+        if "error" in stats:
+            logger.error(f"Popular queries refresh failed: {stats['error']}")
+        else:
+            logger.info(f"Popular queries refresh finished in {stats['duration_seconds']:.2f}s")
+
     def get_job_status(self) -> dict:
         """Get status of all scheduled jobs"""
         if not self.is_running:
@@ -153,6 +182,10 @@ class SchedulerService:
                 logger.info(f"Manually triggering job: {job_id}")
                 await self._run_link_health_check()
                 return {"status": "success", "message": f"Job {job_id} executed"}
+            elif job_id == "popular_queries_refresh":
+                logger.info(f"Manually triggering job: {job_id}")
+                await self._run_popular_queries_refresh()
+                return {"status": "success", "message": f"Job {job_id} executed"}
             else:
                 return {"error": f"Unknown job ID: {job_id}"}
 
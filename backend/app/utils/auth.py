@@ -4,7 +4,9 @@ Authentication Utilities
 Provides password hashing with bcrypt and JWT token management.
 """
 
+import asyncio
 import bcrypt
+from concurrent.futures import ThreadPoolExecutor
 from jose import jwt, JWTError
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any
@@ -20,6 +22,14 @@ JWT_SECRET = os.getenv("JWT_SECRET", settings.SECRET_KEY)
 JWT_ALGORITHM = settings.JWT_ALGORITHM
 JWT_EXPIRATION_HOURS = settings.JWT_EXPIRATION_HOURS
 
+# bcrypt is CPU-bound (and releases the GIL), so it gets its own pool sized to
+# the CPU count instead of competing with I/O work in the default executor.
+# Threads are spawned lazily on first use.
+_password_executor = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 1,
+    thread_name_prefix="password-hash",
+)
+
 
 def hash_password(password: str) -> str:
     """
@@ -60,6 +70,18 @@ def verify_password(password: str, password_hash: str) -> bool:
         return False
 
 
+async def hash_password_async(password: str) -> str:
+    """Hash a password on the password executor, keeping the event loop free"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_password_executor, hash_password, password)
+
+
+async def verify_password_async(password: str, password_hash: str) -> bool:
+    """Verify a password on the password executor, keeping the event loop free"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_password_executor, verify_password, password, password_hash)
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """
     Create a JWT access token
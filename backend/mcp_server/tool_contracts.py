@@ -13,6 +13,9 @@ from app.lib.toon_python import encode
 
 logger = get_logger(__name__)
 
+# "mcp_server.tools" when imported as a package, "tools" when run from mcp_server/
+_TOOLS_PACKAGE = f"{__package__}.tools" if __package__ else "tools"
+
 
 def load_all_tool_contracts() -> List[Dict]:
     """
@@ -32,8 +35,10 @@ def load_all_tool_contracts() -> List[Dict]:
 
     for tool_name in sorted(tool_files):
         try:
-            # Import the tool module (reload to get fresh data)
-            module_name = f"tools.{tool_name}"
+            # Import the tool module (reload to get fresh data).
+            # Resolve relative to this package so the backend shares the
+            # mcp_server.tools.* modules that plan_executor executes.
+            module_name = f"{_TOOLS_PACKAGE}.{tool_name}"
             if module_name in sys.modules:
                 module = importlib.reload(sys.modules[module_name])
             else:
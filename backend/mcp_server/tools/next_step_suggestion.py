@@ -92,8 +92,7 @@ def _get_intent_specific_guidance(intent: str, slots: Dict[str, Any]) -> str:
         Guidance string for the LLM
     """
     # Import here to avoid circular dependency
-    sys.path.insert(0, os.path.join(backend_dir, 'mcp_server'))
-    from tool_contracts import _get_contracts_cached
+    from mcp_server.tool_contracts import _get_contracts_cached
 
     # Get all entry-point tools for this intent (tools with no pre dependencies)
     all_contracts = _get_contracts_cached()
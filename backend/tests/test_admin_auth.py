@@ -0,0 +1,143 @@
+"""
+Tests for admin authentication helpers (app/api/v1/admin_auth.py)
+
+backend/tests/test_admin_auth.py
+"""
+import os
+
+# ---------------------------------------------------------------------------
+# Minimal env setup so settings can be instantiated without a .env file.
+# Must happen before any app imports.
+# ---------------------------------------------------------------------------
+os.environ.setdefault("ENV", "test")
+os.environ.setdefault("SECRET_KEY", "test-secret-key-minimum-32-characters-long")
+os.environ.setdefault("ADMIN_PASSWORD", "testpassword123")
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+os.environ.setdefault("REDIS_URL", "redis://localhost:6379/0")
+os.environ.setdefault("OPENAI_API_KEY", "test-openai-key")
+os.environ.setdefault("RATE_LIMIT_ENABLED", "false")
+os.environ.setdefault("LOG_ENABLED", "false")
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+
+from app.api.v1 import admin_auth
+from app.utils.auth import create_access_token
+
+
+def _credentials(user_id: int = 1) -> HTTPAuthorizationCredentials:
+    token = create_access_token({"sub": str(user_id), "username": "admin", "type": "admin"})
+    return HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+
+def _admin_user(user_id: int = 1, is_active: bool = True) -> dict:
+    return {
+        "id": user_id,
+        "username": "admin",
+        "email": "admin@test.com",
+        "is_active": is_active,
+        "created_at": "2024-01-01T00:00:00Z",
+        "updated_at": "2024-01-01T00:00:00Z",
+        "last_login": None,
+    }
+
+
+@pytest.fixture(autouse=True)
+def _clear_user_cache():
+    admin_auth._admin_user_cache.clear()
+    yield
+    admin_auth._admin_user_cache.clear()
+
+
+# ---------------------------------------------------------------------------
+# Admin user cache
+# ---------------------------------------------------------------------------
+
+class TestAdminUserCache:
+
+    @pytest.mark.asyncio
+    async def test_repeat_requests_hit_cache(self):
+        with patch.object(admin_auth, "AdminUserRepository") as mock_repo:
+            mock_repo.return_value.get_by_id = AsyncMock(return_value=_admin_user())
+
+            first = await admin_auth.get_current_admin_user(_credentials(), db=MagicMock())
+            second = await admin_auth.get_current_admin_user(_credentials(), db=MagicMock())
+
+        assert first == second == _admin_user()
+        mock_repo.return_value.get_by_id.assert_awaited_once_with(1)
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_is_refetched(self):
+        with patch.object(admin_auth, "AdminUserRepository") as mock_repo:
+            mock_repo.return_value.get_by_id = AsyncMock(return_value=_admin_user())
+
+            with patch.object(admin_auth.time, "monotonic", return_value=100.0):
+                await admin_auth.get_current_admin_user(_credentials(), db=MagicMock())
+            with patch.object(admin_auth.time, "monotonic", return_value=100.0 + admin_auth.ADMIN_USER_CACHE_TTL):
+                await admin_auth.get_current_admin_user(_credentials(), db=MagicMock())
+
+        assert mock_repo.return_value.get_by_id.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidation_sees_deactivation(self):
+        with patch.object(admin_auth, "AdminUserRepository") as mock_repo:
+            mock_repo.return_value.get_by_id = AsyncMock(return_value=_admin_user())
+            await admin_auth.get_current_admin_user(_credentials(), db=MagicMock())
+
+            admin_auth.invalidate_admin_user_cache(1)
+            mock_repo.return_value.get_by_id = AsyncMock(return_value=_admin_user(is_active=False))
+
+            with pytest.raises(HTTPException) as exc:
+                await admin_auth.get_current_admin_user(_credentials(), db=MagicMock())
+
+        assert exc.value.status_code == 401
+
+
+# ---------------------------------------------------------------------------
+# last_login update
+# ---------------------------------------------------------------------------
+
+class TestUpdateLastLogin:
+
+    @pytest.mark.asyncio
+    async def test_uses_own_session_and_evicts_cache(self):
+        admin_auth._cache_admin_user(_admin_user())
+        session_cm = MagicMock()
+        session_cm.__aenter__ = AsyncMock(return_value=MagicMock())
+        session_cm.__aexit__ = AsyncMock(return_value=False)
+
+        with patch("app.core.database.AsyncSessionLocal", MagicMock(return_value=session_cm)), \
+             patch.object(admin_auth, "AdminUserRepository") as mock_repo:
+            mock_repo.return_value.update_last_login = AsyncMock(return_value=True)
+            await admin_auth._update_last_login(1)
+
+        mock_repo.return_value.update_last_login.assert_awaited_once_with(1)
+        assert 1 not in admin_auth._admin_user_cache
+
+    @pytest.mark.asyncio
+    async def test_failures_are_swallowed(self):
+        session_cm = MagicMock()
+        session_cm.__aenter__ = AsyncMock(side_effect=RuntimeError("db down"))
+        session_cm.__aexit__ = AsyncMock(return_value=False)
+
+        with patch("app.core.database.AsyncSessionLocal", MagicMock(return_value=session_cm)):
+            await admin_auth._update_last_login(1)
+
+
+# ---------------------------------------------------------------------------
+# Password hashing off the event loop
+# ---------------------------------------------------------------------------
+
+class TestPasswordExecutor:
+
+    @pytest.mark.asyncio
+    async def test_hash_and_verify_round_trip(self):
+        from app.utils import auth
+
+        hashed = await auth.hash_password_async("correct horse")
+
+        assert await auth.verify_password_async("correct horse", hashed) is True
+        assert await auth.verify_password_async("wrong horse", hashed) is False
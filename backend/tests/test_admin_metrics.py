@@ -0,0 +1,311 @@
+"""
+Tests for the admin dashboard metrics endpoints (app/api/v1/admin.py)
+
+backend/tests/test_admin_metrics.py
+"""
+import os
+
+# ---------------------------------------------------------------------------
+# Minimal env setup so settings can be instantiated without a .env file.
+# Must happen before any app imports.
+# ---------------------------------------------------------------------------
+os.environ.setdefault("ENV", "test")
+os.environ.setdefault("SECRET_KEY", "test-secret-key-minimum-32-characters-long")
+os.environ.setdefault("ADMIN_PASSWORD", "testpassword123")
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+os.environ.setdefault("REDIS_URL", "redis://localhost:6379/0")
+os.environ.setdefault("OPENAI_API_KEY", "test-openai-key")
+os.environ.setdefault("RATE_LIMIT_ENABLED", "false")
+os.environ.setdefault("LOG_ENABLED", "false")
+
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.api.v1 import admin
+
+
+def _fake_redis(stored=None):
+    """Redis double backed by a dict."""
+    store = dict(stored or {})
+    redis = MagicMock()
+    redis.get = AsyncMock(side_effect=lambda key: store.get(key))
+
+    async def _setex(key, ttl, value):
+        store[key] = value
+
+    redis.setex = AsyncMock(side_effect=_setex)
+    redis.store = store
+    return redis
+
+
+# ---------------------------------------------------------------------------
+# Redis response cache
+# ---------------------------------------------------------------------------
+
+class TestMetricsCache:
+
+    @pytest.mark.asyncio
+    async def test_get_metrics_served_from_cache(self):
+        cached = {"request_volume": {"requests_1h": 3}}
+        redis = _fake_redis({admin.METRICS_CACHE_KEY: json.dumps(cached)})
+        db = MagicMock()
+        db.execute = AsyncMock()
+
+        with patch.object(admin, "get_redis", AsyncMock(return_value=redis)):
+            result = await admin.get_metrics(db=db)
+
+        assert result == cached
+        db.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_chart_miss_populates_cache(self):
+        redis = _fake_redis()
+        rows = MagicMock()
+        rows.__iter__.return_value = iter([])
+        db = MagicMock()
+        db.execute = AsyncMock(return_value=rows)
+
+        with patch.object(admin, "get_redis", AsyncMock(return_value=redis)):
+            first = await admin.get_chart_data(timeframe="1h", db=db)
+            second = await admin.get_chart_data(timeframe="1h", db=db)
+
+        assert first == second == {"data": [], "timeframe": "1h"}
+        assert db.execute.await_count == 1
+        assert f"{admin.METRICS_CACHE_KEY}:chart:1h" in redis.store
+
+    @pytest.mark.asyncio
+    async def test_redis_unavailable_falls_through(self):
+        rows = MagicMock()
+        rows.__iter__.return_value = iter([])
+        db = MagicMock()
+        db.execute = AsyncMock(return_value=rows)
+
+        with patch.object(admin, "get_redis", AsyncMock(side_effect=RuntimeError("Redis not initialized"))):
+            result = await admin.get_chart_data(timeframe="24h", db=db)
+
+        assert result == {"data": [], "timeframe": "24h"}
+
+
+# ---------------------------------------------------------------------------
+# Langfuse error fetch
+# ---------------------------------------------------------------------------
+
+def _observations_page(observations, total_pages):
+    page = MagicMock()
+    page.data = observations
+    page.meta.total_pages = total_pages
+    return page
+
+
+def _error_observation(obs_id, message="boom"):
+    obs = MagicMock()
+    obs.id = obs_id
+    obs.trace_id = f"trace-{obs_id}"
+    obs.start_time = "2026-01-01T00:00:00Z"
+    obs.status_message = message
+    return obs
+
+
+class TestFetchLangfuseErrors:
+
+    @pytest.fixture(autouse=True)
+    def _reset_cache(self):
+        admin._langfuse_error_snapshot = None
+        admin._langfuse_refresh_task = None
+        yield
+        admin._langfuse_error_snapshot = None
+        admin._langfuse_refresh_task = None
+
+    @pytest.mark.asyncio
+    async def test_pages_through_error_observations_without_trace_lookups(self):
+        client = MagicMock()
+        client.async_api.observations.get_many = AsyncMock(side_effect=[
+            _observations_page([_error_observation("a"), _error_observation("b", None)], 2),
+            _observations_page([_error_observation("c")], 2),
+        ])
+        client.async_api.trace.get = AsyncMock()
+
+        with patch.object(admin, "_get_langfuse", return_value=client):
+            errors = await admin.fetch_langfuse_errors(hours=24)
+
+        assert [e["observation_id"] for e in errors] == ["a", "b", "c"]
+        assert errors[1]["status_message"] == "Unknown error"
+        assert client.async_api.observations.get_many.await_count == 2
+        assert client.async_api.observations.get_many.call_args.kwargs["level"] == admin.ObservationLevel.ERROR
+        client.async_api.trace.get.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_concurrent_trace_scan(self):
+        traces = MagicMock()
+        traces.data = [MagicMock(id=f"t{i}", timestamp=None) for i in range(3)]
+
+        error_obs = _error_observation("x")
+        error_obs.level = admin.ObservationLevel.ERROR
+        ok_obs = _error_observation("y")
+        ok_obs.level = admin.ObservationLevel.DEFAULT
+
+        async def _get_trace(trace_id):
+            if trace_id == "t1":
+                raise RuntimeError("rate limited")
+            return MagicMock(observations=[error_obs, ok_obs], timestamp=None)
+
+        client = MagicMock()
+        client.async_api.observations.get_many = AsyncMock(side_effect=RuntimeError("404"))
+        client.async_api.trace.list = AsyncMock(return_value=traces)
+        client.async_api.trace.get = AsyncMock(side_effect=_get_trace)
+
+        with patch.object(admin, "_get_langfuse", return_value=client):
+            errors = await admin.fetch_langfuse_errors(hours=24)
+
+        assert [e["trace_id"] for e in errors] == ["t0", "t2"]
+        assert client.async_api.trace.get.await_count == 3
+
+
+class TestLangfuseRetry:
+
+    @pytest.mark.asyncio
+    async def test_retries_rate_limit_then_succeeds(self):
+        method = AsyncMock(side_effect=[admin.ApiError(status_code=429), "ok"])
+
+        with patch.object(admin.asyncio, "sleep", AsyncMock()) as sleep:
+            result = await admin._call_langfuse_with_retry(method, limit=100)
+
+        assert result == "ok"
+        assert method.await_count == 2
+        sleep.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_does_not_retry_client_errors(self):
+        method = AsyncMock(side_effect=admin.ApiError(status_code=404))
+
+        with patch.object(admin.asyncio, "sleep", AsyncMock()) as sleep:
+            with pytest.raises(admin.ApiError):
+                await admin._call_langfuse_with_retry(method)
+
+        assert method.await_count == 1
+        sleep.assert_not_called()
+
+
+class TestStaleWhileRevalidate:
+
+    @pytest.fixture(autouse=True)
+    def _reset_cache(self):
+        admin._langfuse_error_snapshot = None
+        admin._langfuse_refresh_task = None
+        yield
+        admin._langfuse_error_snapshot = None
+        admin._langfuse_refresh_task = None
+
+    @pytest.mark.asyncio
+    async def test_stale_cache_served_while_single_refresh_runs(self):
+        from datetime import datetime, timedelta
+
+        stale = [{"status_message": "old"}]
+        admin._langfuse_error_snapshot = admin._LangfuseErrorSnapshot(
+            stale, datetime.utcnow() - timedelta(seconds=admin.LANGFUSE_ERROR_CACHE_TTL + 1)
+        )
+        fresh = [{"status_message": "new"}]
+        refresh = AsyncMock(return_value=fresh)
+
+        with patch.object(admin, "_refresh_langfuse_errors", refresh):
+            first = await admin.fetch_langfuse_errors(hours=24)
+            second = await admin.fetch_langfuse_errors(hours=24)
+            await admin._langfuse_refresh_task
+
+        assert first is stale and second is stale
+        refresh.assert_awaited_once_with(24)
+
+    @pytest.mark.asyncio
+    async def test_cold_cache_blocks_on_fetch(self):
+        fresh = [{"status_message": "new"}]
+
+        with patch.object(admin, "_refresh_langfuse_errors", AsyncMock(return_value=fresh)):
+            result = await admin.fetch_langfuse_errors(hours=24)
+
+        assert result == fresh
+
+    @pytest.mark.asyncio
+    async def test_concurrent_cold_callers_share_one_fetch(self):
+        import asyncio
+
+        fresh = [{"status_message": "new"}]
+        release = asyncio.Event()
+
+        async def _slow_fetch(from_timestamp):
+            await release.wait()
+            return fresh
+
+        fetch = AsyncMock(side_effect=_slow_fetch)
+        with patch.object(admin, "_fetch_error_observations", fetch):
+            callers = [asyncio.create_task(admin.fetch_langfuse_errors(hours=24)) for _ in range(5)]
+            await asyncio.sleep(0)
+            release.set()
+            results = await asyncio.gather(*callers)
+
+        assert all(result == fresh for result in results)
+        fetch.assert_awaited_once()
+        assert admin._langfuse_error_snapshot.data == fresh
+
+    @pytest.mark.asyncio
+    async def test_cold_fetch_failure_returns_empty(self):
+        with patch.object(admin, "_fetch_error_observations", AsyncMock(side_effect=admin.ApiError(status_code=503))):
+            result = await admin.fetch_langfuse_errors(hours=24)
+
+        assert result == []
+        assert admin._langfuse_error_snapshot is None
+
+
+# ---------------------------------------------------------------------------
+# Popular queries
+# ---------------------------------------------------------------------------
+
+class TestPopularQueries:
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_live_aggregation_without_view(self):
+        rows = MagicMock()
+        rows.__iter__.return_value = iter([("best laptop", 4)])
+        session = MagicMock()
+        session.execute = AsyncMock(side_effect=[RuntimeError("relation does not exist"), rows])
+        session.rollback = AsyncMock()
+        session_cm = MagicMock()
+        session_cm.__aenter__ = AsyncMock(return_value=session)
+        session_cm.__aexit__ = AsyncMock(return_value=False)
+
+        with patch.object(admin.database, "AsyncSessionLocal", MagicMock(return_value=session_cm)):
+            result = await admin._fetch_popular_queries(since=None)
+
+        assert result == [{"query": "best laptop", "count": 4}]
+        assert session.execute.call_args_list[0].args[0] is admin.POPULAR_QUERIES_VIEW_SQL
+        assert session.execute.call_args_list[1].args[0] is admin.POPULAR_QUERIES_SQL
+        session.rollback.assert_awaited_once()
+
+
+# ---------------------------------------------------------------------------
+# Error chart
+# ---------------------------------------------------------------------------
+
+class TestErrorChart:
+
+    @pytest.mark.asyncio
+    async def test_buckets_errors_by_hour_in_app_timezone(self):
+        from datetime import datetime, timezone
+
+        errors = [
+            {"timestamp": "2026-03-01T05:10:00Z"},
+            {"timestamp": datetime(2026, 3, 1, 5, 59, tzinfo=timezone.utc)},
+            {"timestamp": "2026-03-01T04:00:30Z"},
+            {"timestamp": None},
+        ]
+
+        with patch.object(admin, "get_redis", AsyncMock(side_effect=RuntimeError("no redis"))), \
+             patch.object(admin, "fetch_langfuse_errors", AsyncMock(return_value=errors)), \
+             patch.object(admin.settings, "TIMEZONE", "Asia/Bangkok"):
+            result = await admin.get_error_chart_data(timeframe="24h", db=MagicMock())
+
+        assert result["data"] == [
+            {"time": "2026-03-01T11:00:00+07:00", "count": 1},
+            {"time": "2026-03-01T12:00:00+07:00", "count": 2},
+        ]
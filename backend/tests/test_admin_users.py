@@ -0,0 +1,201 @@
+"""
+Tests for admin user management endpoints (app/api/v1/admin_users.py)
+
+backend/tests/test_admin_users.py
+"""
+import os
+
+# ---------------------------------------------------------------------------
+# Minimal env setup so settings can be instantiated without a .env file.
+# Must happen before any app imports.
+# ---------------------------------------------------------------------------
+os.environ.setdefault("ENV", "test")
+os.environ.setdefault("SECRET_KEY", "test-secret-key-minimum-32-characters-long")
+os.environ.setdefault("ADMIN_PASSWORD", "testpassword123")
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+os.environ.setdefault("REDIS_URL", "redis://localhost:6379/0")
+os.environ.setdefault("OPENAI_API_KEY", "test-openai-key")
+os.environ.setdefault("RATE_LIMIT_ENABLED", "false")
+os.environ.setdefault("LOG_ENABLED", "false")
+
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.v1 import admin_users
+from app.api.v1.admin_auth import get_current_admin_user
+from app.core.database import get_db
+
+
+def _user_row(user_id: int = 2, **overrides) -> dict:
+    row = {
+        "id": user_id,
+        "username": "editor",
+        "email": "editor@test.com",
+        "password_hash": "$2b$12$secret",
+        "is_active": True,
+        "created_at": datetime(2026, 1, 1, 12, 0),
+        "updated_at": datetime(2026, 1, 2, 12, 0),
+        "last_login": None,
+    }
+    row.update(overrides)
+    return row
+
+
+@pytest.fixture
+def repo():
+    return MagicMock()
+
+
+@pytest.fixture
+def client(repo):
+    app = FastAPI()
+    app.include_router(admin_users.router, prefix="/admin/users")
+    app.dependency_overrides[get_current_admin_user] = lambda: {"id": 1, "username": "admin"}
+
+    db = MagicMock()
+    db.rollback = AsyncMock()
+    app.dependency_overrides[get_db] = lambda: db
+
+    with patch.object(admin_users, "AdminUserRepository", return_value=repo):
+        yield TestClient(app)
+
+
+class TestAdminUserResponses:
+
+    def test_list_serializes_rows(self, client, repo):
+        row = _user_row()
+        del row["password_hash"]
+        repo.get_all = AsyncMock(return_value=[row])
+
+        response = client.get("/admin/users")
+
+        assert response.status_code == 200
+        assert response.json() == [{
+            "id": 2,
+            "username": "editor",
+            "email": "editor@test.com",
+            "is_active": True,
+            "created_at": "2026-01-01T12:00:00",
+            "updated_at": "2026-01-02T12:00:00",
+            "last_login": None,
+        }]
+
+    def test_update_never_returns_password_hash(self, client, repo):
+        repo.get_by_id = AsyncMock(return_value=_user_row())
+        repo.update = AsyncMock(return_value=None)
+
+        with patch.object(admin_users, "invalidate_admin_user_cache"):
+            response = client.put("/admin/users/2", json={"is_active": False})
+
+        assert response.status_code == 200
+        assert "password_hash" not in response.json()
+        assert response.json()["username"] == "editor"
+
+    def test_update_returns_row_without_refetch(self, client, repo):
+        updated = _user_row(is_active=False)
+        del updated["password_hash"]
+        repo.get_by_id = AsyncMock(return_value=_user_row())
+        repo.update = AsyncMock(return_value=updated)
+
+        with patch.object(admin_users, "invalidate_admin_user_cache") as invalidate:
+            response = client.put("/admin/users/2", json={"is_active": False})
+
+        assert response.status_code == 200
+        assert response.json()["is_active"] is False
+        repo.get_by_id.assert_awaited_once_with(2)
+        invalidate.assert_called_once_with(2)
+
+    def test_openapi_keeps_response_schema(self, client):
+        schema = client.get("/openapi.json").json()
+        list_schema = schema["paths"]["/admin/users"]["get"]["responses"]["200"]["content"]["application/json"]["schema"]
+
+        assert list_schema["items"]["$ref"].endswith("/AdminUserResponse")
+
+
+class TestCreateAdminUser:
+
+    @pytest.fixture(autouse=True)
+    def _fast_hash(self):
+        with patch.object(admin_users, "hash_password_async", AsyncMock(return_value="hashed")):
+            yield
+
+    def test_happy_path_is_single_insert(self, client, repo):
+        row = _user_row(user_id=3)
+        del row["password_hash"]
+        repo.create_if_not_exists = AsyncMock(return_value=row)
+        repo.get_conflicting_field = AsyncMock()
+
+        response = client.post(
+            "/admin/users",
+            json={"username": "editor", "email": "editor@test.com", "password": "longpassword"},
+        )
+
+        assert response.status_code == 201
+        assert response.json()["id"] == 3
+        repo.create_if_not_exists.assert_awaited_once_with(
+            username="editor", email="editor@test.com", password_hash="hashed", is_active=True
+        )
+        repo.get_conflicting_field.assert_not_called()
+
+    @pytest.mark.parametrize("conflict,detail", [
+        ("username", "Username already exists"),
+        ("email", "Email already exists"),
+        (None, "Username or email already exists"),
+    ])
+    def test_conflict_reports_taken_field(self, client, repo, conflict, detail):
+        repo.create_if_not_exists = AsyncMock(return_value=None)
+        repo.get_conflicting_field = AsyncMock(return_value=conflict)
+
+        response = client.post(
+            "/admin/users",
+            json={"username": "editor", "email": "editor@test.com", "password": "longpassword"},
+        )
+
+        assert response.status_code == 400
+        assert response.json()["detail"] == detail
+
+    @pytest.mark.parametrize("email", ["not-an-email", "a@b", "a b@test.com"])
+    def test_rejects_malformed_email(self, client, repo, email):
+        repo.create_if_not_exists = AsyncMock()
+
+        response = client.post(
+            "/admin/users",
+            json={"username": "editor", "email": email, "password": "longpassword"},
+        )
+
+        assert response.status_code == 422
+        repo.create_if_not_exists.assert_not_called()
+
+
+class TestDeleteAdminUser:
+
+    def test_delete_is_single_statement(self, client, repo):
+        repo.get_by_id = AsyncMock()
+        repo.delete = AsyncMock(return_value="editor")
+
+        with patch.object(admin_users, "invalidate_admin_user_cache") as invalidate:
+            response = client.delete("/admin/users/2")
+
+        assert response.status_code == 200
+        assert response.json() == {"message": "Admin user editor deleted successfully"}
+        repo.get_by_id.assert_not_called()
+        invalidate.assert_called_once_with(2)
+
+    def test_missing_user_is_404(self, client, repo):
+        repo.delete = AsyncMock(return_value=None)
+
+        response = client.delete("/admin/users/99")
+
+        assert response.status_code == 404
+
+    def test_self_delete_rejected_without_query(self, client, repo):
+        repo.delete = AsyncMock()
+
+        response = client.delete("/admin/users/1")
+
+        assert response.status_code == 400
+        repo.delete.assert_not_called()
@@ -0,0 +1,96 @@
+"""
+Tests for the affiliate click endpoint (app/api/v1/affiliate.py)
+
+backend/tests/test_affiliate_api.py
+"""
+import os
+
+# ---------------------------------------------------------------------------
+# Minimal env setup so settings can be instantiated without a .env file.
+# Must happen before any app imports.
+# ---------------------------------------------------------------------------
+os.environ.setdefault("ENV", "test")
+os.environ.setdefault("SECRET_KEY", "test-secret-key-minimum-32-characters-long")
+os.environ.setdefault("ADMIN_PASSWORD", "testpassword123")
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+os.environ.setdefault("REDIS_URL", "redis://localhost:6379/0")
+os.environ.setdefault("OPENAI_API_KEY", "test-openai-key")
+os.environ.setdefault("RATE_LIMIT_ENABLED", "false")
+os.environ.setdefault("LOG_ENABLED", "false")
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.v1 import affiliate
+from app.core.database import get_db
+from app.core.dependencies import check_rate_limit
+
+
+@pytest.fixture
+def enqueued():
+    clicks = []
+
+    def _enqueue(click):
+        clicks.append(click)
+        return True
+
+    with patch.object(affiliate, "enqueue_click", side_effect=_enqueue):
+        yield clicks
+
+
+@pytest.fixture
+def client(enqueued):
+    app = FastAPI()
+    app.include_router(affiliate.router, prefix="/affiliate")
+    app.dependency_overrides[check_rate_limit] = lambda: None
+    app.dependency_overrides[get_db] = lambda: MagicMock()
+    return TestClient(app)
+
+
+class TestTrackClick:
+
+    def test_valid_click_is_buffered(self, client, enqueued):
+        response = client.post(
+            "/affiliate/click",
+            json={"provider": "amazon", "url": "https://amzn.to/x", "product_name": "Echo", "extra": 1},
+        )
+
+        assert response.status_code == 200
+        assert response.json() == {"tracked": True}
+        assert enqueued == [{
+            "provider": "amazon",
+            "product_name": "Echo",
+            "category": None,
+            "url": "https://amzn.to/x",
+            "session_id": None,
+        }]
+
+    @pytest.mark.parametrize("body,loc,error_type", [
+        ({"url": "https://x"}, ["body", "provider"], "missing"),
+        ({"provider": "a" * 101, "url": "https://x"}, ["body", "provider"], "string_too_long"),
+        ({"provider": "amazon", "url": 42}, ["body", "url"], "string_type"),
+    ])
+    def test_invalid_fields_return_422(self, client, enqueued, body, loc, error_type):
+        response = client.post("/affiliate/click", json=body)
+
+        assert response.status_code == 422
+        assert response.json()["detail"][0]["loc"] == loc
+        assert response.json()["detail"][0]["type"] == error_type
+        assert enqueued == []
+
+    @pytest.mark.parametrize("content", [b"not json", b"[1, 2]"])
+    def test_malformed_body_returns_422(self, client, enqueued, content):
+        response = client.post("/affiliate/click", content=content, headers={"Content-Type": "application/json"})
+
+        assert response.status_code == 422
+        assert enqueued == []
+
+    def test_openapi_documents_click_request(self, client):
+        schema = client.get("/openapi.json").json()
+        body_schema = schema["paths"]["/affiliate/click"]["post"]["requestBody"]["content"]["application/json"]["schema"]
+
+        assert set(body_schema["required"]) == {"provider", "url"}
+        assert body_schema["properties"]["url"]["maxLength"] == 2048
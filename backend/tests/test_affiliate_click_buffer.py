@@ -0,0 +1,90 @@
+"""
+Tests for batched affiliate click writes (app/services/affiliate_click_buffer.py)
+
+backend/tests/test_affiliate_click_buffer.py
+"""
+import os
+
+# ---------------------------------------------------------------------------
+# Minimal env setup so settings can be instantiated without a .env file.
+# Must happen before any app imports.
+# ---------------------------------------------------------------------------
+os.environ.setdefault("ENV", "test")
+os.environ.setdefault("SECRET_KEY", "test-secret-key-minimum-32-characters-long")
+os.environ.setdefault("ADMIN_PASSWORD", "testpassword123")
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+os.environ.setdefault("REDIS_URL", "redis://localhost:6379/0")
+os.environ.setdefault("OPENAI_API_KEY", "test-openai-key")
+os.environ.setdefault("RATE_LIMIT_ENABLED", "false")
+os.environ.setdefault("LOG_ENABLED", "false")
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.services import affiliate_click_buffer as buffer
+
+
+def _click(n: int) -> dict:
+    return {"session_id": None, "provider": "amazon", "product_name": f"p{n}", "category": None, "url": f"https://x/{n}"}
+
+
+@pytest.fixture
+def sessions():
+    """Patch AsyncSessionLocal and collect the batch passed to each execute()."""
+    batches = []
+
+    def _make_session():
+        session = MagicMock()
+        session.execute = AsyncMock(side_effect=lambda stmt, rows: batches.append(list(rows)))
+        session.commit = AsyncMock()
+        session_cm = MagicMock()
+        session_cm.__aenter__ = AsyncMock(return_value=session)
+        session_cm.__aexit__ = AsyncMock(return_value=False)
+        return session_cm
+
+    with patch.object(buffer.database, "AsyncSessionLocal", MagicMock(side_effect=_make_session)):
+        yield batches
+
+
+class TestClickBuffer:
+
+    def test_enqueue_without_flusher_reports_not_buffered(self):
+        assert buffer.enqueue_click(_click(1)) is False
+
+    @pytest.mark.asyncio
+    async def test_clicks_are_written_in_batches(self, sessions):
+        with patch.object(buffer.settings, "AFFILIATE_CLICK_BATCH_SIZE", 3), \
+             patch.object(buffer.settings, "AFFILIATE_CLICK_FLUSH_INTERVAL", 60):
+            buffer.start_click_flusher()
+            for n in range(7):
+                assert buffer.enqueue_click(_click(n)) is True
+            await buffer.stop_click_flusher()
+
+        assert [len(batch) for batch in sessions] == [3, 3, 1]
+        assert [row["product_name"] for batch in sessions for row in batch] == [f"p{n}" for n in range(7)]
+        assert all("clicked_at" in row for batch in sessions for row in batch)
+        assert buffer.enqueue_click(_click(8)) is False
+
+    @pytest.mark.asyncio
+    async def test_partial_batch_flushed_after_interval(self, sessions):
+        import asyncio
+
+        with patch.object(buffer.settings, "AFFILIATE_CLICK_FLUSH_INTERVAL", 0.01):
+            buffer.start_click_flusher()
+            buffer.enqueue_click(_click(1))
+            await asyncio.sleep(0.05)
+            assert len(sessions) == 1
+            await buffer.stop_click_flusher()
+
+        assert len(sessions) == 1
+
+    @pytest.mark.asyncio
+    async def test_full_queue_drops_click(self, sessions):
+        with patch.object(buffer.settings, "AFFILIATE_CLICK_QUEUE_SIZE", 1):
+            buffer.start_click_flusher()
+            buffer.enqueue_click(_click(1))
+            assert buffer.enqueue_click(_click(2)) is True
+            await buffer.stop_click_flusher()
+
+        assert [row["product_name"] for batch in sessions for row in batch] == ["p1"]
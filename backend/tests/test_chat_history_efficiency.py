@@ -11,8 +11,7 @@ class TestNewSessionFastPath:
     async def test_new_session_skips_db_when_redis_has_no_marker(self):
         """When has_history key is absent in Redis, return [] without DB call."""
         mock_redis = AsyncMock()
-        mock_redis.exists.return_value = 0  # Key does not exist
-        mock_redis.get.return_value = None  # No cache hit
+        mock_redis.mget.return_value = [None, None]  # No cache hit, no marker
 
         with patch('app.services.chat_history_manager.redis_client', mock_redis):
             with patch('app.core.database.get_db') as mock_get_db:
@@ -21,13 +20,16 @@ class TestNewSessionFastPath:
         assert result == []
         # DB should NOT have been queried — get_db should not have been called
         mock_get_db.assert_not_called()
+        # Cache and marker are read in a single round-trip
+        mock_redis.mget.assert_awaited_once_with(
+            "chat_history:new-session-123", "session:new-session-123:has_history"
+        )
 
     @pytest.mark.asyncio
     async def test_existing_session_hits_db_when_marker_present(self):
         """When has_history key is present, fast-path is bypassed and DB is queried."""
         mock_redis = AsyncMock()
-        mock_redis.exists.return_value = 1  # Marker present — fast-path must NOT fire
-        mock_redis.get.return_value = None  # No Redis cache hit
+        mock_redis.mget.return_value = [None, "1"]  # No cache hit, marker present — fast-path must NOT fire
 
         mock_history = [{"role": "user", "content": "hello"}, {"role": "assistant", "content": "hi"}]
         mock_repo = AsyncMock()
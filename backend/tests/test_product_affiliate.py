@@ -108,3 +108,39 @@ async def test_planner_fast_path_includes_review_and_affiliate():
     assert "product_affiliate" in all_tools, (
         f"product_affiliate not found in plan. Tools: {all_tools}"
     )
+
+
+@pytest.mark.parametrize("complexity", ["factoid", "comparison", "recommendation", "deep_research"])
+def test_product_templates_end_with_next_step_suggestion(complexity):
+    """
+    Every product complexity template ends with next_step_suggestion and
+    keeps step ids sequential.
+    """
+    from app.agents.planner_agent import PlannerAgent
+
+    planner = PlannerAgent()
+    steps = planner._get_product_plan_for_complexity(complexity)["steps"]
+
+    assert steps[-1]["tools"] == ["next_step_suggestion"]
+    assert [s["id"] for s in steps] == [f"step_{i}" for i in range(1, len(steps) + 1)]
+
+
+@pytest.mark.asyncio
+async def test_planner_llm_can_pick_product_template():
+    """
+    On the low-confidence path the planner LLM may return a complexity class
+    instead of tools; the matching static template is used.
+    """
+    from app.agents.planner_agent import PlannerAgent
+
+    planner = PlannerAgent()
+    planner.generate = AsyncMock(return_value='{"class": "comparison"}')
+    context = await planner._build_planning_context(
+        "tell me about laptops", "product", {}, [], []
+    )
+
+    plan = await planner._generate_plan(context, allow_template=True)
+
+    assert plan == planner._get_product_plan_for_complexity("comparison")
+    prompt = planner.generate.call_args.kwargs["messages"][1]["content"]
+    assert '{"class": "comparison"}' in prompt
@@ -58,11 +58,9 @@ def _make_mock_db_with_row(
     rows_with_provider_errors=0,
 ):
     """
-    Build a mock DB session whose execute() handles two sequential calls:
-      1. The main latency/reliability aggregate query.
-      2. The provider-error count query (rows_with_provider_errors).
+    Build a mock DB session whose execute() returns the single QoS aggregate row
+    (latency, reliability and rows_with_provider_errors).
     """
-    # Row returned by the main aggregate query
     row = MagicMock()
     row.total_requests = total_requests
     row.p50_ms = p50_ms
@@ -70,20 +68,14 @@ def _make_mock_db_with_row(
     row.p99_ms = p99_ms
     row.completion_rate = completion_rate
     row.degraded_rate = degraded_rate
+    row.rows_with_provider_errors = rows_with_provider_errors
 
-    main_result = MagicMock()
-    main_result.fetchone = MagicMock(return_value=row)
-
-    # Row returned by the provider-error count query
-    pe_row = MagicMock()
-    pe_row.rows_with_provider_errors = rows_with_provider_errors
-
-    pe_result = MagicMock()
-    pe_result.fetchone = MagicMock(return_value=pe_row)
+    result = MagicMock()
+    result.fetchone = MagicMock(return_value=row)
 
     db_session = MagicMock()
-    # Return main_result on first call, pe_result on second call
-    db_session.execute = AsyncMock(side_effect=[main_result, pe_result])
+    # One query per request; a second execute() would exhaust the side_effect list
+    db_session.execute = AsyncMock(side_effect=[result])
     return db_session
 
 
@@ -236,9 +228,8 @@ def test_qos_summary_hours_parameter_defaults_to_24():
     GET /v1/admin/qos/summary with no hours param must use window_hours=24.
     GET /v1/admin/qos/summary?hours=48 must reflect window_hours=48.
 
-    Each request exercises both internal DB queries (main aggregate + provider
-    error count), so a fresh mock_db is created per request to avoid exhausting
-    the side_effect list across multiple HTTP calls.
+    Each request runs the aggregate query once, so a fresh mock_db is created
+    per request to avoid exhausting the side_effect list across multiple HTTP calls.
     """
     # Default window — fresh mock per request
     mock_db_default = _make_mock_db_with_row()
@@ -393,3 +384,37 @@ def test_qos_summary_includes_provider_error_rate():
     assert response3.status_code == 200
     body3 = response3.json()
     assert body3["provider_errors"]["rate"] == 0.0
+
+
+# ---------------------------------------------------------------------------
+# 9. QoS summary is served from the Redis cache when present
+# ---------------------------------------------------------------------------
+
+def test_qos_summary_served_from_cache():
+    """
+    A cached summary for the same window is returned without querying the DB;
+    a miss runs the query once and stores the result under qos:summary:<hours>.
+    """
+    mock_redis = MagicMock()
+    mock_redis.get = AsyncMock(return_value=None)
+    mock_redis.setex = AsyncMock(return_value=True)
+
+    mock_db = _make_mock_db_with_row(total_requests=7)
+    client = TestClient(_make_test_app(mock_db), raise_server_exceptions=False)
+
+    with patch("app.api.v1.qos.get_redis", AsyncMock(return_value=mock_redis)):
+        miss = client.get("/v1/admin/qos/summary?hours=6")
+        assert miss.status_code == 200
+        assert miss.json()["total_requests"] == 7
+
+        cache_key, ttl, cached_json = mock_redis.setex.call_args.args
+        assert cache_key == "qos:summary:6"
+        assert ttl == settings.ADMIN_METRICS_CACHE_TTL
+
+        # Hit: mock_db's single side_effect is already used, so any DB call would fail
+        mock_redis.get = AsyncMock(return_value=cached_json)
+        hit = client.get("/v1/admin/qos/summary?hours=6")
+
+    assert hit.status_code == 200
+    assert hit.json() == miss.json()
+    assert mock_db.execute.await_count == 1
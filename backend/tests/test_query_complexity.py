@@ -74,3 +74,17 @@ class TestConfidenceThreshold:
         complexity, confidence = classify_query_complexity("tell me about laptops", {}, "product")
         assert complexity in ("recommendation", "deep_research")
         assert confidence < 0.7  # Must fall through to LLM planner
+
+
+class TestKeywordMatchers:
+    """Keyword/brand lookups keep word-boundary semantics."""
+
+    @pytest.mark.parametrize("text,expected", [
+        ("sony vs sony vs bose", 2),
+        ("sony's new headphones", 1),
+        ("samsungs and sonyx", 0),
+        ("lg, hp and dell laptops", 3),
+    ])
+    def test_count_brand_mentions(self, text, expected):
+        from app.agents.query_complexity import _count_brand_mentions, _word_set
+        assert _count_brand_mentions(_word_set(text)) == expected
@@ -0,0 +1,72 @@
+"""
+Tests for the dev-only query counter middleware
+
+backend/tests/test_query_counter.py
+"""
+import os
+
+os.environ.setdefault("ENV", "test")
+os.environ.setdefault("SECRET_KEY", "test-secret-key-minimum-32-characters-long")
+os.environ.setdefault("ADMIN_PASSWORD", "testpassword123")
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+os.environ.setdefault("REDIS_URL", "redis://localhost:6379/0")
+os.environ.setdefault("OPENAI_API_KEY", "test-openai-key")
+os.environ.setdefault("LOG_ENABLED", "false")
+
+from unittest.mock import patch
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+
+from app.middleware import query_counter_middleware
+from app.middleware.query_counter_middleware import (
+    QueryCounterMiddleware,
+    count_queries,
+    install_query_listener,
+)
+
+
+def _engine():
+    install_query_listener()
+    return create_engine("sqlite://")
+
+
+def test_count_queries_records_statements_in_block_only():
+    engine = _engine()
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+        with count_queries() as queries:
+            conn.execute(text("SELECT 2"))
+            conn.execute(text("SELECT 3"))
+        conn.execute(text("SELECT 4"))
+
+    assert queries == ["SELECT 2", "SELECT 3"]
+
+
+def test_middleware_warns_above_threshold():
+    engine = _engine()
+    app = FastAPI()
+    app.add_middleware(QueryCounterMiddleware, threshold=2)
+
+    @app.get("/chatty")
+    def chatty():
+        with engine.connect() as conn:
+            for i in range(3):
+                conn.execute(text(f"SELECT {i}"))
+        return {"ok": True}
+
+    @app.get("/quiet")
+    def quiet():
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+        return {"ok": True}
+
+    with patch.object(query_counter_middleware, "logger") as mock_logger:
+        client = TestClient(app)
+        assert client.get("/quiet").status_code == 200
+        mock_logger.warning.assert_not_called()
+
+        assert client.get("/chatty").status_code == 200
+        mock_logger.warning.assert_called_once()
+        assert "/chatty" in mock_logger.warning.call_args.args[0]
@@ -68,17 +68,20 @@ class TestSseEventHelper:
         assert parsed["data"] is not None, "data line must parse to a JSON object"
         assert parsed["data"]["session_id"] == "abc"
 
-    def test_event_helper_custom_encoder(self):
-        """_sse_event() should use the provided encoder_cls for serialization."""
-        from datetime import datetime, timezone
-        from app.api.v1.chat import DateTimeEncoder
+    def test_event_helper_serializes_datetimes(self):
+        """_sse_event() should serialize datetime/date values as ISO strings."""
+        from datetime import date, datetime, timezone
 
         dt = datetime(2024, 6, 15, 12, 0, 0, tzinfo=timezone.utc)
-        result = _sse_event("done", {"ts": dt}, encoder_cls=DateTimeEncoder)
+        result = _sse_event("done", {"ts": dt, "day": date(2024, 6, 15)})
         parsed = _parse_sse(result)
-        # datetime should be serialized to ISO string
-        assert isinstance(parsed["data"]["ts"], str)
-        assert "2024-06-15" in parsed["data"]["ts"]
+        assert parsed["data"]["ts"] == dt.isoformat()
+        assert parsed["data"]["day"] == "2024-06-15"
+
+    def test_event_helper_stringifies_non_str_keys(self):
+        """Non-string dict keys are stringified, as json.dumps did."""
+        result = _sse_event("done", {"counts": {1: "a"}})
+        assert _parse_sse(result)["data"]["counts"] == {"1": "a"}
 
 
 # ---------------------------------------------------------------------------
@@ -275,3 +278,76 @@ class TestAllChannelNames:
             assert key in parsed["data"], (
                 f"Payload key '{key}' missing from data for event_type={event_type}"
             )
+
+
+# ---------------------------------------------------------------------------
+# generate_chat_stream() lifecycle against a fake graph
+# ---------------------------------------------------------------------------
+
+async def _collect_stream(astream_events, max_total_request_s: float = 60.0) -> list[dict]:
+    """Run generate_chat_stream() with a patched graph and return the parsed SSE frames."""
+    from unittest.mock import AsyncMock, MagicMock, patch
+    from app.api.v1 import chat
+
+    fake_graph = MagicMock()
+    fake_graph.astream_events = astream_events
+    with patch.object(chat, "graph", fake_graph), \
+         patch.object(chat, "_load_session_context", AsyncMock(return_value=(None, []))), \
+         patch.object(chat, "_write_request_metric", AsyncMock()), \
+         patch.object(chat.chat_history_manager, "save_turn", AsyncMock()), \
+         patch.object(chat, "_new_langfuse_handler", return_value=None), \
+         patch.object(chat, "MAX_TOTAL_REQUEST_S", max_total_request_s):
+        return [_parse_sse(frame) async for frame in chat.generate_chat_stream("hi", "sess-1", 1)]
+
+
+class TestChatStreamLifecycle:
+    """End-to-end checks of generate_chat_stream() with graph.astream_events mocked out."""
+
+    @pytest.mark.asyncio
+    async def test_hard_cap_fires_while_graph_is_stalled(self):
+        """A graph that stops emitting events must still be cut off at the hard cap."""
+        import asyncio
+        import time
+
+        async def stalled_events(*args, **kwargs):
+            yield {"event": "on_chain_start", "name": "safety", "data": {}}
+            await asyncio.sleep(30)
+
+        started = time.monotonic()
+        frames = await _collect_stream(stalled_events, max_total_request_s=0.3)
+        elapsed = time.monotonic() - started
+
+        assert elapsed < 5
+        assert frames[-1]["event"] == "error"
+        assert frames[-1]["data"]["code"] == "request_timeout"
+
+    @pytest.mark.asyncio
+    async def test_fallback_concatenates_reducer_fields(self):
+        """Without the terminal LangGraph event, operator.add fields from every node are kept."""
+
+        def node_end(name: str, output: dict) -> dict:
+            return {
+                "event": "on_chain_end",
+                "name": name,
+                "data": {"output": output},
+                "metadata": {"langgraph_node": name},
+            }
+
+        async def events_without_graph_end(*args, **kwargs):
+            yield node_end("safety", {
+                "stage_telemetry": [{"stage": "safety"}],
+                "citations": ["https://a.example"],
+            })
+            yield node_end("product_compose", {
+                "stage_telemetry": [{"stage": "product_compose"}],
+                "citations": ["https://b.example"],
+                "status": "completed",
+            })
+
+        frames = await _collect_stream(events_without_graph_end)
+
+        done = frames[-1]
+        assert done["event"] == "done"
+        assert done["data"]["status"] == "completed"
+        assert [s["stage"] for s in done["data"]["stage_telemetry"]] == ["safety", "product_compose"]
+        assert done["data"]["citations"] == ["https://a.example", "https://b.example"]
@@ -217,3 +217,27 @@ def test_render_milestones_rejects_malformed_interaction_id():
     assert response.status_code == 422, (
         f"Expected 422 for malformed interaction_id, got {response.status_code}"
     )
+
+
+# ---------------------------------------------------------------------------
+# 6. test_render_milestones_interaction_id_format
+# ---------------------------------------------------------------------------
+
+@pytest.mark.parametrize("interaction_id,expected", [
+    ("550E8400-E29B-41D4-A716-446655440000", "550e8400-e29b-41d4-a716-446655440000"),
+    ("550e8400e29b41d4a716446655440000", None),
+    ("{550e8400-e29b-41d4-a716-446655440000}", None),
+    ("550e8400e-29b-41d4-a716-446655440000", None),
+])
+def test_render_milestones_interaction_id_format(interaction_id, expected):
+    """interaction_id must be a hyphenated UUID; it is normalized to lowercase."""
+    from pydantic import ValidationError
+
+    from app.api.v1.telemetry import RenderMilestones
+
+    if expected is None:
+        with pytest.raises(ValidationError):
+            RenderMilestones(interaction_id=interaction_id, request_sent_ts=1)
+    else:
+        milestones = RenderMilestones(interaction_id=interaction_id, request_sent_ts=1)
+        assert milestones.interaction_id == expected